@@ -3,12 +3,16 @@ from __future__ import annotations
 import abc
 import atexit
 import collections.abc
+import concurrent.futures
 import contextlib
 import functools
 import importlib.metadata
 import keyword
+import queue
 import re
 import sys
+import tempfile
+import threading
 import urllib.parse
 import weakref
 from collections import Counter
@@ -32,6 +36,9 @@ if TYPE_CHECKING:
     import sqlglot as sg
     import torch
 
+    import ibis.expr.datatypes as dt
+    from ibis.backends.explain import QueryPlan
+
 
 __all__ = ("BaseBackend", "connect")
 
@@ -905,6 +912,90 @@ class CacheHandler:
     def __init__(self):
         self._cache_name_to_entry = {}
         self._cache_op_to_entry = {}
+        self._cache_budget = None
+        self._cache_spill_dir = None
+        self._cache_spill_tmpdir = None
+        # sizes in bytes of the cached tables that are materialized in the
+        # backend, ordered from least to most recently used
+        self._cache_sizes = collections.OrderedDict()
+        # cached tables that were evicted, mapped to the parquet file they were
+        # spilled to or `None` if they have to be recomputed
+        self._cache_evicted = {}
+        # the number of callers using each cached table, which can't be evicted
+        # until they are done
+        self._cache_pins = collections.Counter()
+        # cached tables that are being reloaded or evicted, mapped to an event
+        # that is set once they are done
+        self._cache_pending = {}
+        # guards the state above; it's only held for bookkeeping and never
+        # while running queries, which may need the lock themselves
+        self._cache_lock = threading.Lock()
+        # whether the current thread is querying cached tables to maintain
+        # the cache, in which case the cache state isn't touched
+        self._cache_local = threading.local()
+
+    def set_cache_budget(
+        self, bytes: int | None = None, *, spill: bool | str | Path = False
+    ) -> None:
+        """Limit the amount of memory used by cached tables.
+
+        Once the estimated size of the tables created by
+        [`Table.cache()`](./expression-tables.qmd#ibis.expr.types.relations.Table.cache)
+        exceeds the budget, the least recently used cached tables are evicted
+        from the backend. An evicted table is transparently brought back the
+        next time it is used, either by reloading it from disk if it was
+        spilled or by recomputing it.
+
+        Parameters
+        ----------
+        bytes
+            The maximum number of bytes used by cached tables. `None` removes
+            the budget.
+        spill
+            Whether to spill evicted tables to Parquet files instead of
+            dropping them. If a path is given, the files are written to that
+            directory, otherwise a temporary directory is used.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> con.set_cache_budget(bytes=512 * 1024**2, spill=True)
+        """
+        if bytes is not None and bytes < 0:
+            raise ValueError(f"Cache budget must be non-negative, got {bytes}")
+
+        with self._cache_lock:
+            if spill is True:
+                # tables spilled to a previous temporary directory may still be
+                # reloaded, so it's kept around for the lifetime of the backend
+                if self._cache_spill_tmpdir is None:
+                    self._cache_spill_tmpdir = tempfile.TemporaryDirectory(
+                        prefix="ibis-cache-"
+                    )
+                self._cache_spill_dir = Path(self._cache_spill_tmpdir.name)
+            elif spill:
+                self._cache_spill_dir = Path(spill)
+                self._cache_spill_dir.mkdir(parents=True, exist_ok=True)
+            else:
+                self._cache_spill_dir = None
+
+            self._cache_budget = bytes
+            if bytes is None:
+                self._cache_sizes.clear()
+                return
+
+            untracked = [
+                name
+                for name in self._cache_name_to_entry
+                if name not in self._cache_evicted
+                and name not in self._cache_pending
+                and name not in self._cache_sizes
+            ]
+
+        for name in untracked:
+            self._track_cached_table(name)
+        self._evict_cached_tables()
 
     def _cached_table(self, table: ir.Table) -> ir.CachedTable:
         """Convert a Table to a CachedTable.
@@ -919,20 +1010,197 @@ class CacheHandler:
         Table
             Cached table
         """
-        entry = self._cache_op_to_entry.get(table.op())
-        if entry is None or (cached_op := entry.cached_op_ref()) is None:
+        op = table.op()
+        with self._cache_lock:
+            entry = self._cache_op_to_entry.get(op)
+            cached_op = None if entry is None else entry.cached_op_ref()
+
+        if cached_op is None:
             cached_op = self._create_cached_table(util.gen_name("cached"), table).op()
-            entry = CacheEntry(
-                table.op(),
-                weakref.ref(cached_op),
-                weakref.finalize(
-                    cached_op, self._finalize_cached_table, cached_op.name
-                ),
-            )
-            self._cache_op_to_entry[table.op()] = entry
-            self._cache_name_to_entry[cached_op.name] = entry
+            with self._cache_lock:
+                entry = self._cache_op_to_entry.get(op)
+                if entry is None or (existing := entry.cached_op_ref()) is None:
+                    entry = CacheEntry(
+                        op,
+                        weakref.ref(cached_op),
+                        weakref.finalize(
+                            cached_op, self._finalize_cached_table, cached_op.name
+                        ),
+                    )
+                    self._cache_op_to_entry[op] = entry
+                    self._cache_name_to_entry[cached_op.name] = entry
+                    existing = None
+            if existing is not None:
+                # another thread cached the same table in the meantime
+                self._drop_cached_table(cached_op.name)
+                cached_op = existing
+
+        self._load_cached_tables([cached_op.name])
         return ir.CachedTable(cached_op)
 
+    def _load_cached_tables(self, names: Iterable[str]) -> None:
+        """Make sure the cached tables `names` are materialized in the backend.
+
+        Evicted tables are reloaded or recomputed, and the tables are marked
+        as most recently used. Other cached tables are evicted if the cache
+        budget is exceeded as a result.
+        """
+        if self._cache_budget is None and not self._cache_evicted:
+            return
+        # queries run to maintain the cache don't touch the cache state
+        if getattr(self._cache_local, "querying", False):
+            return
+
+        with self._cache_lock:
+            names = frozenset(
+                name for name in names if name in self._cache_name_to_entry
+            )
+            # recomputing a table may load and evict other cached tables, none
+            # of which can be evicted before the caller is done with them
+            self._cache_pins.update(names)
+
+        try:
+            for name in names:
+                self._load_cached_table(name)
+            self._evict_cached_tables()
+        finally:
+            with self._cache_lock:
+                self._cache_pins.subtract(names)
+                # drop the names that are no longer pinned
+                self._cache_pins += collections.Counter()
+
+    def _load_cached_table(self, name: str) -> None:
+        """Materialize the cached table `name` and mark it as most recently used."""
+        while True:
+            with self._cache_lock:
+                if (entry := self._cache_name_to_entry.get(name)) is None:
+                    # the table was released in the meantime
+                    return
+                if (pending := self._cache_pending.get(name)) is None:
+                    if name in self._cache_sizes:
+                        self._cache_sizes.move_to_end(name)
+                        return
+                    if evicted := name in self._cache_evicted:
+                        path = self._cache_evicted.pop(name)
+                        self._cache_pending[name] = threading.Event()
+                    break
+            # wait for another thread to finish reloading or evicting it
+            pending.wait()
+
+        if evicted and not self._reload_cached_table(name, entry, path):
+            return
+        if self._cache_budget is not None:
+            self._track_cached_table(name)
+
+    def _reload_cached_table(
+        self, name: str, entry: CacheEntry, path: Path | None
+    ) -> bool:
+        """Recreate the evicted cached table `name`, from `path` if it was spilled.
+
+        Returns whether the table is still in use.
+        """
+        try:
+            if path is None:
+                expr = entry.orig_op.to_expr()
+            else:
+                import pyarrow.parquet as pq
+
+                expr = ibis.memtable(pq.read_table(path))
+            self._create_cached_table(name, expr)
+        except BaseException:
+            with self._cache_lock:
+                if name in self._cache_name_to_entry:
+                    self._cache_evicted[name] = path
+            raise
+        finally:
+            with self._cache_lock:
+                self._cache_pending.pop(name).set()
+                released = name not in self._cache_name_to_entry
+
+        if path is not None:
+            path.unlink(missing_ok=True)
+        if released:
+            # the table was released while it was being reloaded
+            self._drop_cached_table(name)
+        return not released
+
+    def _track_cached_table(self, name: str) -> None:
+        """Start tracking the size of the materialized cached table `name`."""
+        with self._cache_lock:
+            entry = self._cache_name_to_entry.get(name)
+        if entry is None or (cached_op := entry.cached_op_ref()) is None:
+            return
+
+        with self._querying_cached_tables():
+            nbytes = self._cached_table_nbytes(cached_op.to_expr())
+
+        with self._cache_lock:
+            if (
+                self._cache_budget is not None
+                and name in self._cache_name_to_entry
+                and name not in self._cache_evicted
+                and name not in self._cache_pending
+            ):
+                self._cache_sizes[name] = nbytes
+                self._cache_sizes.move_to_end(name)
+
+    def _evict_cached_tables(self) -> None:
+        """Evict least recently used cached tables until within budget."""
+        while (victim := self._next_cache_victim()) is not None:
+            name, nbytes, entry, spill_dir = victim
+            path = None
+            try:
+                if spill_dir is not None and (
+                    (cached_op := entry.cached_op_ref()) is not None
+                ):
+                    path = spill_dir / f"{name}.parquet"
+                    with self._querying_cached_tables():
+                        self.to_parquet(cached_op.to_expr(), path)
+                self._drop_cached_table(name)
+            except BaseException:
+                with self._cache_lock:
+                    if name in self._cache_name_to_entry:
+                        self._cache_sizes[name] = nbytes
+                        self._cache_sizes.move_to_end(name, last=False)
+                raise
+            else:
+                with self._cache_lock:
+                    released = name not in self._cache_name_to_entry
+                    if not released:
+                        self._cache_evicted[name] = path
+                if released and path is not None:
+                    # the table was released while it was being evicted
+                    path.unlink(missing_ok=True)
+            finally:
+                with self._cache_lock:
+                    self._cache_pending.pop(name).set()
+
+    def _next_cache_victim(self):
+        """Pick the least recently used cached table to evict, if over budget."""
+        with self._cache_lock:
+            if self._cache_budget is None:
+                return None
+            if sum(self._cache_sizes.values()) <= self._cache_budget:
+                return None
+            for name in self._cache_sizes:
+                if not self._cache_pins[name]:
+                    break
+            else:
+                return None
+            nbytes = self._cache_sizes.pop(name)
+            self._cache_pending[name] = threading.Event()
+            entry = self._cache_name_to_entry[name]
+            return name, nbytes, entry, self._cache_spill_dir
+
+    @contextlib.contextmanager
+    def _querying_cached_tables(self):
+        """Query materialized cached tables without touching the cache state."""
+        self._cache_local.querying = True
+        try:
+            yield
+        finally:
+            self._cache_local.querying = False
+
     def _finalize_cached_table(self, name: str) -> None:
         """Release a cached table given its name.
 
@@ -943,15 +1211,30 @@ class CacheHandler:
         name
             The name of the cached table.
         """
-        if (entry := self._cache_name_to_entry.pop(name, None)) is not None:
+        # finalizers may run on any thread, possibly while it's running a
+        # query, so the lock is only held for bookkeeping
+        with self._cache_lock:
+            if (entry := self._cache_name_to_entry.pop(name, None)) is None:
+                return
             self._cache_op_to_entry.pop(entry.orig_op)
+            self._cache_sizes.pop(name, None)
             entry.finalizer.detach()
-            try:
-                self._drop_cached_table(name)
-            except Exception:
-                # suppress exceptions during interpreter shutdown
-                if not sys.is_finalizing():
-                    raise
+            if name in self._cache_pending:
+                # dropped by the thread reloading or evicting it
+                return
+            evicted = name in self._cache_evicted
+            path = self._cache_evicted.pop(name, None)
+
+        if evicted:
+            if path is not None:
+                path.unlink(missing_ok=True)
+            return
+        try:
+            self._drop_cached_table(name)
+        except Exception:
+            # suppress exceptions during interpreter shutdown
+            if not sys.is_finalizing():
+                raise
 
     def _create_cached_table(self, name: str, expr: ir.Table) -> ir.Table:
         return self.create_table(name, expr, schema=expr.schema(), temp=True)
@@ -959,6 +1242,37 @@ class CacheHandler:
     def _drop_cached_table(self, name: str) -> None:
         self.drop_table(name, force=True)
 
+    def _cached_table_nbytes(self, table: ir.Table) -> int:
+        """Estimate the number of bytes used by a cached table.
+
+        Fixed width values are counted at their width and strings at their
+        length, other values at a rough per-value estimate.
+        """
+        row_width = 0
+        lengths = {}
+        for column, dtype in table.schema().items():
+            if dtype.is_string():
+                lengths[f"len_{len(lengths)}"] = table[column].length().sum()
+            else:
+                row_width += _estimated_value_width(dtype)
+
+        [stats] = self.to_pyarrow(
+            table.aggregate(n=table.count(), **lengths)
+        ).to_pylist()
+        return stats.pop("n") * row_width + sum(
+            length or 0 for length in stats.values()
+        )
+
+
+def _estimated_value_width(dtype: dt.DataType) -> int:
+    if (nbytes := getattr(dtype, "nbytes", None)) is not None:
+        return nbytes
+    elif dtype.is_boolean():
+        return 1
+    elif dtype.is_decimal() or dtype.is_uuid():
+        return 16
+    return 8
+
 
 class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
     """Base backend class.
@@ -977,8 +1291,77 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         self._con_kwargs: dict[str, Any] = kwargs
         self._can_reconnect: bool = True
         self._memtables = weakref.WeakSet()
+        self._memtables_lock = threading.Lock()
+        # query results cached by interactive previews and `pivot_wider`
+        self._preview_cache = collections.OrderedDict()
+        self._pivot_names_cache = collections.OrderedDict()
+        self._result_caches_lock = threading.Lock()
+        self._idle_workers = []
+        self._workers_lock = threading.Lock()
         super().__init__()
 
+    def clear_preview_cache(self) -> None:
+        """Clear the cached results of interactive previews.
+
+        Previews of this backend's tables are cached when
+        `ibis.options.repr.interactive.cache_size` is positive, and the cache
+        is cleared when a table is modified through the backend, including by
+        statements run with `raw_sql`. Call this method after modifying the
+        data by other means, such as another connection.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = con.create_table("t", {"a": [1, 2, 3]})
+        >>> other = con.con.cursor()  # another connection to the same database
+        >>> other.execute("INSERT INTO t VALUES (4)")  # doctest: +ELLIPSIS
+        <...>
+        >>> con.clear_preview_cache()
+
+        """
+        with self._result_caches_lock:
+            self._preview_cache.clear()
+
+    def clear_pivot_names_cache(self) -> None:
+        """Clear the cached column names discovered by `Table.pivot_wider`.
+
+        When `names` isn't passed to
+        [`pivot_wider`](./expression-tables.qmd#ibis.expr.types.relations.Table.pivot_wider),
+        the distinct values of `names_from` are queried from the backend and
+        cached, so that rebuilding the same pivot doesn't query them again.
+        The cache is cleared when a table is modified through the backend,
+        including by statements run with `raw_sql`. Call this method after
+        modifying the data by other means, such as another connection.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = con.create_table("t", {"name": ["a", "b"], "value": [1, 2]})
+        >>> t.pivot_wider().columns
+        ('a', 'b')
+        >>> other = con.con.cursor()  # another connection to the same database
+        >>> other.execute("INSERT INTO t VALUES ('c', 3)")  # doctest: +ELLIPSIS
+        <...>
+        >>> t.pivot_wider().columns
+        ('a', 'b')
+        >>> con.clear_pivot_names_cache()
+        >>> t.pivot_wider().columns
+        ('a', 'b', 'c')
+        """
+        with self._result_caches_lock:
+            self._pivot_names_cache.clear()
+
+    def _clear_result_caches(self) -> None:
+        """Clear the cached previews and pivot names of the backend.
+
+        Backends call this after modifying the data of existing tables.
+        """
+        with self._result_caches_lock:
+            self._preview_cache.clear()
+            self._pivot_names_cache.clear()
+
     @property
     @abc.abstractmethod
     def dialect(self) -> sg.Dialect | None:
@@ -1065,6 +1448,7 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         """Reconnect to the database already configured with connect."""
         if self._can_reconnect:
             self.do_connect(*self._con_args, **self._con_kwargs)
+            self._clear_result_caches()
         else:
             raise exc.IbisError("Cannot reconnect to unconfigured {self.name} backend")
 
@@ -1224,6 +1608,97 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         """
         return TablesAccessor(self)
 
+    def estimate_rows(
+        self,
+        table: str | ir.Table,
+        /,
+        *,
+        database: tuple[str, str] | str | None = None,
+    ) -> int | None:
+        """Estimate the number of rows in a table from catalog statistics.
+
+        Unlike `table.count()`, no data is scanned: the estimate is read from
+        metadata the backend maintains, which may be stale or missing.
+
+        Parameters
+        ----------
+        table
+            The name of a table, or a table expression of a table in this
+            backend.
+        database
+            The database, or (catalog, database), of the table if `table` is a
+            name.
+
+        Returns
+        -------
+        int | None
+            The estimated number of rows, or `None` if no estimate is
+            available, for example because `table` isn't a physical table
+            or the backend hasn't collected statistics for it.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = con.create_table("t", {"a": [1, 2, 3]})
+        >>> con.estimate_rows("t")
+        3
+        >>> con.estimate_rows(t.filter(t.a > 1)) is None
+        True
+        """
+        if isinstance(table, str):
+            table = self.table(table, database=database)
+
+        op = table.op()
+        if not isinstance(op, ops.DatabaseTable) or op.source != self:
+            return None
+
+        namespace = op.namespace
+        return self._estimate_rows(
+            op.name, catalog=namespace.catalog, database=namespace.database
+        )
+
+    def _estimate_rows(
+        self, name: str, /, *, catalog: str | None, database: str | None
+    ) -> int | None:
+        """Return a row count estimate for a table, or `None` if unavailable."""
+        return None
+
+    def _resolve_approx_counts(self, expr: ir.Expr) -> ir.Table:
+        """Return the table of `expr` with approximate row counts estimated.
+
+        Estimates are only substituted for ungrouped aggregations of a table in
+        this backend computing nothing but its approximate row count. All
+        other approximate counts, and those without an estimate, are left for
+        the compiler to count exactly.
+
+        This is only called when executing an expression, so compiled SQL,
+        views and tables never embed an estimate.
+        """
+        table = expr.as_table()
+        node = table.op()
+        if not node.find(ops.ApproxCountStar):
+            return table
+
+        def estimate(op, kwargs):
+            if kwargs:
+                op = op.__recreate__(kwargs)
+            if (
+                not isinstance(op, ops.Aggregate)
+                or op.groups
+                or not all(
+                    isinstance(metric, ops.ApproxCountStar) and metric.arg == op.parent
+                    for metric in op.metrics.values()
+                )
+                or (rows := self.estimate_rows(op.parent.to_expr())) is None
+            ):
+                return op
+            # cast so engines don't narrow the literal to a smaller integer
+            count = ops.Cast(ops.Literal(rows, dtype="int64"), to="int64")
+            return ops.DummyTable(dict.fromkeys(op.metrics, count))
+
+        return node.replace(estimate).to_expr()
+
     @property
     @abc.abstractmethod
     def version(self) -> str:
@@ -1273,7 +1748,13 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
 
     def _register_in_memory_tables(self, expr: ir.Expr) -> None:
         for memtable in self._verify_in_memory_tables_are_unique(expr):
-            if memtable not in self._memtables:
+            # registered memtables are skipped without taking the lock
+            if memtable in self._memtables:
+                continue
+            with self._memtables_lock:
+                # another thread may have registered it in the meantime
+                if memtable in self._memtables:
+                    continue
                 self._register_in_memory_table(memtable)
                 self._memtables.add(memtable)
                 if (
@@ -1298,6 +1779,10 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
         """Backend-specific hooks to run before an expression is executed."""
         self._register_udfs(expr)
         self._register_in_memory_tables(expr)
+        if self._cache_name_to_entry:
+            self._load_cached_tables(
+                op.name for op in expr.op().find(ops.DatabaseTable)
+            )
 
     @abc.abstractmethod
     def compile(
@@ -1348,6 +1833,323 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
             Keyword arguments
         """
 
+    def execute_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        max_concurrency: int | None = None,
+        return_exceptions: bool = False,
+        fuse: bool = False,
+    ) -> list[pd.DataFrame | pd.Series | Any]:
+        """Execute independent expressions concurrently.
+
+        Each query runs on its own connection or cursor to the same database,
+        so the total latency approaches that of the slowest query instead of
+        the sum of all of them. Backends that can't run queries concurrently
+        execute the expressions one at a time.
+
+        Parameters
+        ----------
+        exprs
+            Ibis expressions to execute.
+        params
+            Mapping of scalar parameter expressions to value, shared by all
+            expressions.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            no limit. The default is in `ibis/config.py`.
+        max_concurrency
+            The maximum number of queries to run at the same time. Defaults to
+            the number of expressions, up to 32.
+        return_exceptions
+            If `True`, an expression that fails to execute produces its
+            exception in the returned list. Otherwise the first failure, in
+            the order of `exprs`, is raised.
+        fuse
+            If `True`, scalar reductions of the same table, optionally
+            filtered, are computed together by a single aggregation that reads
+            the table once. Grouped aggregations are never fused.
+
+        Returns
+        -------
+        list
+            The result of every expression, in the same order as `exprs`.
+
+        Notes
+        -----
+        Every expression is compiled up front, on the calling thread. The
+        additional connections are kept open and reused by later calls until
+        the backend is disconnected.
+
+        Connection-local tables and views, such as temporary tables, the views
+        created by `read_parquet` and `read_csv` or cached tables, aren't
+        visible to the other connections, so expressions that read them are
+        executed on this connection. Backends that can't list those tables
+        execute every expression on this connection.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = con.create_table("t", {"a": [1, 2, 3], "b": ["x", "y", "x"]})
+        >>> con.execute_many([t.a.sum(), t.b.nunique(), t.count()])
+        [6, 2, 3]
+
+        Compute reductions of the same table with a single query
+
+        >>> con.execute_many([t.a.sum(), t.filter(t.b == "x").a.max(), t.count()], fuse=True)
+        [6, 3, 3]
+        """
+        exprs = list(exprs)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"`max_concurrency` must be a positive integer, got {max_concurrency}"
+            )
+
+        if not exprs:
+            return []
+
+        if fuse:
+            return self._execute_fused(
+                exprs,
+                params=params,
+                limit=limit,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+            )
+
+        max_workers = max_concurrency or min(len(exprs), 32)
+        try:
+            backend = self._acquire_worker()
+        except NotImplementedError:
+            backend = None
+
+        local_tables = frozenset()
+        if backend is not None and backend is not self:
+            try:
+                local_tables = self._list_connection_local_tables()
+            except NotImplementedError:
+                # other connections may not see this connection's temporary
+                # tables, so run everything here
+                self._release_workers([backend])
+                backend = None
+
+        idle = queue.SimpleQueue()
+        workers = []
+        if backend is self:
+            # the connection is shared between threads, register memtables
+            # and UDFs once up front instead of from every thread
+            for expr in exprs:
+                self._run_pre_execute_hooks(expr)
+        elif backend is not None:
+            workers.append(backend)
+            try:
+                workers.extend(
+                    self._acquire_worker()
+                    for _ in range(min(max_workers, len(exprs)) - 1)
+                )
+            except Exception:
+                self._release_workers(workers)
+                raise
+            for worker in workers:
+                idle.put(worker)
+
+        def local(expr: ir.Expr) -> bool:
+            if backend is None:
+                return True
+            elif backend is self:
+                return False
+            names = {op.name for op in expr.op().find(ops.DatabaseTable)}
+            return not (
+                names.isdisjoint(local_tables)
+                and names.isdisjoint(self._cache_name_to_entry)
+            )
+
+        def execute(target: BaseBackend, expr: ir.Expr, query: Any):
+            if query is None:
+                return target.execute(expr, params=params, limit=limit)
+            return target._execute_compiled(expr, query)
+
+        def run(expr: ir.Expr, query: Any):
+            if backend is self:
+                return execute(self, expr, query)
+
+            worker = idle.get()
+            try:
+                return execute(worker, expr, query)
+            finally:
+                idle.put(worker)
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"ibis-{self.name}-execute-many",
+        )
+        try:
+            queries = self._precompile(exprs, params=params, limit=limit)
+            # expressions that can't run on another connection are executed on
+            # this thread while the others are running
+            futures = [
+                None if local(expr) else executor.submit(run, expr, query)
+                for expr, query in zip(exprs, queries)
+            ]
+            results = []
+            for expr, query, future in zip(exprs, queries, futures):
+                try:
+                    if future is None:
+                        result = execute(self, expr, query)
+                    else:
+                        result = future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    result = e
+                results.append(result)
+            return results
+        finally:
+            executor.shutdown(cancel_futures=True)
+            # keep the connections for the next call
+            self._release_workers(workers)
+
+    def _execute_fused(
+        self, exprs: list[ir.Expr], /, **kwargs: Any
+    ) -> list[pd.DataFrame | pd.Series | Any]:
+        from ibis.expr.rewrites import fuse_reductions
+
+        fused = fuse_reductions([expr.op() for expr in exprs])
+        fused_positions = {i for _, positions in fused for i, _ in positions}
+        rest = [i for i in range(len(exprs)) if i not in fused_positions]
+
+        results = self.execute_many(
+            [agg.to_expr() for agg, _ in fused] + [exprs[i] for i in rest], **kwargs
+        )
+
+        # split the single row of every aggregation into the results of the
+        # expressions it computes
+        out = [None] * len(exprs)
+        for (_, positions), df in zip(fused, results):
+            for i, name in positions:
+                out[i] = (
+                    df
+                    if isinstance(df, Exception)
+                    else exprs[i].__pandas_result__(df[[name]])
+                )
+        for i, result in zip(rest, results[len(fused) :]):
+            out[i] = result
+        return out
+
+    def _connect_worker(self) -> BaseBackend:
+        """Return a backend connected to the same database for another thread.
+
+        Used by `execute_many` to run queries concurrently. Return `self` if
+        this backend can run queries from several threads at once, or raise
+        `NotImplementedError` if queries can't be run concurrently.
+        """
+        if not self._can_reconnect:
+            raise NotImplementedError(
+                f"{self.name} backend created from an existing connection cannot "
+                "open additional connections"
+            )
+        return self.connect(*self._con_args, **self._con_kwargs)
+
+    def _acquire_worker(self) -> BaseBackend:
+        """Return an idle worker from the pool, or connect a new one."""
+        with self._workers_lock:
+            if self._idle_workers:
+                return self._idle_workers.pop()
+        # connect on the calling thread, some drivers tie a connection to the
+        # thread that created it
+        return self._connect_worker()
+
+    def _release_workers(self, workers: Iterable[BaseBackend]) -> None:
+        """Return workers to the pool to be reused by the next `execute_many`."""
+        with self._workers_lock:
+            self._idle_workers.extend(
+                worker for worker in workers if worker is not self
+            )
+
+    def _close_workers(self) -> None:
+        """Disconnect the pooled workers."""
+        with self._workers_lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            with contextlib.suppress(Exception):
+                worker.disconnect()
+
+    def _list_connection_local_tables(self) -> frozenset[str]:
+        """Return the names of the tables and views only this connection sees.
+
+        Used by `execute_many` to keep the expressions reading them on this
+        connection instead of running them on another one. Raise
+        `NotImplementedError` if they can't be listed, in which case every
+        expression runs on this connection.
+        """
+        raise NotImplementedError(
+            f"{self.name} backend can't list its connection-local tables"
+        )
+
+    def _precompile(
+        self,
+        exprs: list[ir.Expr],
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+    ) -> list[Any]:
+        """Compile `exprs` up front for `execute_many`.
+
+        Return the compiled query of every expression, to be executed with
+        `_execute_compiled`, or `None` for the expressions to execute as is.
+        """
+        return [None] * len(exprs)
+
+    def _execute_compiled(self, expr: ir.Expr, query: Any, /) -> Any:
+        """Execute `expr` compiled to `query` by `_precompile`."""
+        raise NotImplementedError(
+            f"{self.name} backend can't execute precompiled queries"
+        )
+
+    def explain(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        analyze: bool = False,
+    ) -> QueryPlan:
+        """Return the query plan the backend would use to compute `expr`.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to explain.
+        params
+            Mapping of scalar parameter expressions to value.
+        analyze
+            If `True`, execute the query and collect actual row counts and
+            timings in addition to the planner's estimates.
+
+        Returns
+        -------
+        QueryPlan
+            The plan in the engine's native format along with a normalized
+            tree of plan nodes.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> t = con.create_table("t", {"a": [1, 2, 3], "b": ["x", "y", "x"]})
+        >>> plan = con.explain(t.filter(t.a > 1).group_by("b").agg(n=t.a.sum()))
+        >>> [node.name for node in plan.find("scan")]
+        ['SEQ_SCAN']
+        """
+        raise NotImplementedError(
+            f"{self.name} backend has not implemented `explain` API"
+        )
+
     @abc.abstractmethod
     def create_table(
         self,
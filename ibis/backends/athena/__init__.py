@@ -66,6 +66,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, NoExampleLoader):
         except Exception:
             cur.close()
             raise
+        self._clear_result_caches_for(query)
         return cur
 
     def create_table(
@@ -222,6 +223,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, NoExampleLoader):
         with self._safe_raw_sql(create_stmt, unload=False):
             pass
 
+        self._clear_result_caches()
         return self.table(orig_table_ref.name, database=(catalog, db))
 
     def table(self, name: str, /, *, database: str | None = None) -> ir.Table:
@@ -479,6 +481,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, NoExampleLoader):
         sql = sge.Drop(this=name, kind="SCHEMA", exists=force)
         with self._safe_raw_sql(sql, unload=False):
             pass
+        self._clear_result_caches()
 
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
@@ -604,3 +607,4 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, NoExampleLoader):
         )
         with self._safe_raw_sql(query, unload=False):
             pass
+        self._clear_result_caches()
@@ -340,6 +340,7 @@ class Backend(
                 ):
                     fut.result()
 
+        self._clear_result_caches()
         return self.table(table_name, database=(catalog, database))
 
     def read_parquet(
@@ -632,7 +633,9 @@ class Backend(
         )
 
     def disconnect(self) -> None:
+        self._close_workers()
         self.client.close()
+        self._clear_result_caches()
 
     def _parse_project_and_dataset(self, dataset) -> tuple[str, str]:
         if isinstance(dataset, sge.Table):
@@ -704,6 +707,7 @@ class Backend(
         )
 
         self.raw_sql(stmt.sql(self.name))
+        self._clear_result_caches()
 
     def table(
         self,
@@ -800,9 +804,11 @@ class Backend(
         with contextlib.suppress(AttributeError):
             query = query.sql(self.dialect)
 
-        return self._client_query(
+        result = self._client_query(
             query, job_config=job_config, project=self.billing_project
         )
+        self._clear_result_caches_for(query)
+        return result
 
     @property
     def current_catalog(self) -> str:
@@ -1277,6 +1283,7 @@ class Backend(
         sql = stmt.sql(self.name)
 
         self.raw_sql(sql)
+        self._clear_result_caches()
         return self.table(table.name, database=(table.catalog, table.db))
 
     def drop_table(
@@ -1299,6 +1306,7 @@ class Backend(
             exists=force,
         )
         self.raw_sql(stmt.sql(self.name))
+        self._clear_result_caches()
 
     def create_view(
         self,
@@ -1324,6 +1332,7 @@ class Backend(
         )
         self._run_pre_execute_hooks(obj)
         self.raw_sql(stmt.sql(self.name))
+        self._clear_result_caches()
         return self.table(name, database=(catalog, database))
 
     def drop_view(
@@ -1342,6 +1351,7 @@ class Backend(
             exists=force,
         )
         self.raw_sql(stmt.sql(self.name))
+        self._clear_result_caches()
 
     def _drop_cached_table(self, name):
         self.drop_table(
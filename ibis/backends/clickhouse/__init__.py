@@ -3,7 +3,9 @@ from __future__ import annotations
 import ast
 import contextlib
 import glob
+import json
 import re
+import time
 from contextlib import closing
 from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
@@ -33,6 +35,7 @@ from ibis.backends import (
     SupportsTempTables,
 )
 from ibis.backends.clickhouse.converter import ClickHousePandasData
+from ibis.backends.explain import PlanNode, QueryPlan, to_details
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import C
 
@@ -218,6 +221,32 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
             tables = []
         return self._filter_with_like(tables, like)
 
+    def _estimate_rows(
+        self, name: str, /, *, catalog: str | None, database: str | None
+    ) -> int | None:
+        # total_rows is computed from the row counts of a MergeTree table's
+        # active parts (system.parts) without reading any data, and is NULL
+        # for engines that don't track it
+        query = (
+            sg.select(C.total_rows)
+            .from_(sg.table("tables", db="system"))
+            .where(
+                C.database.eq(
+                    self.compiler.f.currentDatabase()
+                    if database is None
+                    else sge.convert(database)
+                ),
+                C.name.eq(sge.convert(name)),
+            )
+        )
+
+        with self._safe_raw_sql(query) as result:
+            rows = result.result_rows
+
+        if not rows or (total_rows := rows[0][0]) is None:
+            return None
+        return int(total_rows)
+
     def _normalize_external_tables(self, external_tables=None) -> ExternalData | None:
         """Merge registered external tables with any new external tables."""
         external_data = ExternalData()
@@ -340,7 +369,7 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
            without pandas in the middle.
 
         """
-        table = expr.as_table()
+        table = self._resolve_approx_counts(expr)
         sql = self.compile(table, limit=limit, params=params)
 
         external_tables = self._collect_in_memory_tables(expr, external_tables)
@@ -381,7 +410,7 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         """Execute an expression."""
         import pandas as pd
 
-        table = expr.as_table()
+        table = self._resolve_approx_counts(expr)
         sql = self.compile(table, params=params, limit=limit)
 
         schema = table.schema()
@@ -407,6 +436,70 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         df = ClickHousePandasData.convert_table(df, schema=schema)
         return expr.__pandas_result__(df)
 
+    def explain(
+        self,
+        expr: ir.Expr | str,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        analyze: bool = False,
+        external_tables: Mapping[str, pd.DataFrame] | None = None,
+    ) -> QueryPlan:
+        """Return the query plan ClickHouse would use to compute `expr`.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression or SQL string to explain.
+        params
+            Mapping of scalar parameter expressions to value.
+        analyze
+            If `True`, execute the query and record its execution time.
+            ClickHouse doesn't report per-operator statistics.
+        external_tables
+            Mapping of table name to pandas DataFrames providing external
+            datasources for the query.
+
+        Returns
+        -------
+        QueryPlan
+            The plan in ClickHouse's JSON format along with a normalized tree
+            of plan nodes.
+        """
+        if isinstance(expr, str):
+            query = expr
+            external_tables = toolz.valmap(_to_memtable, external_tables or {})
+        else:
+            query = self.compile(expr.as_table(), params=params)
+            external_tables = self._collect_in_memory_tables(expr, external_tables)
+
+        def fetch(sql: str) -> list[tuple]:
+            with self._safe_raw_sql(sql, external_tables=external_tables) as result:
+                return result.result_rows
+
+        [(raw,)] = fetch(f"EXPLAIN PLAN json = 1, description = 1, indexes = 1 {query}")
+        [plan] = json.loads(raw)
+
+        # EXPLAIN ESTIMATE reports the rows to be read from each MergeTree table
+        estimates = {
+            f"{database}.{table}": float(rows)
+            for database, table, _, rows, *_ in fetch(f"EXPLAIN ESTIMATE {query}")
+        }
+
+        execution_time = None
+        if analyze:
+            start = time.perf_counter()
+            fetch(query)
+            execution_time = time.perf_counter() - start
+
+        return QueryPlan(
+            query=query,
+            raw=raw,
+            root=_to_plan_node(plan["Plan"], estimates),
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
+
     def insert(
         self,
         name: str,
@@ -425,18 +518,24 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
             self.truncate_table(name)
 
         if isinstance(obj, pa.Table):
-            return self.con.insert_arrow(
+            result = self.con.insert_arrow(
                 name, obj, database=database, settings=settings, **kwargs
             )
         elif isinstance(obj, pd.DataFrame):
-            return self.con.insert_df(name, obj, settings=settings, **kwargs)
-        elif not isinstance(obj, ir.Table):
-            obj = ibis.memtable(obj)
+            result = self.con.insert_df(name, obj, settings=settings, **kwargs)
+        else:
+            if not isinstance(obj, ir.Table):
+                obj = ibis.memtable(obj)
+
+            query = self._build_insert_from_table(target=name, source=obj, db=database)
+            external_tables = self._collect_in_memory_tables(obj, {})
+            external_data = self._normalize_external_tables(external_tables)
+            result = self.con.command(
+                query.sql(self.dialect), external_data=external_data
+            )
 
-        query = self._build_insert_from_table(target=name, source=obj, db=database)
-        external_tables = self._collect_in_memory_tables(obj, {})
-        external_data = self._normalize_external_tables(external_tables)
-        return self.con.command(query.sql(self.dialect), external_data=external_data)
+        self._clear_result_caches()
+        return result
 
     def raw_sql(
         self,
@@ -467,11 +566,15 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name, pretty=True)
         self._log(query)
-        return self.con.query(query, external_data=external_data, **kwargs)
+        result = self.con.query(query, external_data=external_data, **kwargs)
+        self._clear_result_caches_for(query)
+        return result
 
     def disconnect(self) -> None:
         """Close ClickHouse connection."""
+        self._close_workers()
         self.con.close()
+        self._clear_result_caches()
 
     def get_schema(
         self,
@@ -547,11 +650,13 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         )
         with self._safe_raw_sql(src):
             pass
+        self._clear_result_caches()
 
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         ident = sg.table(name, db=database).sql(self.name)
         with self._safe_raw_sql(f"TRUNCATE TABLE {ident}"):
             pass
+        self._clear_result_caches()
 
     def read_parquet(
         self,
@@ -581,6 +686,7 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
                 fmt="Parquet",
                 **kwargs,
             )
+        self._clear_result_caches()
         return table
 
     def read_csv(
@@ -605,6 +711,7 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
 
         for file_path in paths:
             insert_file(client=self.con, table=name, file_path=file_path, **kwargs)
+        self._clear_result_caches()
         return table
 
     def create_table(
@@ -758,6 +865,7 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         sql = code.sql(self.name, pretty=True)
         self.con.raw_query(sql, external_data=external_data)
 
+        self._clear_result_caches()
         return self.table(name, database=database)
 
     def create_view(
@@ -779,4 +887,20 @@ class Backend(SupportsTempTables, SQLBackend, CanCreateDatabase, DirectExampleLo
         external_tables = self._collect_in_memory_tables(obj)
         with self._safe_raw_sql(src, external_tables=external_tables):
             pass
+        self._clear_result_caches()
         return self.table(name, database=database)
+
+
+def _to_plan_node(node: Mapping[str, Any], estimates: Mapping[str, float]) -> PlanNode:
+    name = node["Node Type"]
+    description = node.get("Description")
+    return PlanNode(
+        name=name,
+        children=tuple(
+            _to_plan_node(child, estimates) for child in node.get("Plans", ())
+        ),
+        estimated_rows=(
+            estimates.get(description) if name.startswith("ReadFrom") else None
+        ),
+        details=to_details(node, exclude=("Node Type", "Plans")),
+    )
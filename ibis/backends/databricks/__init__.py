@@ -113,6 +113,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, PyArrowExampleLoader):
         except Exception:
             cur.close()
             raise
+        self._clear_result_caches_for(query)
         return cur
 
     def create_table(
@@ -252,6 +253,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, PyArrowExampleLoader):
                         ).sql(dialect)
                     )
 
+        self._clear_result_caches()
         return self.table(name, database=(catalog, database))
 
     def table(self, name: str, /, *, database: str | None = None) -> ir.Table:
@@ -510,6 +512,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, PyArrowExampleLoader):
         name = sg.table(name, catalog=catalog, quoted=self.compiler.quoted)
         with self._safe_raw_sql(sge.Drop(this=name, kind="SCHEMA", replace=force)):
             pass
+        self._clear_result_caches()
 
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
@@ -629,3 +632,4 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, PyArrowExampleLoader):
         )
         with self._safe_raw_sql(query):
             pass
+        self._clear_result_caches()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import re
 import typing
 from collections.abc import Mapping
 from pathlib import Path
@@ -30,6 +31,7 @@ from ibis.backends import (
     NoUrl,
     SupportsTempTables,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, from_indented, to_seconds
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import C
 from ibis.common.dispatch import lazy_singledispatch
@@ -164,6 +166,10 @@ class Backend(
     def disconnect(self) -> None:
         pass
 
+    def _connect_worker(self) -> Backend:
+        # the session context can be shared between threads
+        return self
+
     @contextlib.contextmanager
     def _safe_raw_sql(self, sql: sge.Statement) -> Any:
         yield self.raw_sql(sql).collect()
@@ -309,7 +315,24 @@ class Backend(
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.dialect, pretty=True)
         self._log(query)
-        return self.con.sql(query)
+        result = self.con.sql(query)
+        self._clear_result_caches_for(query)
+        return result
+
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        statement = f"EXPLAIN ANALYZE {query}" if analyze else f"EXPLAIN {query}"
+        plans = dict(
+            zip(*self.raw_sql(statement).to_arrow_table().to_pydict().values())
+        )
+        # the physical plan is the last plan reported both with and without
+        # ANALYZE, and is the one with statistics and metrics attached
+        *_, physical = plans.values()
+        return QueryPlan(
+            query=query,
+            raw="\n\n".join(f"{kind}:\n{plan}" for kind, plan in plans.items()),
+            root=from_indented(physical, parse_line=_to_plan_node),
+            analyzed=analyze,
+        )
 
     @property
     def current_catalog(self):
@@ -372,6 +395,7 @@ class Backend(
         db_name = sg.table(name, db=catalog)
         with self._safe_raw_sql(sge.Drop(kind="SCHEMA", this=db_name, exists=force)):
             pass
+        self._clear_result_caches()
 
     def list_tables(
         self, *, like: str | None = None, database: str | None = None
@@ -453,6 +477,7 @@ class Backend(
         # Our other backends support overwriting views / tables when re-registering
         self.con.deregister_table(table_name)
         self.con.register_csv(table_name, path, **kwargs)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_parquet(
@@ -480,6 +505,7 @@ class Backend(
         # Our other backends support overwriting views / tables when reregistering
         self.con.deregister_table(table_name)
         self.con.register_parquet(table_name, path, **kwargs)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_delta(
@@ -520,6 +546,7 @@ class Backend(
 
         delta_table = DeltaTable(path, **kwargs)
         self.con.register_dataset(table_name, delta_table.to_pyarrow_dataset())
+        self._clear_result_caches()
         return self.table(table_name)
 
     def to_pyarrow_batches(
@@ -532,8 +559,7 @@ class Backend(
     ) -> pa.ipc.RecordBatchReader:
         pa = self._import_pyarrow()
 
-        self._register_udfs(expr)
-        self._register_in_memory_tables(expr)
+        self._run_pre_execute_hooks(expr)
 
         table_expr = expr.as_table()
         raw_sql = self.compile(table_expr, **kwargs)
@@ -668,6 +694,7 @@ class Backend(
         elif obj is not None:
             table_ident = sg.table(name, db=database, quoted=quoted).sql(self.dialect)
             _read_in_memory(obj, table_ident, self, overwrite=overwrite)
+            self._clear_result_caches()
             return self.table(name, database=database)
         else:
             query = None
@@ -695,6 +722,7 @@ class Backend(
         with self._safe_raw_sql(create_stmt):
             pass
 
+        self._clear_result_caches()
         return self.table(name, database=database)
 
     def truncate_table(self, name: str, /, *, database: str | None = None):
@@ -716,6 +744,7 @@ class Backend(
         ident = sg.table(name, db=db, catalog=catalog).sql(self.dialect)
         with self._safe_raw_sql(sge.delete(ident)):
             pass
+        self._clear_result_caches()
 
     def _create_cached_table(self, name: str, expr: ir.Table) -> ir.Table:
         return self.create_table(name, expr, schema=expr.schema())
@@ -747,6 +776,37 @@ def _create_and_drop_memtable(_conn, table_name, tmp_name, overwrite):
     _conn.drop_table(tmp_name)
 
 
+def _to_plan_node(line: str) -> PlanNode:
+    name, _, rest = line.partition(": ")
+
+    details = {}
+    actual_rows = actual_time = estimated_rows = None
+
+    if (match := re.search(r"metrics=\[(.*?)\]", rest)) is not None:
+        metrics = dict(
+            metric.split("=", 1) for metric in match.group(1).split(", ") if metric
+        )
+        if (rows := metrics.get("output_rows")) is not None:
+            actual_rows = int(rows)
+        if (elapsed := metrics.get("elapsed_compute")) is not None:
+            actual_time = to_seconds(elapsed)
+        rest = rest[: match.start()].rstrip(", ")
+
+    if (match := re.search(r"Rows=(?:Exact|Inexact)\((\d+)\)", rest)) is not None:
+        estimated_rows = float(match.group(1))
+
+    if rest:
+        details["info"] = rest
+
+    return PlanNode(
+        name=name,
+        estimated_rows=estimated_rows,
+        actual_rows=actual_rows,
+        actual_time=actual_time,
+        details=details,
+    )
+
+
 @lazy_singledispatch
 def _read_in_memory(
     source: Any, table_name: str, _conn: Backend, overwrite: bool = False
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast
 import contextlib
+import json
 import urllib
 import warnings
 from pathlib import Path
@@ -31,6 +32,7 @@ from ibis.backends import (
     SupportsTempTables,
     UrlFromPath,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, to_details, to_float
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import STAR, AlterTable, C, RenameTable
 from ibis.common.dispatch import lazy_singledispatch
@@ -113,7 +115,9 @@ class Backend(
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.name)
-        return self.con.execute(query, **kwargs)
+        result = self.con.execute(query, **kwargs)
+        self._clear_result_caches_for(query)
+        return result
 
     def create_table(
         self,
@@ -272,6 +276,7 @@ class Backend(
                         ).sql(dialect)
                     )
 
+        self._clear_result_caches()
         return self.table(name, database=(catalog, database))
 
     def table(
@@ -472,6 +477,25 @@ class Backend(
 
         self._record_batch_readers_consumed = {}
 
+    def _connect_worker(self) -> Backend:
+        # a cursor is a new connection to the same database, which is the way
+        # to run queries from another thread
+        return self.from_connection(self.con.cursor())
+
+    def _list_connection_local_tables(self) -> frozenset[str]:
+        # temporary tables and views, including the views created by the
+        # `read_*` methods and registered Python objects
+        f = self.compiler.f
+        sql = sg.union(
+            sg.select(C.table_name).from_(f.duckdb_tables()).where(C.temporary),
+            sg.select(C.view_name)
+            .from_(f.duckdb_views())
+            .where(C.temporary, sg.not_(C.internal)),
+            distinct=False,
+        ).sql(self.dialect)
+        with self._safe_raw_sql(sql) as cur:
+            return frozenset(name for (name,) in cur.fetchall())
+
     def _load_extensions(
         self, extensions: list[str], force_install: bool = False
     ) -> None:
@@ -543,6 +567,7 @@ class Backend(
         name = sg.table(name, catalog=catalog, quoted=self.compiler.quoted)
         with self._safe_raw_sql(sge.Drop(this=name, kind="SCHEMA", replace=force)):
             pass
+        self._clear_result_caches()
 
     @util.experimental
     def read_json(
@@ -611,6 +636,7 @@ class Backend(
             ),
         )
 
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_csv(
@@ -744,6 +770,7 @@ class Backend(
             sg.select(STAR).from_(self.compiler.f.read_csv(paths, *options)),
         )
 
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_geo(
@@ -839,6 +866,7 @@ class Backend(
             table_name,
             sg.select(STAR).from_(self.compiler.f.read_parquet(paths, *options)),
         )
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_delta(
@@ -880,6 +908,7 @@ class Backend(
             table_name,
             sg.select(STAR).from_(self.compiler.f.delta_scan(path, *options)),
         )
+        self._clear_result_caches()
         return self.table(table_name)
 
     def list_tables(
@@ -905,6 +934,27 @@ class Backend(
 
         return self._filter_with_like(out[col].to_pylist(), like)
 
+    def _estimate_rows(
+        self, name: str, /, *, catalog: str | None, database: str | None
+    ) -> int | None:
+        catalogs = (
+            [sge.convert(catalog)]
+            if catalog is not None
+            else [sge.convert(self.current_catalog), sge.convert("temp")]
+        )
+        sql = (
+            sg.select(C.estimated_size)
+            .from_(self.compiler.f.duckdb_tables())
+            .where(
+                C.database_name.isin(*catalogs),
+                C.schema_name.eq(sge.convert(database or self.current_database)),
+                C.table_name.eq(sge.convert(name)),
+            )
+            .sql(self.dialect)
+        )
+        row = self.con.execute(sql).fetchone()
+        return None if row is None else row[0]
+
     def read_postgres(
         self, uri: str, /, *, table_name: str | None = None, database: str = "public"
     ) -> ir.Table:
@@ -1325,8 +1375,50 @@ class Backend(
         if expr.op().find((ops.GeoSpatialUnOp, ops.GeoSpatialBinOp)):
             self.load_extension("spatial")
 
+        if expr.op().find(
+            (
+                ops.HLLSketch,
+                ops.HLLMerge,
+                ops.HLLEstimate,
+                ops.TDigestSketch,
+                ops.TDigestMerge,
+                ops.TDigestQuantile,
+            )
+        ):
+            self._register_sketch_functions()
+
         super()._run_pre_execute_hooks(expr)
 
+    def _register_sketch_functions(self) -> None:
+        from ibis.backends import sketches
+
+        functions = {
+            "ibis_hll_sketch": (sketches.hll_sketches, ["BLOB[]"], "BLOB"),
+            "ibis_hll_merge": (sketches.hll_merges, ["BLOB[]"], "BLOB"),
+            "ibis_hll_estimate": (sketches.hll_estimates, ["BLOB"], "BIGINT"),
+            "ibis_tdigest_sketch": (sketches.tdigest_sketches, ["DOUBLE[]"], "BLOB"),
+            "ibis_tdigest_merge": (sketches.tdigest_merges, ["BLOB[]"], "BLOB"),
+            "ibis_tdigest_quantile": (
+                sketches.tdigest_quantiles,
+                ["BLOB", "DOUBLE"],
+                "DOUBLE",
+            ),
+        }
+
+        con = self.con
+        for name, (function, parameters, return_type) in functions.items():
+            with contextlib.suppress(duckdb.InvalidInputException):
+                con.remove_function(name)
+            con.create_function(
+                name=name,
+                function=function,
+                parameters=parameters,
+                return_type=return_type,
+                type=_duckdb_func.ARROW,
+                # empty groups aggregate to null lists, which are empty sketches
+                null_handling="special",
+            )
+
     def _to_duckdb_relation(
         self,
         expr: ir.Expr,
@@ -1345,7 +1437,7 @@ class Backend(
         `duckdb_con.execute` everywhere else.
         """
         self._run_pre_execute_hooks(expr)
-        table_expr = expr.as_table()
+        table_expr = self._resolve_approx_counts(expr)
         sql = self.compile(table_expr, limit=limit, params=params, **kwargs)
         if table_expr.schema().geospatial:
             self._load_extensions(["spatial"])
@@ -1383,7 +1475,7 @@ class Backend(
         import pyarrow_hotfix  # noqa: F401
 
         self._run_pre_execute_hooks(expr)
-        table = expr.as_table()
+        table = self._resolve_approx_counts(expr)
         sql = self.compile(table, limit=limit, params=params)
 
         def batch_producer(cur):
@@ -1391,7 +1483,7 @@ class Backend(
 
         result = self.raw_sql(sql)
         return pa.ipc.RecordBatchReader.from_batches(
-            expr.as_table().schema().to_pyarrow(), batch_producer(result)
+            table.schema().to_pyarrow(), batch_producer(result)
         )
 
     def to_pyarrow(
@@ -1739,6 +1831,30 @@ class Backend(
             }
         )
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+        with self._safe_raw_sql(f"EXPLAIN ({options}) {query}") as cur:
+            [(_, raw)] = cur.fetchall()
+
+        plan = json.loads(raw)
+        if analyze:
+            # the profiler wraps the query plan in an EXPLAIN_ANALYZE operator
+            [explain_analyze] = plan["children"]
+            [root] = explain_analyze["children"]
+            # latency is only reported when profiling is enabled
+            execution_time = plan.get("latency") or None
+        else:
+            [root] = plan
+            execution_time = None
+
+        return QueryPlan(
+            query=query,
+            raw=raw,
+            root=_to_plan_node(root),
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
+
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         data = op.data
         schema = op.schema
@@ -1823,3 +1939,17 @@ def _pyarrow_rbr(source, table_name, _conn, **_: Any):
     # Ensure the reader isn't marked as started, in case the name is
     # being overwritten.
     _conn._record_batch_readers_consumed[table_name] = False
+
+
+def _to_plan_node(node: Mapping[str, Any]) -> PlanNode:
+    extra_info = node.get("extra_info", {})
+    name = node.get("operator_name", node.get("name", ""))
+    actual_rows = node.get("operator_cardinality")
+    return PlanNode(
+        name=name.strip(),
+        children=tuple(map(_to_plan_node, node.get("children", ()))),
+        estimated_rows=to_float(extra_info.get("Estimated Cardinality")),
+        actual_rows=None if actual_rows is None else int(actual_rows),
+        actual_time=node.get("operator_timing"),
+        details=to_details(extra_info, exclude=("Estimated Cardinality",)),
+    )
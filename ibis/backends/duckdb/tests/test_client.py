@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pytest
+import sqlglot as sg
 from pytest import param
 
 import ibis
@@ -481,6 +482,27 @@ def test_create_table_from_in_memory_data(temp):
     assert con.con.execute("SHOW TABLES").fetchall() == [("foo",)]
 
 
+def test_execute_many_reuses_connections(mocker):
+    con = ibis.duckdb.connect()
+    t = con.create_table("foo", {"id": [3, 1, 2]})
+    exprs = [t.id.sum(), t.id.max(), t.order_by("id").id, t.order_by("id")]
+    spy = mocker.spy(con, "_connect_worker")
+
+    first = con.execute_many(exprs, max_concurrency=2)
+    assert spy.call_count == 2
+
+    second = con.execute_many(exprs, max_concurrency=2)
+    assert spy.call_count == 2
+
+    for result in first, second:
+        assert result[:2] == [6, 3]
+        assert result[2].tolist() == [1, 2, 3]
+        assert result[3].id.tolist() == [1, 2, 3]
+
+    con.disconnect()
+    assert not con._idle_workers
+
+
 def test_create_table_with_quoted_columns():
     con = ibis.duckdb.connect()
     name = gen_name("quoted_columns_table")
@@ -518,3 +540,58 @@ def test_basic_enum_schema_inference(con, converter):
     t = con.table(name)
     assert t.e.type() == dt.string
     assert set(converter(t.e)) == {"a", "b"}
+
+
+def test_sketches():
+    from ibis.backends import sketches
+
+    con = ibis.duckdb.connect()
+    t = ibis.memtable(
+        {
+            "day": [1, 1, 1, 2, 2, 3],
+            "user": ["a", "b", "a", "b", "c", None],
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, None],
+        }
+    )
+    daily = t.group_by("day").agg(
+        users=t.user.hll_sketch(), x=t.x.tdigest_sketch(where=t.x > 1)
+    )
+
+    result = con.execute(
+        daily.mutate(
+            users=daily.users.hll_estimate(), median=daily.x.tdigest_quantile(0.5)
+        ).order_by("day")
+    )
+    assert result.users.tolist() == [2, 2, 0]
+    assert result["median"].tolist()[:2] == [2.5, 4.5]
+    assert pd.isna(result["median"].iat[2])
+
+    rollup = daily.aggregate(
+        users=daily.users.hll_merge().hll_estimate(),
+        lo=daily.x.tdigest_merge().tdigest_quantile(0),
+        hi=daily.x.tdigest_merge().tdigest_quantile(1),
+    )
+    assert con.execute(rollup).iloc[0].tolist() == [3, 2.0, 5.0]
+
+    # sketches are interchangeable with the ones built by other backends
+    sketch = con.execute(t.user.hll_sketch())
+    assert sketch == sketches.hll_sketch(pa.array(["a", "b", "a", "b", "c", None]))
+
+
+def test_raw_sql_clears_result_caches(monkeypatch):
+    monkeypatch.setattr(ibis.options, "interactive", True)
+    monkeypatch.setattr(ibis.options.repr.interactive, "cache_size", 2)
+
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", {"a": [1, 2, 3]})
+    repr(t)
+    assert con._preview_cache
+
+    # read only statements keep the cached previews
+    con.raw_sql("SELECT * FROM t").fetchall()
+    con.raw_sql(sg.select("a").from_("t")).fetchall()
+    assert con._preview_cache
+
+    con.raw_sql("INSERT INTO t VALUES (4)")
+    assert not con._preview_cache
+    assert "4" in repr(t)
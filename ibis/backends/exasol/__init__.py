@@ -430,6 +430,8 @@ class Backend(SQLBackend, CanCreateDatabase, NoExampleLoader):
                     f"RENAME TABLE {table_expr.sql(self.name)} TO {this.sql(self.name)}"
                 )
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -458,6 +460,7 @@ class Backend(SQLBackend, CanCreateDatabase, NoExampleLoader):
         )
         with self.begin() as con:
             con.execute(drop_schema.sql(dialect=self.dialect))
+        self._clear_result_caches()
 
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
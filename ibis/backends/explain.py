@@ -0,0 +1,212 @@
+"""Backend-agnostic representation of query plans returned by `explain`."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Optional
+
+from public import public
+from typing_extensions import Self
+
+from ibis.common.collections import FrozenDict
+from ibis.common.grounds import Concrete
+from ibis.common.typing import VarTuple  # noqa: TC001
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+
+@public
+class PlanNode(Concrete):
+    """A single operator in a query plan.
+
+    Estimates are whatever the engine's planner reports, actual values are
+    only populated when the plan was produced with `analyze=True` and the
+    engine reports per-operator statistics.
+    """
+
+    name: str
+    """The engine-specific operator name, e.g. `SEQ_SCAN` or `Hash Join`."""
+    children: VarTuple[Self] = ()
+    """The inputs of the operator."""
+    estimated_rows: Optional[float] = None
+    """The number of output rows estimated by the planner."""
+    estimated_cost: Optional[float] = None
+    """The engine-specific cost estimated by the planner."""
+    actual_rows: Optional[int] = None
+    """The number of rows actually produced by the operator."""
+    actual_time: Optional[float] = None
+    """The time in seconds spent in the operator."""
+    details: FrozenDict[str, str] = {}
+    """Any remaining engine-specific operator attributes."""
+
+    def walk(self) -> Iterator[PlanNode]:
+        """Iterate over the nodes of the plan in depth-first pre-order."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def find(self, pattern: str) -> tuple[PlanNode, ...]:
+        """Return every node whose name matches the regular expression `pattern`."""
+        regex = re.compile(pattern, flags=re.IGNORECASE)
+        return tuple(node for node in self.walk() if regex.search(node.name))
+
+    def format(self, level: int = 0) -> str:
+        stats = [
+            f"{label}={value:g}"
+            for label, value in (
+                ("rows", self.estimated_rows),
+                ("cost", self.estimated_cost),
+                ("actual_rows", self.actual_rows),
+                ("actual_time", self.actual_time),
+            )
+            if value is not None
+        ]
+        line = "  " * level + self.name
+        if stats:
+            line += f" ({', '.join(stats)})"
+        return "\n".join([line, *(child.format(level + 1) for child in self.children)])
+
+
+@public
+class QueryPlan(Concrete):
+    """The result of explaining a query.
+
+    The `raw` attribute holds the plan exactly as the engine reported it,
+    while `root` holds the same plan normalized into a tree of
+    [`PlanNode`](#ibis.backends.explain.PlanNode)s. `root` is `None` if the
+    engine's plan output cannot be represented as a tree.
+    """
+
+    query: str
+    """The query that was explained."""
+    raw: str
+    """The plan in the engine's native textual format."""
+    root: Optional[PlanNode] = None
+    """The normalized plan tree."""
+    analyzed: bool = False
+    """Whether the query was executed to collect actual statistics."""
+    execution_time: Optional[float] = None
+    """The total time in seconds spent executing the query, if analyzed."""
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def walk(self) -> Iterator[PlanNode]:
+        """Iterate over the nodes of the normalized plan."""
+        if self.root is not None:
+            yield from self.root.walk()
+
+    def find(self, pattern: str) -> tuple[PlanNode, ...]:
+        """Return every plan node whose name matches the regular expression `pattern`."""
+        if self.root is None:
+            return ()
+        return self.root.find(pattern)
+
+    @property
+    def estimated_rows(self) -> float | None:
+        """The number of output rows estimated for the whole query."""
+        return None if self.root is None else self.root.estimated_rows
+
+    @property
+    def estimated_cost(self) -> float | None:
+        """The cost estimated for the whole query."""
+        return None if self.root is None else self.root.estimated_cost
+
+
+def to_float(value: Any) -> float | None:
+    """Convert a plan statistic to a float, returning `None` if not a number."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_DURATION_UNITS = {
+    "ns": 1e-9,
+    "µs": 1e-6,
+    "us": 1e-6,
+    "ms": 1e-3,
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+}
+
+
+def to_seconds(value: str) -> float | None:
+    """Convert a duration such as `1.5ms` to seconds, returning `None` if invalid."""
+    if (match := re.fullmatch(r"([\d.]+)\s*(ns|µs|us|ms|s|m|h)", value)) is None:
+        return None
+    number, unit = match.groups()
+    return float(number) * _DURATION_UNITS[unit]
+
+
+def to_details(values: Mapping[str, Any], *, exclude: Iterable[str] = ()) -> FrozenDict:
+    """Normalize arbitrary operator attributes into a string mapping."""
+    exclude = frozenset(exclude)
+    details = {}
+    for key, value in values.items():
+        if key in exclude or value is None or value in ("", []):
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ", ".join(map(str, value))
+        details[key] = str(value)
+    return FrozenDict(details)
+
+
+def from_edges(
+    rows: Iterable[tuple[Any, Any, PlanNode]], *, root_name: str = "QUERY PLAN"
+) -> PlanNode | None:
+    """Build a plan tree from `(id, parent_id, node)` triples.
+
+    Nodes whose parent is unknown become children of the root. If there is
+    more than one root a synthetic root named `root_name` is created.
+    """
+    nodes = {}
+    parents = {}
+    for id, parent, node in rows:
+        nodes[id] = node
+        parents[id] = parent
+
+    children = {id: [] for id in nodes}
+    roots = []
+    for id, parent in parents.items():
+        if parent in children and parent != id:
+            children[parent].append(id)
+        else:
+            roots.append(id)
+
+    def build(id):
+        node = nodes[id]
+        return node.copy(children=tuple(map(build, children[id])))
+
+    if not roots:
+        return None
+    elif len(roots) == 1:
+        return build(roots[0])
+    return PlanNode(name=root_name, children=tuple(map(build, roots)))
+
+
+def from_indented(
+    text: str,
+    *,
+    parse_line: Callable[[str], PlanNode] = lambda line: PlanNode(name=line),
+    skip: Callable[[str], bool] = lambda line: False,
+    root_name: str = "QUERY PLAN",
+) -> PlanNode | None:
+    """Build a plan tree from a textual plan where nesting is given by indentation."""
+    rows = []
+    stack = []
+    for i, line in enumerate(text.splitlines()):
+        stripped = line.strip()
+        if not stripped or skip(stripped):
+            continue
+        depth = len(line) - len(line.lstrip())
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        parent = stack[-1][1] if stack else None
+        rows.append((i, parent, parse_line(stripped)))
+        stack.append((depth, i))
+    return from_edges(rows, root_name=root_name)
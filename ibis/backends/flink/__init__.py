@@ -102,7 +102,9 @@ class Backend(
         pass
 
     def raw_sql(self, query: str) -> TableResult:
-        return self._table_env.execute_sql(query)
+        result = self._table_env.execute_sql(query)
+        self._clear_result_caches_for(query)
+        return result
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         from pyflink.table.types import create_arrow_schema
@@ -172,6 +174,7 @@ class Backend(
         """
         statement = DropDatabase(name=name, catalog=catalog, must_exist=not force)
         self.raw_sql(statement.compile())
+        self._clear_result_caches()
 
     def list_tables(
         self,
@@ -606,6 +609,7 @@ class Backend(
             temporary=temp,
         )
         self.raw_sql(statement.compile())
+        self._clear_result_caches()
 
     def rename_table(
         self,
@@ -632,6 +636,7 @@ class Backend(
         )
         sql = statement.compile()
         self.raw_sql(sql)
+        self._clear_result_caches()
 
     def create_view(
         self,
@@ -724,6 +729,7 @@ class Backend(
         else:
             raise exc.IbisError(f"Unsupported `obj` type: {type(obj)}")
 
+        self._clear_result_caches()
         return self.table(name, database=database, catalog=catalog)
 
     def drop_view(
@@ -761,6 +767,7 @@ class Backend(
         )
         sql = statement.compile()
         self.raw_sql(sql)
+        self._clear_result_caches()
 
     def _read_file(
         self,
@@ -959,18 +966,19 @@ class Backend(
             obj = pd.DataFrame.from_dict(obj)
         if isinstance(obj, pd.DataFrame):
             table = self._table_env.from_pandas(obj)
-            return table.execute_insert(identifier, overwrite=overwrite)
-
-        if isinstance(obj, list):
+        elif isinstance(obj, list):
             # pyflink infers datatypes, which may sometimes result in incompatible types
             table = self._table_env.from_elements(obj)
-            return table.execute_insert(identifier, overwrite=overwrite)
+        else:
+            raise ValueError(
+                "No operation is being performed. Either the obj parameter "
+                "is not a pandas DataFrame or is not a ibis Table."
+                f"The given obj is of type {type(obj).__name__} ."
+            )
 
-        raise ValueError(
-            "No operation is being performed. Either the obj parameter "
-            "is not a pandas DataFrame or is not a ibis Table."
-            f"The given obj is of type {type(obj).__name__} ."
-        )
+        result = table.execute_insert(identifier, overwrite=overwrite)
+        self._clear_result_caches()
+        return result
 
     def to_pyarrow(
         self,
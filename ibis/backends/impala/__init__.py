@@ -21,6 +21,7 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import HasCurrentDatabase, NoExampleLoader
+from ibis.backends.explain import QueryPlan
 from ibis.backends.impala import ddl, udf
 from ibis.backends.impala.udf import (
     aggregate_function,
@@ -240,6 +241,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
             cursor.close()
             raise
 
+        self._clear_result_caches_for(query)
         return cursor
 
     def _fetch_from_cursor(self, cursor, schema):
@@ -332,6 +334,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
             )
         statement = ddl.DropDatabase(name, must_exist=not force)
         self._safe_exec_sql(statement)
+        self._clear_result_caches()
 
     def get_schema(
         self,
@@ -420,6 +423,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
         select = self.compile(obj)
         statement = ddl.CreateView(name, select, database=database, can_exist=overwrite)
         self._safe_exec_sql(statement)
+        self._clear_result_caches()
         return self.table(name, database=database)
 
     def drop_view(
@@ -427,6 +431,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
     ) -> None:
         stmt = ddl.DropView(name, database=database, must_exist=not force)
         self._safe_exec_sql(stmt)
+        self._clear_result_caches()
 
     def create_table(
         self,
@@ -533,6 +538,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
                     tbl_properties=tbl_properties,
                 )
             )
+        self._clear_result_caches()
         return self.table(name, database=database or self.current_database)
 
     def avro_file(
@@ -801,6 +807,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
             overwrite=overwrite,
         )
         self._safe_exec_sql(statement.compile())
+        self._clear_result_caches()
 
     def drop_table(
         self, name: str, /, *, database: str | None = None, force: bool = False
@@ -824,6 +831,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
         """
         statement = ddl.DropTable(name, database=database, must_exist=not force)
         self._safe_exec_sql(statement)
+        self._clear_result_caches()
 
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         """Delete all rows from an existing table.
@@ -837,6 +845,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
         """
         statement = ddl.TruncateTable(name, database=database)
         self._safe_exec_sql(statement)
+        self._clear_result_caches()
 
     def rename_table(self, old_name: str, new_name: str) -> None:
         """Rename an existing table.
@@ -851,6 +860,7 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
         """
         statement = ddl.RenameTable(old_name, new_name)
         self._safe_exec_sql(statement)
+        self._clear_result_caches()
 
     def drop_table_or_view(
         self, name, /, *, database: str | None = None, force: bool = False
@@ -1369,26 +1379,64 @@ class Backend(SQLBackend, HasCurrentDatabase, NoExampleLoader):
         )
 
     def explain(
-        self, expr: ir.Expr | str, params: Mapping[ir.Expr, Any] | None = None
-    ) -> str:
+        self,
+        expr: ir.Expr | str,
+        /,
+        *args: Mapping[ir.Expr, Any] | None,
+        params: Mapping[ir.Expr, Any] | None = None,
+        analyze: bool = False,
+    ) -> QueryPlan:
         """Explain an expression.
 
         Return the query plan associated with the indicated expression or SQL
         query.
 
+        Parameters
+        ----------
+        expr
+            Ibis expression or SQL string to explain.
+        args
+            Deprecated, pass `params` by keyword instead.
+        params
+            Mapping of scalar parameter expressions to value.
+        analyze
+            Not supported by Impala, whose query profiles are only available
+            through the coordinator's web UI.
+
         Returns
         -------
-        str
-            Query plan
+        QueryPlan
+            Query plan. This used to be a string, which is now available as
+            `str(plan)` or `plan.raw`.
 
         """
-        query = self.compile(expr, params=params)
+        if args:
+            util.warn_deprecated(
+                "explain(expr, params)",
+                as_of="12.0",
+                instead="pass `params` as a keyword argument instead.",
+            )
+            if len(args) > 1 or params is not None:
+                raise TypeError(
+                    "explain() got too many values for the `params` argument"
+                )
+            (params,) = args
+
+        if analyze:
+            raise com.UnsupportedOperationError(
+                "Impala does not support analyzing query plans"
+            )
+
+        query = expr if isinstance(expr, str) else self.compile(expr, params=params)
         statement = f"EXPLAIN {query}"
 
         with self._safe_raw_sql(statement) as cur:
             results = fetchall(cur)
 
-        return "\n".join(["Query:", util.indent(query, 2), "", *results.iloc[:, 0]])
+        return QueryPlan(
+            query=query,
+            raw="\n".join(["Query:", util.indent(query, 2), "", *results.iloc[:, 0]]),
+        )
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         schema = op.schema
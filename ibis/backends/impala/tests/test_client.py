@@ -9,6 +9,7 @@ import pytest
 import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
+from ibis.backends.explain import QueryPlan
 from ibis.tests.util import assert_equal
 
 pytest.importorskip("impala")
@@ -44,7 +45,18 @@ def test_explain(con):
     t = con.table("functional_alltypes")
     expr = t.group_by("string_col").size()
     result = con.explain(expr)
-    assert isinstance(result, str)
+    assert isinstance(result, QueryPlan)
+    assert str(result).startswith("Query:")
+
+
+def test_explain_positional_params(con):
+    t = con.table("functional_alltypes")
+    value = ibis.param("int32")
+    expr = t.filter(t.int_col > value).count()
+
+    with pytest.warns(FutureWarning, match="keyword argument"):
+        result = con.explain(expr, {value: 1})
+    assert str(result) == str(con.explain(expr, params={value: 1}))
 
 
 def test_get_schema(con, test_data_db):
@@ -10,6 +10,7 @@ from sqlglot import expressions as sge
 
 import ibis
 import ibis.expr.operations as ops
+from ibis.backends.explain import QueryPlan
 from ibis.backends.materialize.api import mz_now, mz_top_k
 from ibis.backends.postgres import Backend as PostgresBackend
 from ibis.backends.sql.compilers.materialize import MaterializeCompiler
@@ -124,6 +125,12 @@ class Backend(PostgresBackend):
         """
         return "mz_temp"
 
+    def _list_connection_local_tables(self) -> frozenset[str]:
+        # there's no pg_my_temp_schema(), run every query on this connection
+        raise NotImplementedError(
+            f"{self.name} backend can't list its connection-local tables"
+        )
+
     @property
     def version(self):
         """Get Materialize version.
@@ -362,6 +369,23 @@ class Backend(PostgresBackend):
                         copy.write(data)
             con.commit()
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        """Explain `query` using Materialize's textual optimized plan.
+
+        Materialize's plans describe dataflows rather than operator trees with
+        cost estimates, so only the raw plan is returned.
+        """
+        import ibis.common.exceptions as exc
+
+        if analyze:
+            raise exc.UnsupportedOperationError(
+                f"{self.name} cannot analyze ad-hoc queries"
+            )
+
+        with self._safe_raw_sql(f"EXPLAIN {query}") as cur:
+            [(raw,)] = cur.fetchall()
+        return QueryPlan(query=query, raw=raw)
+
     def get_schema(
         self, name: str, *, catalog: str | None = None, database: str | None = None
     ):
@@ -539,6 +563,8 @@ ORDER BY a.attnum ASC"""  # noqa: S608
                 cursor.execute(rename_stmt)
             con.commit()
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
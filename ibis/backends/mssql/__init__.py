@@ -451,6 +451,7 @@ class Backend(
         cursor = con.cursor()
 
         cursor.execute(query, **kwargs)
+        self._clear_result_caches_for(query)
         return cursor
 
     def create_catalog(self, name: str, /, *, force: bool = False) -> None:
@@ -484,6 +485,7 @@ GO"""
             )
         ):
             pass
+        self._clear_result_caches()
 
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
@@ -559,6 +561,7 @@ GO"""
                         self.dialect
                     )
                 )
+        self._clear_result_caches()
 
     def list_tables(
         self, *, like: str | None = None, database: tuple[str, str] | str | None = None
@@ -735,6 +738,8 @@ GO"""
             catalog = "tempdb"
             db = "dbo"
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=(catalog, db))
 
@@ -765,13 +770,10 @@ GO"""
             ),
         )
 
-        df = op.data.to_frame()
-        data = df.itertuples(index=False)
-
-        insert_stmt = self._build_insert_template(name, schema=schema, columns=True)
         with self._safe_ddl(create_stmt) as cur:
-            if not df.empty:
-                cur.executemany(insert_stmt, data)
+            # bind parameters as arrays instead of one round trip per row
+            cur.fast_executemany = True
+            self._insert_in_memory_table(cur, op)
 
     def _cursor_batches(
         self,
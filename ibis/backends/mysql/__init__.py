@@ -246,6 +246,7 @@ class Backend(
         ).sql(self.name)
         with self.begin() as cur:
             cur.execute(sql)
+        self._clear_result_caches()
 
     @contextlib.contextmanager
     def begin(self):
@@ -297,6 +298,7 @@ class Backend(
         else:
             if not autocommit:
                 con.commit()
+            self._clear_result_caches_for(query)
             return cursor
 
     # TODO: disable positional arguments
@@ -444,6 +446,8 @@ class Backend(
                     ).sql(dialect)
                 )
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -474,19 +478,11 @@ class Backend(
         )
         create_stmt_sql = create_stmt.sql(dialect)
 
-        df = op.data.to_frame()
-        # nan can not be used with MySQL
-        df = df.replace(float("nan"), None)
-
-        data = df.itertuples(index=False)
-        sql = self._build_insert_template(
-            name, schema=schema, columns=True, placeholder="%s"
-        )
         with self.begin() as cur:
             cur.execute(create_stmt_sql)
-
-            if not df.empty:
-                cur.executemany(sql, data)
+            # MySQLdb rewrites executemany on an INSERT into multi-row VALUES
+            # statements bounded by the maximum statement length
+            self._insert_in_memory_table(cur, op, placeholder="%s")
 
     @util.experimental
     def to_pyarrow_batches(
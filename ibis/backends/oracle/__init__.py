@@ -283,6 +283,7 @@ class Backend(
             raise
         else:
             con.commit()
+            self._clear_result_caches_for(query)
             return cursor
 
     def list_tables(
@@ -468,6 +469,8 @@ class Backend(
                     f"ALTER TABLE IF EXISTS {initial_table.sql(self.name)} RENAME TO {final_table.sql(self.name)}"
                 )
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -500,6 +503,7 @@ class Backend(
                 bind.execute(f"TRUNCATE TABLE {table.sql(self.name)}")
 
         super().drop_table(name, database=(catalog, db), force=force)
+        self._clear_result_caches()
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         schema = op.schema
@@ -520,16 +524,12 @@ class Backend(
             properties=sge.Properties(expressions=[sge.TemporaryProperty()]),
         ).sql(self.name)
 
-        data = op.data.to_frame().replace(float("nan"), None)
-        insert_stmt = self._build_insert_template(
-            name, schema=schema, placeholder=":{i:d}"
-        )
         with self.begin() as cur:
             cur.execute(create_stmt)
-            for start, end in util.chunks(len(data), chunk_size=128):
-                cur.executemany(
-                    insert_stmt, list(data.iloc[start:end].itertuples(index=False))
-                )
+            # each executemany call is a single array DML round trip
+            self._insert_in_memory_table(
+                cur, op, columns=False, placeholder=":{i:d}", chunk_size=10_000
+            )
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name("oracle_metadata")
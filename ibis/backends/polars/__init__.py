@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import collections
+import contextlib
+import re
+import threading
+import weakref
 from collections.abc import Iterable, Mapping
 from functools import lru_cache
 from pathlib import Path
@@ -13,6 +18,7 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends import BaseBackend, DirectExampleLoader, NoUrl, SupportsTempTables
+from ibis.backends.explain import PlanNode, QueryPlan, from_indented
 from ibis.backends.polars.compiler import translate
 from ibis.backends.polars.rewrites import bind_unbound_table, rewrite_join
 from ibis.backends.sql.dialects import Polars
@@ -27,6 +33,9 @@ if TYPE_CHECKING:
     import pandas as pd
     import pyarrow as pa
 
+# the maximum number of translated expressions kept by each backend
+_COMPILE_CACHE_SIZE = 128
+
 
 class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
     name = "polars"
@@ -37,6 +46,14 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
         super().__init__(*args, **kwargs)
         self._tables = dict()
         self._context = pl.SQLContext()
+        # translated plans, keyed by a weak reference to the root operation
+        # and the parameters
+        self._compiled = collections.OrderedDict()
+        self._compiled_lock = threading.Lock()
+        # keys of plans whose expressions were garbage collected; the weakref
+        # callbacks may run while the lock is held, so they only record the
+        # key and the plans are dropped the next time the cache is used
+        self._forgotten = []
 
     def do_connect(
         self, tables: Mapping[str, pl.LazyFrame | pl.DataFrame] | None = None
@@ -80,6 +97,26 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
     def disconnect(self) -> None:
         pass
 
+    def _connect_worker(self) -> Backend:
+        # polars releases the GIL while collecting, so queries can run
+        # concurrently against the same tables
+        return self
+
+    def _precompile(
+        self,
+        exprs: list[ir.Expr],
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+    ) -> list[None]:
+        # translated plans are cached, so executing the expressions reuses them
+        for expr in exprs:
+            # an expression that fails to compile raises again when executed
+            with contextlib.suppress(Exception):
+                self.compile(expr, params=params)
+        return [None] * len(exprs)
+
     @property
     def version(self) -> str:
         return pl.__version__
@@ -109,9 +146,25 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
     def _add_table(self, name: str, obj: pl.LazyFrame | pl.DataFrame) -> None:
         if isinstance(obj, pl.DataFrame):
             obj = obj.lazy()
+        if name in self._tables:
+            self._evict_compiled(name)
         self._tables[name] = obj
         self._context.register(name, obj)
 
+    def _evict_compiled(self, name: str) -> None:
+        """Drop the cached plans that read the table `name`."""
+        with self._compiled_lock:
+            self._drop_forgotten()
+            for key in [
+                key for key, (_, refs) in self._compiled.items() if name in refs
+            ]:
+                del self._compiled[key]
+
+    def _drop_forgotten(self) -> None:
+        """Drop the plans of collected expressions, with the lock held."""
+        while self._forgotten:
+            self._compiled.pop(self._forgotten.pop(), None)
+
     def sql(
         self,
         query: str,
@@ -170,6 +223,7 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
             table = pl.read_csv(source_list, **kwargs)
 
         self._add_table(table_name, table)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_json(
@@ -201,6 +255,7 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
         except pl.exceptions.ComputeError:
             # handles compressed json files
             self._add_table(table_name, pl.read_ndjson(path, **kwargs))
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_delta(
@@ -236,6 +291,7 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
         path = normalize_filename(path)
         table_name = table_name or gen_name("read_delta")
         self._add_table(table_name, pl.scan_delta(path, **kwargs))
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_pandas(
@@ -311,6 +367,7 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
             path = normalize_filename(path)
             self._add_table(table_name, pl.scan_parquet(path, **kwargs))
 
+        self._clear_result_caches()
         return self.table(table_name)
 
     def create_table(
@@ -355,6 +412,7 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
         else:
             _read_in_memory(obj, name, self)
 
+        self._clear_result_caches()
         return self.table(name)
 
     def create_view(
@@ -372,10 +430,12 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
 
     def drop_table(self, name: str, /, *, force: bool = False) -> None:
         if name in self._tables:
+            self._evict_compiled(name)
             del self._tables[name]
             self._context.unregister(name)
         elif not force:
             raise com.IbisError(f"Table {name!r} does not exist")
+        self._clear_result_caches()
 
     def drop_view(self, name: str, /, *, force: bool = False) -> None:
         self.drop_table(name, force=force)
@@ -418,12 +478,94 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
             params = {param.op(): value for param, value in params.items()}
 
         node = expr.as_table().op()
-        node = node.replace(
-            rewrite_join | replace_parameter | bind_unbound_table | lower_stringslice,
-            context={"params": params, "backend": self},
+        key = _compile_cache_key(expr.op(), params)
+        if key is not None and (lf := self._lookup_compiled(key)) is not None:
+            return lf
+
+        lf = translate(
+            node.replace(
+                rewrite_join
+                | replace_parameter
+                | bind_unbound_table
+                | lower_stringslice,
+                context={"params": params, "backend": self},
+            ),
+            ctx=self._context,
         )
 
-        return translate(node, ctx=self._context)
+        if key is not None:
+            self._cache_compiled(key, node, lf)
+
+        return lf
+
+    def _lookup_compiled(self, key) -> pl.LazyFrame | None:
+        with self._compiled_lock:
+            self._drop_forgotten()
+            try:
+                lf, refs = self._compiled[key]
+            except KeyError:
+                return None
+            # the plan captured the tables that were registered when it was
+            # translated, so it's only valid if none have been replaced
+            if all(self._tables.get(name) is ref() for name, ref in refs.items()):
+                self._compiled.move_to_end(key)
+                return lf
+            del self._compiled[key]
+            return None
+
+    def _cache_compiled(self, key, node: ops.Relation, lf: pl.LazyFrame) -> None:
+        forgotten = self._forgotten
+        op, values = key
+
+        def forget(ref):
+            # the expression was garbage collected, so its plan can't be
+            # looked up anymore
+            forgotten.append((ref, values))
+
+        tables = node.find((ops.DatabaseTable, ops.InMemoryTable, ops.UnboundTable))
+        refs = {
+            table.name: weakref.ref(self._tables[table.name])
+            for table in tables
+            if table.name in self._tables
+        }
+        with self._compiled_lock:
+            self._drop_forgotten()
+            self._compiled[weakref.ref(op(), forget), values] = lf, refs
+            while len(self._compiled) > _COMPILE_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+
+    def explain(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Expr, object] | None = None,
+        analyze: bool = False,
+    ) -> QueryPlan:
+        lf = self.compile(expr, params=params)
+        raw = lf.explain()
+        root = from_indented(
+            raw,
+            parse_line=_to_plan_node,
+            skip=_is_plan_continuation,
+        )
+
+        execution_time = None
+        if analyze:
+            df, timings = lf.profile()
+            # polars reports profiling timings in microseconds
+            execution_time = timings["end"].max() / 1e6
+            raw = f"{raw}\n\n{timings}"
+            if root is not None:
+                root = root.copy(actual_rows=df.height)
+
+        return QueryPlan(
+            query=lf.explain(optimized=False),
+            raw=raw,
+            root=root,
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
 
     def _get_sql_string_view_schema(
         self, *, name: str, table: ir.Table, query: str
@@ -447,7 +589,9 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
     ) -> pl.DataFrame:
         self._run_pre_execute_hooks(expr)
         table_expr = expr.as_table()
-        lf = self.compile(table_expr, params=params, **kwargs)
+        # compile the expression itself, whose plan can be cached for as long
+        # as it's alive, unlike the temporary table
+        lf = self.compile(expr, params=params, **kwargs)
         if limit == "default":
             limit = ibis.options.sql.default_limit
         if limit is not None:
@@ -544,12 +688,52 @@ class Backend(SupportsTempTables, BaseBackend, NoUrl, DirectExampleLoader):
         return table.to_reader(chunk_size)
 
     def _create_cached_table(self, name, expr):
-        return self.create_table(name, self.compile(expr).cache())
+        return self.create_table(name, self.compile(expr).collect())
+
+    def _cached_table_nbytes(self, table):
+        return self._tables[table.op().name].collect().estimated_size()
 
     def _drop_cached_table(self, name):
         self.drop_table(name, force=True)
 
 
+def _compile_cache_key(node: ops.Node, params: Mapping[ops.Value, Any]):
+    """Return the key of the compiled `node`, or `None` if it can't be cached."""
+    # impure values are evaluated during translation, and SQL strings may read
+    # any table, so their plans can't be reused
+    if node.find((ops.Impure, ops.SQLStringView)):
+        return None
+    try:
+        values = frozenset((op, type(value), value) for op, value in params.items())
+    except TypeError:
+        return None
+    # a weak reference compares equal to references to equal nodes, without
+    # keeping the node and the tables it reads alive
+    return weakref.ref(node), values
+
+
+def _is_plan_continuation(line: str) -> bool:
+    # lines that delimit or annotate the inputs of an operator rather than
+    # describe an operator themselves
+    return (
+        line == "FROM"
+        or line.startswith(("[", "END "))
+        or " PLAN ON:" in line
+        or re.fullmatch(r"PLAN \d+:", line) is not None
+    )
+
+
+def _to_plan_node(line: str) -> PlanNode:
+    if line.startswith(prefix := "simple π"):
+        name = "SIMPLE_PROJECTION"
+    elif (match := re.match(r"[A-Z_]+(?: [A-Z_]+)*", line)) is not None:
+        name = prefix = match.group()
+    else:
+        name = prefix = line.split(" ", 1)[0]
+    rest = line[len(prefix) :].lstrip(": ").strip()
+    return PlanNode(name=name, details={"info": rest} if rest else {})
+
+
 @lazy_singledispatch
 def _read_in_memory(source: Any, table_name: str, _conn: Backend, **kwargs: Any):
     raise NotImplementedError(
@@ -14,6 +14,7 @@ import sqlglot as sg
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+from ibis.backends import sketches
 from ibis.backends.polars.rewrites import PandasAsofJoin, PandasJoin, PandasRename
 from ibis.backends.sql.compilers.base import STAR
 from ibis.backends.sql.dialects import Polars
@@ -855,6 +856,53 @@ def execute_quantile(op, **kw):
     return arg.filter(filt).quantile(quantile, interpolation="linear")
 
 
+_sketch_reductions = {
+    ops.HLLSketch: sketches.hll_sketch,
+    ops.HLLMerge: sketches.hll_merge,
+    ops.TDigestSketch: sketches.tdigest_sketch,
+    ops.TDigestMerge: sketches.tdigest_merge,
+}
+
+
+def execute_sketch_reduction(op, **kw):
+    arg = translate(op.arg, **kw)
+
+    if op.where is not None:
+        arg = arg.filter(translate(op.where, **kw))
+
+    func = _sketch_reductions[type(op)]
+    return arg.map_batches(
+        lambda s: func(s.to_arrow()), return_dtype=pl.Binary, returns_scalar=True
+    )
+
+
+for cls in _sketch_reductions:
+    translate.register(cls, execute_sketch_reduction)
+
+
+@translate.register(ops.HLLEstimate)
+def execute_hll_estimate(op, **kw):
+    arg = translate(op.arg, **kw)
+    return arg.map_elements(sketches.hll_estimate, return_dtype=pl.Int64)
+
+
+@translate.register(ops.TDigestQuantile)
+def execute_tdigest_quantile(op, **kw):
+    def quantiles(args):
+        sketch, quantile = args
+        if len(quantile) == 1:
+            quantile = quantile.extend_constant(quantile[0], len(sketch) - 1)
+        return pl.from_arrow(
+            sketches.tdigest_quantiles(sketch.to_arrow(), quantile.to_arrow())
+        )
+
+    return pl.map_batches(
+        [translate(op.arg, **kw), translate(op.quantile, **kw)],
+        quantiles,
+        return_dtype=pl.Float64,
+    )
+
+
 @translate.register(ops.Correlation)
 def correlation(op, **kw):
     x = op.left
@@ -906,6 +954,348 @@ def count_star(op, **kw):
     return result.cast(PolarsType.from_ibis(op.dtype))
 
 
+@translate.register(ops.ApproxCountStar)
+def approx_count_star(op, **kw):
+    # polars has no catalog statistics to estimate from
+    return pl.len().cast(PolarsType.from_ibis(op.dtype))
+
+
+def _ascending_sort_keys(order_by, keys):
+    """Encode sort keys of any direction as ascending keys with nulls first."""
+    result = []
+    for i, (key, expr) in enumerate(zip(order_by, keys)):
+        # order nulls by a separate flag, which is never null itself
+        nulls = expr.is_not_null() if key.nulls_first else expr.is_null()
+        value = expr.rank("dense", descending=True) if key.descending else expr
+        # the keys become fields of a struct, so their names must be unique
+        result.extend((nulls.alias(f"nulls{i}"), value.alias(f"value{i}")))
+    return result
+
+
+def _window_order_by(order_by, **kw):
+    """Translate the sort keys of a window to the `order_by` arguments of `over`."""
+    keys = [translate(key.arg, **kw) for key in order_by]
+    directions = {(key.descending, key.nulls_first) for key in order_by}
+    if len(directions) > 1:
+        # `over` accepts a single direction for all of the keys
+        return _ascending_sort_keys(order_by, keys), {}
+    elif directions:
+        ((descending, nulls_first),) = directions
+        return keys, {"descending": descending, "nulls_last": not nulls_first}
+    return [], {}
+
+
+def _window_rank_key(order_by, **kw):
+    """Return a single expression whose rank is the rank of the window's rows."""
+    if not order_by:
+        # every row is a peer of every other row
+        return pl.repeat(0, pl.len())
+    keys = [translate(key.arg, **kw) for key in order_by]
+    return pl.struct(_ascending_sort_keys(order_by, keys))
+
+
+@singledispatch
+def analytic(op, **_):
+    raise com.OperationNotDefinedError(f"No translation rule for {type(op)}")
+
+
+@analytic.register(ops.RowNumber)
+def row_number(op, **_):
+    return pl.int_range(pl.len(), dtype=pl.Int64)
+
+
+@analytic.register(ops.MinRank)
+@analytic.register(ops.DenseRank)
+def rank(op, *, order_by, **kw):
+    method = "min" if isinstance(op, ops.MinRank) else "dense"
+    return _window_rank_key(order_by, **kw).rank(method) - 1
+
+
+@analytic.register(ops.PercentRank)
+def percent_rank(op, *, order_by, **kw):
+    rank = _window_rank_key(order_by, **kw).rank("min") - 1
+    return pl.when(pl.len() > 1).then(rank / (pl.len() - 1)).otherwise(0.0)
+
+
+@analytic.register(ops.CumeDist)
+def cume_dist(op, *, order_by, **kw):
+    return _window_rank_key(order_by, **kw).rank("max") / pl.len()
+
+
+@analytic.register(ops.NTile)
+def ntile(op, **kw):
+    buckets = translate(op.buckets, **kw)
+    index = pl.int_range(pl.len(), dtype=pl.Int64)
+    # the first `remainder` buckets get one more row than the others
+    size = pl.len() // buckets
+    remainder = pl.len() % buckets
+    threshold = remainder * (size + 1)
+    return (
+        pl.when(index < threshold)
+        .then(index // (size + 1))
+        .otherwise(remainder + (index - threshold) // size)
+    )
+
+
+@analytic.register(ops.Lag)
+@analytic.register(ops.Lead)
+def shift(op, **kw):
+    arg = translate(op.arg, **kw)
+    if op.offset is not None and op.offset.dtype.is_interval():
+        raise com.UnsupportedOperationError(
+            "Polars doesn't support interval offsets in lag and lead"
+        )
+    offset = 1 if op.offset is None else translate(op.offset, **kw)
+    if isinstance(op, ops.Lead):
+        offset = -offset
+    default = None if op.default is None else translate(op.default, **kw)
+    return arg.shift(offset, fill_value=default)
+
+
+def _trailing(arg, how, size, lag):
+    """Aggregate the `size` rows ending `lag` rows before the current row.
+
+    A `size` of `None` aggregates every row from the start of the partition.
+    """
+    if size is None:
+        # cumulative functions leave nulls as is, instead of carrying the
+        # aggregate of the preceding rows forward
+        result = getattr(arg, f"cum_{how}")().forward_fill()
+    else:
+        result = getattr(arg, f"rolling_{how}")(size, min_samples=1)
+    return result.shift(lag) if lag else result
+
+
+def _leading(arg, how, size, lead):
+    """Aggregate the `size` rows starting `lead` rows after the current row."""
+    return _trailing(arg.reverse(), how, size, lead).reverse()
+
+
+def _frame_aggregate(arg, how, start, end):
+    """Aggregate the rows between `start` and `end`, relative to the current row."""
+    if end is not None and end <= 0:
+        size = None if start is None else end - start + 1
+        return _trailing(arg, how, size, -end)
+    elif start is not None and start >= 0:
+        size = None if end is None else end - start + 1
+        return _leading(arg, how, size, start)
+
+    # the frame spans the current row: combine the rows up to and including
+    # the current row with the rows that follow it
+    before = _trailing(arg, how, None if start is None else 1 - start, 0)
+    after = _leading(arg, how, end, 1)
+    if how == "sum":
+        return (
+            pl.when(before.is_null() & after.is_null())
+            .then(None)
+            .otherwise(pl.sum_horizontal(before, after))
+        )
+    return getattr(pl, f"{how}_horizontal")(before, after)
+
+
+def _frame_bound(bound):
+    if bound is None:
+        return None
+    value = _literal_value(bound.value)
+    return -value if bound.preceding else value
+
+
+_polars_duration_units = {
+    "Y": "y",
+    "Q": "q",
+    "M": "mo",
+    "W": "w",
+    "D": "d",
+    "h": "h",
+    "m": "m",
+    "s": "s",
+    "ms": "ms",
+    "us": "us",
+    "ns": "ns",
+}
+
+
+def _range_window_size(bound):
+    """Return the polars window size of a RANGE frame starting at `bound`."""
+    value = _literal_value(bound.value)
+    dtype = bound.value.dtype
+    if dtype.is_interval():
+        return f"{value}{_polars_duration_units[dtype.unit.short]}"
+    return f"{value}i"
+
+
+def _is_current_row(bound):
+    if bound is None:
+        return False
+    value = bound.value
+    if isinstance(value, ops.Cast):
+        value = value.arg
+    return isinstance(value, ops.Literal) and not value.value
+
+
+def _range_reduction(op, arg, **kw):
+    """Translate a reduction over a RANGE frame ending at the current row."""
+    func = op.func
+    if (
+        op.start is None
+        or not op.start.preceding
+        or not _is_current_row(op.end)
+        or len(op.order_by) != 1
+        or not isinstance(func, (ops.Count, ops.Mean, ops.Sum, ops.Min, ops.Max))
+    ):
+        raise com.UnsupportedOperationError(
+            "Polars backend only supports RANGE window frames over a single "
+            "sort key that end at the current row"
+        )
+
+    by = translate(op.order_by[0].arg, **kw)
+    size = _range_window_size(op.start)
+
+    def rolling(arg, how):
+        return getattr(arg, f"rolling_{how}_by")(by, size, closed="both")
+
+    count = rolling(arg.is_not_null().cast(pl.Int64), "sum").fill_null(0)
+    if isinstance(func, ops.Count):
+        return count
+
+    # polars doesn't support rolling windows over values with nulls, so nulls
+    # are replaced by a value that doesn't change the aggregate of the other
+    # values, and frames without any non-null value are set to null
+    if func.arg.dtype.is_boolean():
+        arg = arg.cast(pl.Int8)
+    if isinstance(func, (ops.Sum, ops.Mean)):
+        result = rolling(arg.fill_null(0), "sum")
+        if isinstance(func, ops.Mean):
+            result = result / count
+    else:
+        how = type(func).__name__.lower()
+        # the largest value of the partition is never smaller than the minimum
+        # of the non-null values of a frame, and vice versa
+        fill = arg.max() if how == "min" else arg.min()
+        result = rolling(arg.fill_null(fill).fill_null(0), how)
+    return pl.when(count > 0).then(result)
+
+
+def _nth_value(op, **kw):
+    """Translate the nth value of a window frame."""
+    func = op.func
+    if op.how == "range" and (op.start is not None or op.end is not None):
+        raise com.UnsupportedOperationError(
+            "Polars backend doesn't support nth_value over bounded RANGE window frames"
+        )
+
+    arg = translate(func.arg, **kw)
+    index = pl.int_range(pl.len(), dtype=pl.Int64)
+    start = _frame_bound(op.start)
+    end = _frame_bound(op.end)
+    first = 0 if start is None else pl.max_horizontal(index + start, 0)
+    last = pl.len() - 1 if end is None else pl.min_horizontal(index + end, pl.len() - 1)
+    position = first + translate(func.nth, **kw)
+    position = pl.when(position <= last).then(position)
+    if start is None and end is None:
+        # the position is the same for every row, broadcast its value
+        return arg.get(position)
+    return arg.gather(position)
+
+
+_frame_reductions = (
+    ops.All,
+    ops.Any,
+    ops.Count,
+    ops.CountStar,
+    ops.First,
+    ops.Last,
+    ops.Max,
+    ops.Mean,
+    ops.Min,
+    ops.Sum,
+)
+
+
+def _window_reduction(op, **kw):
+    """Translate a reduction over a window frame."""
+    func = op.func
+    if op.start is None and op.end is None:
+        return translate(func, **kw)
+    elif not isinstance(func, _frame_reductions) or getattr(func, "order_by", None):
+        raise com.OperationNotDefinedError(
+            f"No translation rule for {type(func)} over bounded window frames"
+        )
+
+    if isinstance(func, ops.CountStar):
+        arg = pl.repeat(True, pl.len())
+    else:
+        arg = translate(func.arg, **kw)
+
+    where = None if func.where is None else translate(func.where, **kw)
+
+    if op.how == "range":
+        if where is not None:
+            arg = pl.when(where).then(arg)
+        return _range_reduction(op, arg, **kw)
+
+    start = _frame_bound(op.start)
+    end = _frame_bound(op.end)
+
+    if isinstance(func, (ops.First, ops.Last)):
+        # find the position of the first or last row in the frame, then look
+        # up the value at that position
+        position = pl.int_range(pl.len(), dtype=pl.Int64)
+        keep = where
+        if not func.include_null:
+            keep = arg.is_not_null() if keep is None else keep & arg.is_not_null()
+        if keep is not None:
+            position = pl.when(keep).then(position)
+        how = "min" if isinstance(func, ops.First) else "max"
+        return arg.gather(_frame_aggregate(position, how, start, end))
+
+    if not isinstance(func, ops.CountStar) and func.arg.dtype.is_boolean():
+        arg = arg.cast(pl.Int8)
+    if where is not None:
+        arg = pl.when(where).then(arg)
+
+    def count():
+        counts = _frame_aggregate(arg.is_not_null().cast(pl.Int64), "sum", start, end)
+        return counts.fill_null(0)
+
+    if isinstance(func, (ops.Count, ops.CountStar)):
+        return count()
+    elif isinstance(func, ops.Mean):
+        return _frame_aggregate(arg, "sum", start, end) / count()
+    elif isinstance(func, (ops.Sum, ops.Min, ops.Max)):
+        return _frame_aggregate(arg, type(func).__name__.lower(), start, end)
+    else:
+        how = "max" if isinstance(func, ops.Any) else "min"
+        return _frame_aggregate(arg, how, start, end)
+
+
+@translate.register(ops.WindowFunction)
+def window_function(op, **kw):
+    func = op.func
+    group_by = [translate(key, **kw) for key in op.group_by]
+    # constant sort keys don't affect the order of the rows
+    sort_keys = [key for key in op.order_by if not isinstance(key.arg, ops.Literal)]
+
+    if isinstance(func, ops.NthValue):
+        expr = _nth_value(op, **kw)
+    elif isinstance(func, ops.Analytic):
+        expr = analytic(func, order_by=sort_keys, **kw)
+    else:
+        expr = _window_reduction(op, **kw)
+
+    if isinstance(func, (ops.MinRank, ops.DenseRank, ops.PercentRank, ops.CumeDist)):
+        # ranks are computed from the sort keys, rows don't have to be sorted
+        order_by, options = [], {}
+    else:
+        order_by, options = _window_order_by(sort_keys, **kw)
+
+    # without partition keys the window spans a single partition, which also
+    # broadcasts aggregates to every row
+    expr = expr.over(group_by or pl.lit(0), order_by=order_by or None, **options)
+
+    return expr.cast(PolarsType.from_ibis(op.dtype))
+
+
 @translate.register(ops.TimestampNow)
 def timestamp_now(op, **_):
     return pl.lit(datetime.datetime.now())
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures
+import gc
+
 import polars as pl
 import polars.testing
 import pytest
@@ -82,3 +85,164 @@ def test_compile_with_memtable(con):
     t = ibis.memtable({"a": [1, 2, 3], "b": [4, 5, 6]})
     result = con.compile(t)
     assert isinstance(result, pl.LazyFrame)
+
+
+def test_sketches(con):
+    t = ibis.memtable(
+        {
+            "day": [1, 1, 1, 2, 2, 3],
+            "user": ["a", "b", "a", "b", "c", None],
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, None],
+        }
+    )
+    daily = t.group_by("day").agg(
+        users=t.user.hll_sketch(), x=t.x.tdigest_sketch(where=t.x > 1)
+    )
+
+    result = con.execute(
+        daily.mutate(
+            users=daily.users.hll_estimate(), median=daily.x.tdigest_quantile(0.5)
+        ).order_by("day")
+    )
+    assert result.users.tolist() == [2, 2, 0]
+    assert result["median"].tolist()[:2] == [2.5, 4.5]
+    assert pd.isna(result["median"].iat[2])
+
+    rollup = daily.aggregate(
+        users=daily.users.hll_merge().hll_estimate(),
+        lo=daily.x.tdigest_merge().tdigest_quantile(0),
+        hi=daily.x.tdigest_merge().tdigest_quantile(1),
+    )
+    assert con.execute(rollup).iloc[0].tolist() == [3, 2.0, 5.0]
+
+
+def test_pivot_names_cache_is_bounded(con, mocker, monkeypatch):
+    monkeypatch.setattr(ibis.expr.types.relations, "_PIVOT_NAMES_CACHE_SIZE", 2)
+    con.clear_pivot_names_cache()
+    tables = [
+        con.create_table(
+            gen_name("pivot"), pd.DataFrame({"name": [f"n{i}"], "value": [i]})
+        )
+        for i in range(3)
+    ]
+    spy = mocker.spy(con, "execute")
+
+    for t in tables:
+        t.pivot_wider()
+    assert [key[0] for key in con._pivot_names_cache] == [t.op() for t in tables[1:]]
+
+    # the least recently used table is evicted
+    tables[1].pivot_wider()
+    tables[0].pivot_wider()
+    assert spy.call_count == 4
+    assert [key[0] for key in con._pivot_names_cache] == [
+        tables[1].op(),
+        tables[0].op(),
+    ]
+
+
+def test_window_mixed_sort_directions(con):
+    t = ibis.memtable(
+        {
+            "g": ["a", "a", "a", "a", "b", "b"],
+            "k": [1, 2, 2, None, 1, 1],
+            "x": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            "id": [0, 1, 2, 3, 4, 5],
+        }
+    )
+    order_by = [ibis.desc("k", nulls_first=True), "id"]
+    w = ibis.window(group_by="g", order_by=order_by, preceding=1, following=1)
+    expr = t.mutate(
+        total=t.x.sum().over(w),
+        n=t.x.count().over(w),
+        first=t.x.first().over(w),
+        rank=ibis.rank().over(group_by="g", order_by=order_by),
+        second=t.x.nth(1).over(group_by="g", order_by=order_by),
+    ).order_by("id")
+
+    result = con.execute(expr)
+    # rows of group "a" in window order are ids 3, 1, 2, 0
+    assert result.total.tolist() == [1.0, 6.0, 3.0, 6.0, 11.0, 11.0]
+    assert result.n.tolist() == [1, 2, 2, 2, 2, 2]
+    assert result["first"].tolist() == [1.0, 4.0, 2.0, 4.0, 5.0, 5.0]
+    assert result["rank"].tolist() == [3, 1, 2, 0, 0, 1]
+    assert result.second.tolist() == [2.0, 2.0, 2.0, 2.0, 6.0, 6.0]
+
+
+def test_range_window_with_nulls(con):
+    t = ibis.memtable(
+        {"k": [1, 2, 3, 4, 5], "x": [1.0, None, 3.0, 4.0, None], "y": [None] * 5},
+        schema={"k": "int64", "x": "float64", "y": "float64"},
+    )
+    w = ibis.window(order_by="k", range=(-1, 0))
+    expr = t.mutate(
+        total=t.x.sum().over(w),
+        mean=t.x.mean().over(w),
+        lowest=t.x.min().over(w),
+        highest=t.x.max().over(w),
+        n=t.x.count().over(w),
+        missing=t.y.sum().over(w),
+    ).order_by("k")
+
+    result = con.execute(expr)
+    assert result.total.tolist() == [1.0, 1.0, 3.0, 7.0, 4.0]
+    assert result["mean"].tolist() == [1.0, 1.0, 3.0, 3.5, 4.0]
+    assert result.lowest.tolist() == [1.0, 1.0, 3.0, 3.0, 4.0]
+    assert result.highest.tolist() == [1.0, 1.0, 3.0, 4.0, 4.0]
+    assert result.n.tolist() == [1, 1, 1, 2, 1]
+    assert result.missing.isna().all()
+
+
+def test_compile_is_cached(con):
+    t = con.create_table(gen_name("compile_cache"), pl.DataFrame({"a": [1, 2, 3]}))
+    name = t.get_name()
+    expr = t.filter(t.a > 1)
+    lf = con.compile(expr)
+    assert con.compile(expr) is lf
+
+    # replacing the table invalidates the plans that read it
+    con.create_table(name, pl.DataFrame({"a": [4, 5]}), overwrite=True)
+    assert con.compile(expr) is not lf
+    assert con.execute(expr.a.sum()) == 9
+
+    # tables replaced without going through the backend are detected too
+    con._tables[name] = pl.LazyFrame({"a": [6]})
+    assert con.execute(expr.a.sum()) == 6
+
+    con.drop_table(name)
+
+
+def test_compile_cache_threads(con):
+    t = con.create_table(gen_name("compile_cache"), pl.DataFrame({"a": [1, 2, 3]}))
+    name = t.get_name()
+
+    def work(i):
+        for j in range(30):
+            if j % 10 == i % 10:
+                # replacing the table evicts the plans that read it
+                con.create_table(name, pl.DataFrame({"a": [1, 2, 3]}), overwrite=True)
+            # the expressions are collected right away, dropping their plans
+            assert con.execute(t.filter(t.a > j % 3).a.sum()) == [6, 5, 3][j % 3]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+
+    # only the plans of live expressions are kept
+    expr = t.a.sum()
+    gc.collect()
+    assert con.execute(expr) == 6
+    assert [op() for op, _ in con._compiled] == [expr.op()]
+
+    con.drop_table(name)
+
+
+def test_compile_cache_params_and_impure(con):
+    t = ibis.memtable({"a": [1, 2, 3]})
+    param = ibis.param("int64")
+    expr = t.filter(t.a > param).a.sum()
+    assert con.execute(expr, params={param: 1}) == 5
+    assert con.execute(expr, params={param: 2}) == 3
+    assert con.compile(expr, params={param: 2}) is con.compile(expr, params={param: 2})
+
+    impure = t.mutate(now=ibis.now())
+    assert con.compile(impure) is not con.compile(impure)
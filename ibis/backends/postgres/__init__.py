@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import json
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote_plus
@@ -29,6 +30,7 @@ from ibis.backends import (
     PyArrowExampleLoader,
     SupportsTempTables,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, to_details
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import TRUE, C, ColGen
 
@@ -148,7 +150,7 @@ class Backend(
 
         self._run_pre_execute_hooks(expr)
 
-        table = expr.as_table()
+        table = self._resolve_approx_counts(expr)
         sql = self.compile(table, params=params, limit=limit, **kwargs)
 
         con = self.con
@@ -500,6 +502,45 @@ ORDER BY a.attnum ASC"""
             }
         )
 
+    def _estimate_rows(
+        self, name: str, /, *, catalog: str | None, database: str | None
+    ) -> int | None:
+        dbs = [database or self.current_database]
+        if database is None and (temp_table_db := self._session_temp_db) is not None:
+            dbs.append(temp_table_db)
+
+        # reltuples is maintained by VACUUM, ANALYZE and CREATE INDEX, and is
+        # negative if the table has never been vacuumed or analyzed
+        query = """\
+SELECT c.reltuples
+FROM pg_catalog.pg_class c
+INNER JOIN pg_catalog.pg_namespace n
+   ON c.relnamespace = n.oid
+WHERE c.relkind IN ('r', 'p', 'm')
+  AND n.nspname = ANY(%(dbs)s)
+  AND c.relname = %(name)s"""
+
+        con = self.con
+        params = {"dbs": dbs, "name": name}
+        with con.cursor() as cursor, con.transaction():
+            row = cursor.execute(query, params).fetchone()
+
+        if row is None or (reltuples := row[0]) < 0:
+            return None
+        return int(reltuples)
+
+    def _list_connection_local_tables(self) -> frozenset[str]:
+        # temporary tables and views, including registered in-memory tables,
+        # live in a schema of their own for every session
+        query = """\
+SELECT c.relname
+FROM pg_catalog.pg_class c
+WHERE c.relnamespace = pg_catalog.pg_my_temp_schema()"""
+
+        con = self.con
+        with con.cursor() as cursor, con.transaction():
+            return frozenset(name for (name,) in cursor.execute(query).fetchall())
+
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name(f"{self.name}_metadata")
 
@@ -524,6 +565,24 @@ ORDER BY a.attnum ASC"""
             with con.cursor() as cursor, con.transaction():
                 cursor.execute(drop_stmt)
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        options = "FORMAT JSON, ANALYZE" if analyze else "FORMAT JSON"
+        with self._safe_raw_sql(f"EXPLAIN ({options}) {query}") as cur:
+            [(plan,)] = cur.fetchall()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        [result] = plan
+        execution_time = result.get("Execution Time")
+        return QueryPlan(
+            query=query,
+            raw=json.dumps(plan, indent=2),
+            root=_to_plan_node(result["Plan"]),
+            analyzed=analyze,
+            execution_time=None if execution_time is None else execution_time / 1e3,
+        )
+
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
     ) -> None:
@@ -562,6 +621,7 @@ ORDER BY a.attnum ASC"""
         con = self.con
         with con.cursor() as cursor, con.transaction():
             cursor.execute(sql)
+        self._clear_result_caches()
 
     def create_table(
         self,
@@ -663,6 +723,8 @@ ORDER BY a.attnum ASC"""
             for stmt in stmts:
                 cursor.execute(stmt)
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -687,6 +749,7 @@ ORDER BY a.attnum ASC"""
         con = self.con
         with con.cursor() as cursor, con.transaction():
             cursor.execute(drop_stmt)
+        self._clear_result_caches()
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, query: str | sg.Expression, **kwargs: Any):
@@ -711,6 +774,7 @@ ORDER BY a.attnum ASC"""
             con.rollback()
             raise
         else:
+            self._clear_result_caches_for(query)
             return cursor
 
     @util.experimental
@@ -741,11 +805,39 @@ ORDER BY a.attnum ASC"""
 
         self._run_pre_execute_hooks(expr)
 
-        raw_schema = expr.as_table().schema()
-        query = self.compile(expr, limit=limit, params=params)
+        table = self._resolve_approx_counts(expr)
+        raw_schema = table.schema()
+        query = self.compile(table, limit=limit, params=params)
         return pa.RecordBatchReader.from_batches(
             raw_schema.to_pyarrow(),
             _batches(
                 self, struct_type=raw_schema.as_struct().to_pyarrow(), query=query
             ),
         )
+
+
+_PLAN_STATISTICS = (
+    "Node Type",
+    "Plans",
+    "Plan Rows",
+    "Total Cost",
+    "Actual Rows",
+    "Actual Total Time",
+    "Actual Loops",
+)
+
+
+def _to_plan_node(node: Mapping[str, Any]) -> PlanNode:
+    loops = node.get("Actual Loops", 1)
+    actual_rows = node.get("Actual Rows")
+    actual_time = node.get("Actual Total Time")
+    return PlanNode(
+        name=node["Node Type"],
+        children=tuple(map(_to_plan_node, node.get("Plans", ()))),
+        estimated_rows=float(node["Plan Rows"]),
+        estimated_cost=float(node["Total Cost"]),
+        # postgres reports actual values averaged over the number of loops
+        actual_rows=None if actual_rows is None else int(actual_rows * loops),
+        actual_time=None if actual_time is None else actual_time * loops / 1e3,
+        details=to_details(node, exclude=_PLAN_STATISTICS),
+    )
@@ -14,6 +14,7 @@ import sqlglot.expressions as sge
 from packaging.version import parse as vparse
 from pyspark import SparkConf
 from pyspark.sql import SparkSession
+from pyspark.sql.pandas.types import to_arrow_schema
 from pyspark.sql.types import BooleanType, DoubleType, LongType, StringType
 
 import ibis.backends.sql.compilers as sc
@@ -62,6 +63,7 @@ if TYPE_CHECKING:
 PYSPARK_VERSION = vparse(pyspark.__version__)
 PYSPARK_LT_34 = PYSPARK_VERSION < vparse("3.4")
 PYSPARK_LT_35 = PYSPARK_VERSION < vparse("3.5")
+PYSPARK_LT_40 = PYSPARK_VERSION < vparse("4.0")
 ConnectionMode = Literal["streaming", "batch"]
 
 _JSON_UNWRAP_TYPES = {
@@ -116,6 +118,42 @@ def _interval_to_string(interval):
     return f"{interval.op().value} {interval.op().dtype.unit.name.lower()}"
 
 
+def _has_arrow_types(df) -> bool:
+    """Whether Spark can transfer every column of `df` as arrow."""
+    try:
+        to_arrow_schema(df.schema)
+    except TypeError:
+        return False
+    return True
+
+
+def _iter_arrow_batches(df):
+    """Stream the results of `df` to the driver as arrow record batches.
+
+    Every batch is serialized on the executors and collected one partition
+    at a time, so only one partition is held in memory at once.
+    """
+    import pyarrow as pa
+
+    # defined here so that it's pickled by value and ibis doesn't need to be
+    # installed on the executors
+    def serialize(batches):
+        import pyarrow as pa
+
+        for batch in batches:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+            data = pa.array([sink.getvalue().to_pybytes()], pa.binary())
+            yield pa.record_batch([data], ["batch"])
+
+    rows = df.mapInArrow(serialize, "batch binary").toLocalIterator(
+        prefetchPartitions=True
+    )
+    for row in rows:
+        yield pa.ipc.open_stream(pa.py_buffer(row.batch)).read_next_batch()
+
+
 class Backend(
     SupportsTempTables,
     SQLBackend,
@@ -238,6 +276,12 @@ class Backend(
 
     def disconnect(self) -> None:
         self._session.stop()
+        self._clear_result_caches()
+
+    def _connect_worker(self) -> Backend:
+        # jobs can be submitted to the same session from several threads, and
+        # another backend for the session would stop it when disconnected
+        return self
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         df = self.raw_sql(query)
@@ -457,6 +501,15 @@ class Backend(
         schema = op.schema
         pyspark_schema = PySparkSchema.from_ibis(schema)
 
+        if not PYSPARK_LT_40:
+            # PySpark 4.0 accepts arrow tables directly for both classic and
+            # remote sessions
+            df = self._session.createDataFrame(
+                op.data.to_pyarrow(schema), schema=pyspark_schema
+            )
+            df.createOrReplaceTempView(op.name)
+            return
+
         # this is a workaround for PySpark's lack of support for arrow input
         # prior to PySpark 4.0
         data = op.data.to_frame()
@@ -485,7 +538,9 @@ class Backend(
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         with contextlib.suppress(AttributeError):
             query = query.sql(dialect=self.dialect)
-        return self._session.sql(query, **kwargs)
+        result = self._session.sql(query, **kwargs)
+        self._clear_result_caches_for(query)
+        return result
 
     def execute(
         self,
@@ -574,6 +629,7 @@ class Backend(
         with self._active_catalog(catalog):
             with self._safe_raw_sql(sql):
                 pass
+        self._clear_result_caches()
 
     def get_schema(
         self,
@@ -696,6 +752,7 @@ class Backend(
         else:
             raise com.IbisError("The schema or obj parameter is required")
 
+        self._clear_result_caches()
         return self.table(name, database=(catalog, db))
 
     def create_view(
@@ -735,6 +792,7 @@ class Backend(
         self._register_in_memory_tables(obj)
         with self._safe_raw_sql(src):
             pass
+        self._clear_result_caches()
         return self.table(name, database=database)
 
     def rename_table(self, old_name: str, new_name: str) -> None:
@@ -756,6 +814,7 @@ class Backend(
         )
         with self._safe_raw_sql(query):
             pass
+        self._clear_result_caches()
 
     def compute_stats(
         self,
@@ -833,6 +892,7 @@ class Backend(
         table_name = table_name or util.gen_name("read_delta")
 
         spark_df.createOrReplaceTempView(table_name)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_parquet(
@@ -866,6 +926,7 @@ class Backend(
         table_name = table_name or util.gen_name("read_parquet")
 
         spark_df.createOrReplaceTempView(table_name)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_csv(
@@ -909,6 +970,7 @@ class Backend(
         table_name = table_name or util.gen_name("read_csv")
 
         spark_df.createOrReplaceTempView(table_name)
+        self._clear_result_caches()
         return self.table(table_name)
 
     def read_json(
@@ -948,6 +1010,7 @@ class Backend(
         table_name = table_name or util.gen_name("read_json")
 
         spark_df.createOrReplaceTempView(table_name)
+        self._clear_result_caches()
         return self.table(table_name)
 
     @util.experimental
@@ -1041,17 +1104,13 @@ class Backend(
             raise NotImplementedError(
                 "PySpark in streaming mode does not support to_pyarrow"
             )
-        import pyarrow as pa
-        import pyarrow_hotfix  # noqa: F401
-
-        from ibis.formats.pyarrow import PyArrowData
-
+        self._run_pre_execute_hooks(expr)
         table_expr = expr.as_table()
-        output = pa.Table.from_pandas(
-            self.execute(table_expr, params=params, limit=limit, **kwargs),
-            preserve_index=False,
-        )
-        table = PyArrowData.convert_table(output, table_expr.schema())
+        schema = table_expr.schema()
+        sql = self.compile(table_expr, params=params, limit=limit, **kwargs)
+
+        with self._safe_raw_sql(sql) as query:
+            table = self._collect_arrow(query, schema)
         return expr.__pyarrow_result__(table)
 
     def to_pyarrow_batches(
@@ -1069,12 +1128,60 @@ class Backend(
                 "PySpark in streaming mode does not support to_pyarrow_batches"
             )
         pa = self._import_pyarrow()
-        pa_table = self.to_pyarrow(
-            expr.as_table(), params=params, limit=limit, **kwargs
-        )
-        return pa.ipc.RecordBatchReader.from_batches(
-            pa_table.schema, pa_table.to_batches(max_chunksize=chunk_size)
-        )
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        self._run_pre_execute_hooks(expr)
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        sql = self.compile(table_expr, params=params, limit=limit, **kwargs)
+
+        def batches():
+            # nothing is executed until the reader is first consumed
+            with self._safe_raw_sql(sql) as query:
+                if not _has_arrow_types(query):
+                    table = self._collect_arrow(query, schema)
+                    yield from table.to_batches(max_chunksize=chunk_size)
+                    return
+
+                for batch in _iter_arrow_batches(query):
+                    table = PyArrowData.convert_table(
+                        pa.Table.from_batches([batch]), schema
+                    )
+                    yield from table.to_batches(max_chunksize=chunk_size)
+
+        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), batches())
+
+    def _collect_arrow(self, df, schema: sch.Schema) -> pa.Table:
+        """Collect a Spark DataFrame into an arrow table conforming to `schema`.
+
+        Results are transferred as arrow record batches whenever the session
+        and the types of `df` support it, and collected through pandas
+        otherwise.
+        """
+        import pyarrow as pa
+        import pyarrow_hotfix  # noqa: F401
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        if not _has_arrow_types(df):
+            output = PySparkPandasData.convert_table(df.toPandas(), schema)
+            table = pa.Table.from_pandas(output, preserve_index=False)
+        elif not PYSPARK_LT_40:
+            table = df.toArrow()
+        else:
+            # remote sessions prior to 4.0 don't have `_collect_as_arrow`
+            batches = (
+                df._collect_as_arrow()
+                if hasattr(df, "_collect_as_arrow")
+                else list(_iter_arrow_batches(df))
+            )
+            table = (
+                pa.Table.from_batches(batches)
+                if batches
+                else schema.to_pyarrow().empty_table()
+            )
+        return PyArrowData.convert_table(table, schema)
 
     @util.experimental
     def read_kafka(
@@ -4,6 +4,7 @@ from operator import methodcaller
 from time import sleep
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas.testing import assert_frame_equal
 
@@ -112,3 +113,30 @@ def test_to_parquet_read_parquet(con, tmp_path):
     result = t_in.to_pandas()[cols].sort_values(cols).reset_index(drop=True)
 
     assert_frame_equal(expected, result)
+
+
+def test_to_pyarrow_batches_streams_partitions(con, mocker):
+    t = con.table("functional_alltypes").select("id", "string_col").order_by("id")
+    collect = mocker.spy(con, "_collect_arrow")
+
+    batches = list(con.to_pyarrow_batches(t, chunk_size=1000))
+
+    collect.assert_not_called()
+    assert all(batch.num_rows <= 1000 for batch in batches)
+    ids = pa.Table.from_batches(batches)["id"].to_pylist()
+    assert len(ids) == con.execute(t.count())
+    assert ids == sorted(ids)
+
+
+def test_to_pyarrow_without_arrow_types(con, mocker):
+    # results Spark can't transfer as arrow are collected through pandas
+    to_arrow_schema = mocker.patch(
+        "ibis.backends.pyspark.to_arrow_schema", side_effect=TypeError
+    )
+    t = con.table("functional_alltypes").select("id", "string_col")
+    expr = t.order_by("id").limit(5)
+
+    result = con.to_pyarrow(expr)
+
+    to_arrow_schema.assert_called_once()
+    assert_frame_equal(result.to_pandas(), con.execute(expr))
@@ -368,6 +368,7 @@ class Backend(
         )
         with self._safe_raw_sql(sql):
             pass
+        self._clear_result_caches()
 
     def drop_table(
         self,
@@ -384,6 +385,7 @@ class Backend(
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._clear_result_caches()
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
@@ -595,6 +597,8 @@ class Backend(
                     f"ALTER TABLE {table_expr.sql(self.dialect)} RENAME TO {this.sql(self.dialect)}"
                 )
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -926,4 +930,5 @@ class Backend(
             raise
         else:
             con.commit()
+            self._clear_result_caches_for(query)
             return cursor
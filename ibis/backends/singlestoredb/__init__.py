@@ -259,6 +259,7 @@ class Backend(
         ).sql(self.dialect)
         with self.begin() as cur:
             cur.execute(sql)
+        self._clear_result_caches()
 
     def list_databases(self, *, like: str | None = None) -> list[str]:
         """Return the list of databases.
@@ -624,6 +625,8 @@ class Backend(
                 )
                 self.rename_table(temp_name, name)
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database if not temp else None)
 
@@ -662,6 +665,7 @@ class Backend(
         # Convert SQLGlot object to SQL string before execution
         with self.begin() as cur:
             cur.execute(drop_stmt.sql(self.dialect))
+        self._clear_result_caches()
 
     def read_csv(
         self,
@@ -722,6 +726,7 @@ class Backend(
         for file_path in paths:
             self._load_csv_file(file_path, name)
 
+        self._clear_result_caches()
         return table
 
     def _load_csv_file(
@@ -782,19 +787,11 @@ class Backend(
         )
         create_stmt_sql = create_stmt.sql(dialect)
 
-        df = op.data.to_frame()
-        df = df.replace(float("nan"), None)
-
-        # Fix: Convert itertuples result to list for SingleStoreDB compatibility
-        data = list(df.itertuples(index=False))
-        sql = self._build_insert_template(
-            name, schema=schema, columns=True, placeholder="%s"
-        )
         with self.begin() as cur:
             cur.execute(create_stmt_sql)
-
-            if not df.empty:
-                cur.executemany(sql, data)
+            # the client rewrites executemany on an INSERT into multi-row
+            # VALUES statements bounded by the maximum statement length
+            self._insert_in_memory_table(cur, op, placeholder="%s")
 
     # TODO(kszucs): should make it an abstract method or remove the use of it
     # from .execute()
@@ -868,6 +865,7 @@ class Backend(
         else:
             if not autocommit:
                 con.commit()
+            self._clear_result_caches_for(query)
             return cursor
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
@@ -1067,6 +1065,7 @@ class Backend(
         new_name = self._quote_table_name(new_name)
         with self.begin() as cur:
             cur.execute(f"ALTER TABLE {old_name} RENAME TO {new_name}")
+        self._clear_result_caches()
 
     def _quote_table_name(self, name: str) -> str:
         """Quote a table name for safe SQL usage.
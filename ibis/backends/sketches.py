@@ -0,0 +1,305 @@
+"""Vectorized HyperLogLog and t-digest sketches.
+
+Used by the backends without mergeable sketch functions of their own. The
+sketches are implemented on top of numpy, built from pyarrow arrays and
+serialized to bytes. Both sketches are built from a whole batch at a time:
+values are never looped over in Python.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_VERSION = 1
+
+# HyperLogLog with 2 ** 14 registers, for a relative error of about 0.8%
+_HLL_PRECISION = 14
+_HLL_HEADER = struct.Struct("<BBB")
+
+# the hash function of HyperLogLog sketches, stored in their header since
+# sketches built with different hash functions can't be merged:
+#
+# 1. the bits of fixed width values, or the FNV-1a hash of the bytes of
+#    strings and binary values, finalized with splitmix64
+_HLL_HASH = 1
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+# t-digest compression; the number of centroids is bounded by about half of it
+_TDIGEST_COMPRESSION = 200.0
+_TDIGEST_HEADER = struct.Struct("<BIdd")
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _fnv1a(values: pa.Array) -> np.ndarray:
+    """Hash the bytes of every value of a `large_binary` array."""
+    _, offsets, data = values.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)
+    offsets = offsets[values.offset : values.offset + len(values) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else None
+
+    # sort the values by decreasing length, so the values with at least i
+    # bytes are a prefix and every byte position is hashed in one operation
+    lengths = np.diff(offsets)
+    order = np.argsort(-lengths, kind="stable")
+    lengths = lengths[order]
+    starts = offsets[:-1][order]
+    counts = np.searchsorted(-lengths, -np.arange(lengths[0] if len(lengths) else 0))
+
+    hashes = np.full(len(values), _FNV_OFFSET, dtype=np.uint64)
+    for i, n in enumerate(counts):
+        hashes[:n] = (hashes[:n] ^ data[starts[:n] + i]) * _FNV_PRIME
+
+    result = np.empty_like(hashes)
+    result[order] = hashes
+    return result
+
+
+def _hash(values: pa.Array | pa.ChunkedArray) -> np.ndarray:
+    """Hash the non-null `values` to 64-bit integers.
+
+    Unlike the hash functions of dataframe libraries, the result doesn't
+    depend on the version of any library, so sketches remain mergeable.
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    values = values.drop_null()
+
+    typ = values.type
+    if pa.types.is_dictionary(typ):
+        values = values.dictionary_decode()
+        typ = values.type
+    if pa.types.is_decimal(typ):
+        values = values.cast(pa.string())
+        typ = values.type
+
+    if (
+        pa.types.is_string(typ)
+        or pa.types.is_large_string(typ)
+        or pa.types.is_binary(typ)
+        or pa.types.is_large_binary(typ)
+    ):
+        hashes = _fnv1a(values.cast(pa.large_binary()))
+    elif pa.types.is_floating(typ):
+        floats = values.cast(pa.float64()).to_numpy()
+        # hash equal values equally
+        floats = np.where(floats == 0, 0.0, floats)
+        floats[np.isnan(floats)] = np.nan
+        hashes = floats.view(np.uint64)
+    elif pa.types.is_boolean(typ) or pa.types.is_integer(typ):
+        hashes = values.cast(pa.int64()).to_numpy().view(np.uint64)
+    elif pa.types.is_temporal(typ):
+        bits = pa.int32() if typ.bit_width == 32 else pa.int64()
+        hashes = values.view(bits).cast(pa.int64()).to_numpy().view(np.uint64)
+    else:
+        raise TypeError(f"Can't build a HyperLogLog sketch of {typ} values")
+
+    return _splitmix64(hashes)
+
+
+def _hll_registers(sketch: bytes) -> np.ndarray:
+    version, hash, precision = _HLL_HEADER.unpack_from(sketch)
+    if version != _VERSION or hash != _HLL_HASH or precision != _HLL_PRECISION:
+        raise ValueError("Invalid HyperLogLog sketch")
+    return np.frombuffer(sketch, dtype=np.uint8, offset=_HLL_HEADER.size)
+
+
+def _hll_dumps(registers: np.ndarray) -> bytes:
+    return _HLL_HEADER.pack(_VERSION, _HLL_HASH, _HLL_PRECISION) + registers.tobytes()
+
+
+def hll_sketch(values: pa.Array | pa.ChunkedArray) -> bytes:
+    """Build a HyperLogLog sketch from the non-null values of `values`."""
+    p = _HLL_PRECISION
+    registers = np.zeros(1 << p, dtype=np.uint8)
+
+    hashes = _hash(values)
+    if len(hashes):
+        # the first `p` bits of the hash select the register, the position of
+        # the leftmost set bit of the remaining bits is the register's value
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # `rest` has fewer than 53 bits so it's exactly representable as a
+        # float, and the exponent returned by frexp is its bit length
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        np.maximum.at(registers, index, (64 - p + 1 - bit_length).astype(np.uint8))
+
+    return _hll_dumps(registers)
+
+
+def hll_merge(sketches: pa.Array | pa.ChunkedArray) -> bytes:
+    """Merge the non-null HyperLogLog sketches in `sketches`."""
+    registers = np.zeros(1 << _HLL_PRECISION, dtype=np.uint8)
+    for sketch in sketches.drop_null().to_pylist():
+        np.maximum(registers, _hll_registers(sketch), out=registers)
+    return _hll_dumps(registers)
+
+
+def hll_estimate(sketch: bytes) -> int:
+    """Estimate the number of distinct values summarized by `sketch`."""
+    registers = _hll_registers(sketch)
+    m = len(registers)
+    alpha = 0.7213 / (1.0 + 1.079 / m)
+    estimate = alpha * m * m / np.ldexp(1.0, -registers.astype(np.int64)).sum()
+
+    # fall back to linear counting for small cardinalities
+    if estimate <= 2.5 * m and (zeros := int(np.count_nonzero(registers == 0))):
+        estimate = m * math.log(m / zeros)
+
+    return round(estimate)
+
+
+def _tdigest_loads(sketch: bytes) -> tuple[np.ndarray, np.ndarray, float, float]:
+    version, n, lo, hi = _TDIGEST_HEADER.unpack_from(sketch)
+    if version != _VERSION:
+        raise ValueError("Invalid t-digest sketch")
+    centroids = np.frombuffer(
+        sketch, dtype=np.float64, count=2 * n, offset=_TDIGEST_HEADER.size
+    )
+    return centroids[:n], centroids[n:], lo, hi
+
+
+def _tdigest_dumps(
+    means: np.ndarray, weights: np.ndarray, lo: float, hi: float
+) -> bytes:
+    return (
+        _TDIGEST_HEADER.pack(_VERSION, len(means), lo, hi)
+        + means.tobytes()
+        + weights.tobytes()
+    )
+
+
+def _tdigest_compress(
+    means: np.ndarray, weights: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge sorted centroids whose quantiles fall in the same k-scale bucket."""
+    total = weights.sum()
+    q = (np.cumsum(weights) - weights / 2) / total
+    # the arcsine scale function keeps centroids small near the tails, which
+    # is where quantile estimates need the most accuracy
+    k = _TDIGEST_COMPRESSION / (2 * math.pi) * np.arcsin(2 * q - 1)
+    buckets = np.floor(k - k[0]).astype(np.intp)
+    # buckets are monotonically increasing, so compact them to a dense range
+    _, buckets = np.unique(buckets, return_inverse=True)
+    merged = np.bincount(buckets, weights=weights)
+    return np.bincount(buckets, weights=means * weights) / merged, merged
+
+
+def tdigest_sketch(values: pa.Array | pa.ChunkedArray) -> bytes:
+    """Build a t-digest sketch from the non-null values of `values`."""
+    means = np.sort(values.drop_null().cast(pa.float64()).to_numpy())
+    if not len(means):
+        return _tdigest_dumps(means, means, math.nan, math.nan)
+    lo, hi = means[0], means[-1]
+    means, weights = _tdigest_compress(means, np.ones_like(means))
+    return _tdigest_dumps(means, weights, lo, hi)
+
+
+def tdigest_merge(sketches: pa.Array | pa.ChunkedArray) -> bytes:
+    """Merge the non-null t-digest sketches in `sketches`."""
+    digests = [
+        digest
+        for digest in map(_tdigest_loads, sketches.drop_null().to_pylist())
+        if len(digest[0])
+    ]
+    if not digests:
+        empty = np.empty(0, dtype=np.float64)
+        return _tdigest_dumps(empty, empty, math.nan, math.nan)
+
+    all_means, all_weights, los, his = zip(*digests)
+    means = np.concatenate(all_means)
+    order = np.argsort(means, kind="stable")
+    means, weights = _tdigest_compress(means[order], np.concatenate(all_weights)[order])
+    return _tdigest_dumps(means, weights, min(los), max(his))
+
+
+def tdigest_quantile(sketch: bytes, quantile: float) -> float | None:
+    """Estimate the `quantile` of the distribution summarized by `sketch`."""
+    means, weights, lo, hi = _tdigest_loads(sketch)
+    if not len(means):
+        return None
+    total = weights.sum()
+    positions = (np.cumsum(weights) - weights / 2) / total
+    return float(
+        np.interp(
+            quantile,
+            np.concatenate(([0.0], positions, [1.0])),
+            np.concatenate(([lo], means, [hi])),
+        )
+    )
+
+
+# The functions below apply the sketch functions to every row of an array.
+# They're meant for engines that can call Python functions on Arrow data but
+# not Python aggregate functions: the engine aggregates the values of every
+# group to a list, and the sketch is built from the list.
+
+
+def _reduce_lists(
+    func: Callable[[pa.Array], bytes], lists: pa.Array | pa.ChunkedArray
+) -> pa.Array:
+    # null lists are the result of aggregating no rows
+    empty = pa.array([], type=lists.type.value_type)
+    return pa.array(
+        [func(values.values if values.is_valid else empty) for values in lists],
+        type=pa.binary(),
+    )
+
+
+def hll_sketches(lists: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Apply `hll_sketch` to every list of values of `lists`."""
+    return _reduce_lists(hll_sketch, lists)
+
+
+def hll_merges(lists: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Apply `hll_merge` to every list of sketches of `lists`."""
+    return _reduce_lists(hll_merge, lists)
+
+
+def hll_estimates(sketches: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Apply `hll_estimate` to every non-null sketch of `sketches`."""
+    return pa.array(
+        [
+            None if sketch is None else hll_estimate(sketch)
+            for sketch in sketches.to_pylist()
+        ],
+        type=pa.int64(),
+    )
+
+
+def tdigest_sketches(lists: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Apply `tdigest_sketch` to every list of values of `lists`."""
+    return _reduce_lists(tdigest_sketch, lists)
+
+
+def tdigest_merges(lists: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Apply `tdigest_merge` to every list of sketches of `lists`."""
+    return _reduce_lists(tdigest_merge, lists)
+
+
+def tdigest_quantiles(
+    sketches: pa.Array | pa.ChunkedArray, quantiles: pa.Array | pa.ChunkedArray
+) -> pa.Array:
+    """Apply `tdigest_quantile` to every pair of non-null sketch and quantile."""
+    return pa.array(
+        [
+            None if sketch is None or q is None else tdigest_quantile(sketch, q)
+            for sketch, q in zip(sketches.to_pylist(), quantiles.to_pylist())
+        ],
+        type=pa.float64(),
+    )
@@ -6,6 +6,7 @@ import glob
 import itertools
 import json
 import os
+import time
 import warnings
 from operator import itemgetter
 from pathlib import Path
@@ -33,6 +34,7 @@ from ibis.backends import (
     HasCurrentDatabase,
     SupportsTempTables,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, from_edges, to_details
 from ibis.backends.snowflake.converter import SnowflakePandasData
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import STAR
@@ -578,6 +580,55 @@ $$ {defn["source"]} $$"""
             }
         )
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        with self._safe_raw_sql(f"EXPLAIN USING JSON {query}") as cur:
+            [(raw,)] = cur.fetchall()
+
+        plan = json.loads(raw)
+        root = from_edges(
+            (op["id"], _first_parent(op.get("parentOperators")), _to_plan_node(op))
+            for step in plan.get("Operations", ())
+            for op in step
+        )
+
+        execution_time = None
+        if analyze:
+            start = time.perf_counter()
+            with self._safe_raw_sql(query) as cur:
+                cur.fetchall()
+                query_id = cur.sfqid
+            execution_time = time.perf_counter() - start
+
+            # replace the planned operators with the executed ones, which
+            # carry actual row counts and each operator's share of the time
+            columns = (
+                "operator_id, parent_operators, operator_type, operator_statistics, "
+                "execution_time_breakdown, operator_attributes"
+            )
+            stats = (
+                f"SELECT {columns} FROM TABLE(GET_QUERY_OPERATOR_STATS('{query_id}'))"  # noqa: S608
+            )
+            with self._safe_raw_sql(stats) as cur:
+                rows = cur.fetchall()
+            root = from_edges(
+                (
+                    id,
+                    _first_parent(parents),
+                    _to_analyzed_plan_node(
+                        name, statistics, breakdown, attributes, execution_time
+                    ),
+                )
+                for id, parents, name, statistics, breakdown, attributes in rows
+            )
+
+        return QueryPlan(
+            query=query,
+            raw=raw,
+            root=root,
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
+
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         dialect = self.dialect
         sql = sge.Describe(kind="RESULT", this=self.compiler.f.last_query_id()).sql(
@@ -678,6 +729,7 @@ $$ {defn["source"]} $$"""
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._clear_result_caches()
 
     def create_database(
         self, name: str, /, *, catalog: str | None = None, force: bool = False
@@ -717,6 +769,7 @@ $$ {defn["source"]} $$"""
             cur.close()
             raise
         else:
+            self._clear_result_caches_for(query)
             return cur
 
     def drop_database(
@@ -736,6 +789,7 @@ $$ {defn["source"]} $$"""
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._clear_result_caches()
 
     def create_table(
         self,
@@ -831,6 +885,7 @@ $$ {defn["source"]} $$"""
         with self._safe_raw_sql(create_stmt):
             pass
 
+        self._clear_result_caches()
         return self.table(name, database=(catalog, db))
 
     def read_csv(
@@ -956,6 +1011,7 @@ $$ {defn["source"]} $$"""
             ]
             cur.execute(";\n".join(stmts))
 
+        self._clear_result_caches()
         return self.table(table)
 
     def read_json(
@@ -1044,6 +1100,7 @@ $$ {defn["source"]} $$"""
                 )
             )
 
+        self._clear_result_caches()
         return self.table(table)
 
     def read_parquet(
@@ -1123,6 +1180,7 @@ $$ {defn["source"]} $$"""
             cur.execute(f"PUT 'file://{abspath}' @{stage} PARALLEL = {threads:d}")
             cur.execute(copy_query)
 
+        self._clear_result_caches()
         return self.table(table)
 
     def insert(
@@ -1182,3 +1240,40 @@ $$ {defn["source"]} $$"""
         statement = ";".join(statements)
         with self._safe_raw_sql(statement):
             pass
+        self._clear_result_caches()
+
+
+def _loads(value: str | Any) -> Any:
+    # semi-structured values are returned as JSON strings
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _first_parent(parents: str | list[int] | None) -> int | None:
+    parents = _loads(parents)
+    return parents[0] if parents else None
+
+
+def _to_plan_node(op: Mapping[str, Any]) -> PlanNode:
+    return PlanNode(
+        name=op["operation"],
+        details=to_details(op, exclude=("id", "operation", "parentOperators")),
+    )
+
+
+def _to_analyzed_plan_node(
+    name: str,
+    statistics: str | None,
+    breakdown: str | None,
+    attributes: str | None,
+    execution_time: float,
+) -> PlanNode:
+    statistics = _loads(statistics) or {}
+    breakdown = _loads(breakdown) or {}
+    output_rows = statistics.get("output_rows")
+    percentage = breakdown.get("overall_percentage")
+    return PlanNode(
+        name=name,
+        actual_rows=None if output_rows is None else int(output_rows),
+        actual_time=None if percentage is None else percentage * execution_time,
+        details=to_details(_loads(attributes) or {}),
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import itertools
+import re
 from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -14,18 +16,26 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend
+from ibis.backends.sql.rewrites import lower_in_values_to_memtable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     import pandas as pd
     import pyarrow as pa
 
+    from ibis.backends.explain import QueryPlan
     from ibis.backends.sql.compilers.base import SQLGlotCompiler
     from ibis.expr.api import IntoMemtable
     from ibis.expr.schema import IntoSchema
 
 
+# leading keywords of statements that can't modify any tables
+_READ_ONLY_STATEMENTS = frozenset(
+    {"SELECT", "WITH", "VALUES", "FROM", "TABLE", "DESCRIBE", "SHOW", "EXPLAIN"}
+)
+
+
 class SQLBackend(BaseBackend):
     compiler: ClassVar[SQLGlotCompiler]
     name: ClassVar[str]
@@ -56,6 +66,18 @@ class SQLBackend(BaseBackend):
             compiler.visit_Unsupported,
         )
 
+    def _clear_result_caches_for(self, query: str | sge.Expression) -> None:
+        """Clear the result caches after running `query` unless it is read only."""
+        if isinstance(query, sge.Expression):
+            read_only = isinstance(query, (sge.Query, sge.Describe))
+        else:
+            match = re.match(r"[\s(]*(\w+)", query)
+            read_only = match is not None and (
+                match.group(1).upper() in _READ_ONLY_STATEMENTS
+            )
+        if not read_only:
+            self._clear_result_caches()
+
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
 
@@ -133,6 +155,36 @@ class SQLBackend(BaseBackend):
         self._log(sql)
         return sql
 
+    def _precompile(
+        self,
+        exprs: list[ir.Expr],
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+    ) -> list[str | None]:
+        queries = []
+        for expr in exprs:
+            try:
+                query = self.compile(expr, limit=limit, params=params)
+            except Exception:  # noqa: BLE001
+                # an expression that fails to compile raises again when executed
+                query = None
+            queries.append(query)
+        return queries
+
+    def _execute_compiled(self, expr: ir.Expr, query: str, /) -> Any:
+        self._run_pre_execute_hooks(expr)
+        table = self.sql(query, schema=expr.as_table().schema())
+        if isinstance(expr, ir.Table):
+            result = table
+        elif isinstance(expr, ir.Column):
+            result = table[expr.get_name()]
+        else:
+            result = table[expr.get_name()].as_scalar()
+        # the limit is already part of the query
+        return self.execute(result, limit=None)
+
     def _log(self, sql: str) -> None:
         """Log `sql`.
 
@@ -211,6 +263,13 @@ class SQLBackend(BaseBackend):
             with self._safe_raw_sql(";\n".join(udf_sources)):
                 pass
 
+    def _register_in_memory_tables(self, expr: ir.Expr) -> None:
+        # large `isin` option lists may be compiled to a semi-join against an
+        # in-memory table, which must be registered like any other memtable
+        if self.compiler.lowered_ops.get(ops.InValues) is lower_in_values_to_memtable:
+            expr = expr.op().replace(lower_in_values_to_memtable).to_expr()
+        super()._register_in_memory_tables(expr)
+
     def create_view(
         self,
         name: str,
@@ -250,6 +309,7 @@ class SQLBackend(BaseBackend):
         self._register_in_memory_tables(obj)
         with self._safe_raw_sql(src):
             pass
+        self._clear_result_caches()
         return self.table(name, database=(catalog, db))
 
     def drop_view(
@@ -276,6 +336,7 @@ class SQLBackend(BaseBackend):
         )
         with self._safe_raw_sql(src):
             pass
+        self._clear_result_caches()
 
     def execute(
         self,
@@ -306,7 +367,7 @@ class SQLBackend(BaseBackend):
             The result of the expression execution.
         """
         self._run_pre_execute_hooks(expr)
-        table = expr.as_table()
+        table = self._resolve_approx_counts(expr)
         sql = self.compile(table, params=params, limit=limit, **kwargs)
 
         schema = table.schema()
@@ -317,6 +378,45 @@ class SQLBackend(BaseBackend):
             result = self._fetch_from_cursor(cur, schema)
         return expr.__pandas_result__(result)
 
+    def explain(
+        self,
+        expr: ir.Expr | str,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        analyze: bool = False,
+    ) -> QueryPlan:
+        """Return the query plan the backend would use to compute `expr`.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression or SQL string to explain.
+        params
+            Mapping of scalar parameter expressions to value.
+        analyze
+            If `True`, execute the query and collect actual row counts and
+            timings in addition to the planner's estimates.
+
+        Returns
+        -------
+        QueryPlan
+            The plan in the engine's native format along with a normalized
+            tree of plan nodes.
+        """
+        if isinstance(expr, str):
+            query = expr
+        else:
+            self._run_pre_execute_hooks(expr)
+            query = self.compile(expr.as_table(), params=params)
+        return self._explain(query, analyze=analyze)
+
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        """Explain a backend-specific SQL string `query`."""
+        raise NotImplementedError(
+            f"{self.name} backend has not implemented `explain` API"
+        )
+
     def drop_table(
         self,
         name: str,
@@ -346,6 +446,7 @@ class SQLBackend(BaseBackend):
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._clear_result_caches()
 
     def _cursor_batches(
         self,
@@ -355,9 +456,10 @@ class SQLBackend(BaseBackend):
         chunk_size: int = 1 << 20,
     ) -> Iterable[list]:
         self._run_pre_execute_hooks(expr)
+        table = self._resolve_approx_counts(expr)
 
         with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
+            self.compile(table, limit=limit, params=params)
         ) as cursor:
             while batch := cursor.fetchmany(chunk_size):
                 yield batch
@@ -463,6 +565,7 @@ class SQLBackend(BaseBackend):
 
         with self._safe_raw_sql(query):
             pass
+        self._clear_result_caches()
 
     def _get_columns_to_insert(
         self, *, target: str, source, db: str | None = None, catalog: str | None = None
@@ -504,6 +607,7 @@ class SQLBackend(BaseBackend):
         catalog: str | None = None,
         columns: bool = False,
         placeholder: str = "?",
+        rows: int = 1,
     ) -> str:
         """Builds an INSERT INTO table VALUES query string with placeholders.
 
@@ -519,6 +623,9 @@ class SQLBackend(BaseBackend):
             Whether to render the columns to insert into
         placeholder
             Placeholder string.
+        rows
+            Number of rows in the VALUES clause. Placeholders are numbered
+            consecutively across rows.
 
         Returns
         -------
@@ -526,15 +633,20 @@ class SQLBackend(BaseBackend):
             The query string
         """
         quoted = self.compiler.quoted
+        names = list(schema.keys())
+        ncols = len(names)
         return sge.insert(
             sge.Values(
                 expressions=[
                     sge.Tuple(
                         expressions=[
-                            sge.Var(this=placeholder.format(i=i, name=name))
-                            for i, name in enumerate(schema.keys())
+                            sge.Var(
+                                this=placeholder.format(i=row * ncols + i, name=name)
+                            )
+                            for i, name in enumerate(names)
                         ]
                     )
+                    for row in range(rows)
                 ]
             ),
             into=sg.table(name, catalog=catalog, quoted=quoted),
@@ -545,6 +657,122 @@ class SQLBackend(BaseBackend):
             ),
         ).sql(self.dialect)
 
+    def _in_memory_table_rows(
+        self, op: ops.InMemoryTable, *, chunk_size: int = 100_000
+    ) -> Iterator[list[tuple]]:
+        """Yield the rows of an in-memory table in chunks of Python tuples.
+
+        Rows are built column-wise from Arrow record batches, see
+        `_in_memory_column_values`.
+        """
+        table = op.data.to_pyarrow(op.schema)
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            yield list(zip(*map(self._in_memory_column_values, batch.columns)))
+
+    def _in_memory_column_values(self, column: pa.Array) -> list:
+        """Convert an Arrow array to a list of values to bind as parameters.
+
+        Nulls and floating point NaNs are both converted to `None`.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow_hotfix  # noqa: F401
+
+        typ = column.type
+        if pa.types.is_timestamp(typ) and typ.tz is None:
+            values = column.to_numpy(zero_copy_only=False)
+            # numpy only produces datetime objects for units of at most
+            # microseconds, and NaT becomes None
+            if typ.unit != "ns" or not (values.view("int64") % 1_000).any():
+                return values.astype("datetime64[us]").tolist()
+
+        values = column.to_pandas(
+            integer_object_nulls=True, date_as_object=True
+        ).tolist()
+        if pa.types.is_floating(typ):
+            nulls = pc.fill_null(pc.is_nan(column), True)
+        elif column.null_count:
+            nulls = column.is_null()
+        else:
+            return values
+
+        for i in pc.indices_nonzero(nulls).to_numpy().tolist():
+            values[i] = None
+        return values
+
+    def _insert_in_memory_table(
+        self,
+        cursor,
+        op: ops.InMemoryTable,
+        *,
+        catalog: str | None = None,
+        columns: bool = True,
+        placeholder: str = "?",
+        max_parameters: int | None = None,
+        max_rows: int = 1000,
+        chunk_size: int = 100_000,
+    ) -> None:
+        """Insert the data of an in-memory table into the table `op.name`.
+
+        Parameters
+        ----------
+        cursor
+            DB-API cursor used to execute the inserts
+        op
+            The in-memory table whose data to insert
+        catalog
+            Catalog name of the table to insert into
+        columns
+            Whether to render the columns to insert into
+        placeholder
+            Placeholder string
+        max_parameters
+            Maximum number of parameters the driver binds in one statement. If
+            given, rows are inserted using multi-row VALUES clauses sized to
+            this limit, otherwise rows are passed to `executemany` one by one.
+        max_rows
+            Maximum number of rows in a single multi-row VALUES clause
+        chunk_size
+            Number of rows converted to Python objects at a time
+        """
+        schema = op.schema
+        build = partial(
+            self._build_insert_template,
+            op.name,
+            schema=schema,
+            catalog=catalog,
+            columns=columns,
+            placeholder=placeholder,
+        )
+
+        ncols = len(schema)
+        if max_parameters is None or not ncols:
+            insert = build()
+            for rows in self._in_memory_table_rows(op, chunk_size=chunk_size):
+                if rows:
+                    cursor.executemany(insert, rows)
+            return
+
+        per_statement = max(1, min(max_rows, max_parameters // ncols))
+        insert = build(rows=per_statement)
+        chunk_size = per_statement * max(1, chunk_size // per_statement)
+        for rows in self._in_memory_table_rows(op, chunk_size=chunk_size):
+            full = len(rows) - len(rows) % per_statement
+            if full:
+                cursor.executemany(
+                    insert,
+                    [
+                        tuple(
+                            itertools.chain.from_iterable(rows[i : i + per_statement])
+                        )
+                        for i in range(0, full, per_statement)
+                    ],
+                )
+            if rest := rows[full:]:
+                cursor.execute(
+                    build(rows=len(rest)), tuple(itertools.chain.from_iterable(rest))
+                )
+
     def upsert(
         self,
         name: str,
@@ -596,6 +824,7 @@ class SQLBackend(BaseBackend):
 
         with self._safe_raw_sql(query):
             pass
+        self._clear_result_caches()
 
     def _build_upsert_from_table(
         self,
@@ -690,6 +919,7 @@ class SQLBackend(BaseBackend):
         )
         with self._safe_raw_sql(f"TRUNCATE TABLE {ident}"):
             pass
+        self._clear_result_caches()
 
     @util.experimental
     @classmethod
@@ -709,9 +939,11 @@ class SQLBackend(BaseBackend):
 
     def disconnect(self):
         """Disconnect from the backend."""
+        self._close_workers()
         # This is part of the Python DB-API specification so should work for
         # _most_ sqlglot backends
         self.con.close()
+        self._clear_result_caches()
 
     def _to_catalog_db_tuple(self, table_loc: sge.Table):
         if (sg_cat := table_loc.args["catalog"]) is not None:
@@ -26,6 +26,7 @@ from ibis.backends.sql.rewrites import (
     empty_in_values_right_side,
     lower_bucket,
     lower_capitalize,
+    lower_in_values_to_array,
     lower_sample,
     one_to_zero_index,
     sqlize,
@@ -306,6 +307,7 @@ class SQLGlotCompiler(abc.ABC):
     LOWERED_OPS: dict[type[ops.Node], pats.Replace | None] = {
         ops.Bucket: lower_bucket,
         ops.Capitalize: lower_capitalize,
+        ops.InValues: lower_in_values_to_array,
         ops.Sample: lower_sample(supported_methods=()),
         ops.StringSlice: lower_stringslice,
     }
@@ -637,6 +639,7 @@ class SQLGlotCompiler(abc.ABC):
             rewrites=self.rewrites,
             post_rewrites=self.post_rewrites,
             fuse_selects=options.sql.fuse_selects,
+            cse_threshold=options.sql.cse_complexity_threshold,
         )
 
         aliases = {}
@@ -1084,6 +1087,11 @@ class SQLGlotCompiler(abc.ABC):
     def visit_CountStar(self, op, *, arg, where):
         return self.agg.count(STAR, where=where)
 
+    def visit_ApproxCountStar(self, op, *, arg):
+        # backends substitute estimates before compiling, so any estimate
+        # that's left is computed exactly
+        return self.visit_CountStar(op, arg=arg, where=None)
+
     def visit_Kurtosis(self, op, *, arg, where, how: Literal["sample", "pop"]):
         if op.arg.dtype.is_boolean():
             arg = self.cast(arg, dt.int32)
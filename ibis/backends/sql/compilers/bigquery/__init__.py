@@ -190,6 +190,9 @@ class BigQueryCompiler(SQLGlotCompiler):
         ops.GeoX: "st_x",
         ops.GeoY: "st_y",
         ops.Hash: "farm_fingerprint",
+        ops.HLLEstimate: "hll_count.extract",
+        ops.HLLMerge: "hll_count.merge_partial",
+        ops.HLLSketch: "hll_count.init",
         ops.IsInf: "is_inf",
         ops.IsNan: "is_nan",
         ops.Log10: "log10",
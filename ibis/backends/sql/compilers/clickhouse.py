@@ -209,6 +209,50 @@ class ClickHouseCompiler(SQLGlotCompiler):
     def visit_ApproxMultiQuantile(self, op, *, arg, quantile, where):
         return self._visit_quantile("quantilesTDigest", arg, quantile, where)
 
+    # sketches are stored as String; the aggregate function states they
+    # serialize must be cast back to their `AggregateFunction` type whenever
+    # they are merged or queried
+    def _sketch(self, arg, func, typ):
+        to = sge.DataType.build(
+            f"AggregateFunction({func}, {typ})", dialect=self.dialect
+        )
+        return sge.Cast(this=arg, to=to)
+
+    def visit_HLLSketch(self, op, *, arg, where):
+        state = self.agg.uniqCombinedState(self.f.cityHash64(arg), where=where)
+        return self.cast(state, dt.binary)
+
+    def visit_HLLMerge(self, op, *, arg, where):
+        state = self.agg.uniqCombinedMergeState(
+            self._sketch(arg, "uniqCombined", "UInt64"), where=where
+        )
+        return self.cast(state, dt.binary)
+
+    def visit_HLLEstimate(self, op, *, arg):
+        return self.f.finalizeAggregation(self._sketch(arg, "uniqCombined", "UInt64"))
+
+    def visit_TDigestSketch(self, op, *, arg, where):
+        state = self.agg.quantileTDigestState(self.f.toFloat64(arg), where=where)
+        return self.cast(state, dt.binary)
+
+    def visit_TDigestMerge(self, op, *, arg, where):
+        state = self.agg.quantileTDigestMergeState(
+            self._sketch(arg, "quantileTDigest", "Float64"), where=where
+        )
+        return self.cast(state, dt.binary)
+
+    def visit_TDigestQuantile(self, op, *, arg, quantile):
+        if not isinstance(op.quantile, ops.Literal):
+            raise com.UnsupportedOperationError(
+                "quantile must be a literal in ClickHouse"
+            )
+        # aggregate function states can only be finalized with parameters by
+        # running the merge aggregate over a single element array
+        return self.f.arrayReduce(
+            sge.convert(f"quantileTDigestMerge({op.quantile.value!r})"),
+            self.f.array(self._sketch(arg, "quantileTDigest", "Float64")),
+        )
+
     def visit_Correlation(self, op, *, left, right, how, where):
         if how == "pop":
             raise ValueError(
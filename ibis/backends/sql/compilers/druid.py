@@ -23,7 +23,7 @@ class DruidCompiler(SQLGlotCompiler):
     agg = AggGen(supports_filter=True)
     post_rewrites = (split_select_distinct_with_order_by,)
 
-    LOWERED_OPS = {ops.Capitalize: None, ops.Sample: None}
+    LOWERED_OPS = {ops.Capitalize: None, ops.InValues: None, ops.Sample: None}
 
     UNSUPPORTED_OPS = (
         ops.ApproxMedian,
@@ -16,6 +16,7 @@ from ibis.backends.sql.compilers._compat import EXCEPT_ARG
 from ibis.backends.sql.compilers.base import NULL, STAR, AggGen, SQLGlotCompiler
 from ibis.backends.sql.datatypes import DuckDBType
 from ibis.backends.sql.rewrites import (
+    lower_in_values_to_memtable,
     lower_sample,
     subtract_one_from_array_map_filter_index,
 )
@@ -51,6 +52,7 @@ class DuckDBCompiler(SQLGlotCompiler):
     supports_qualify = True
 
     LOWERED_OPS = {
+        ops.InValues: lower_in_values_to_memtable,
         ops.Sample: lower_sample(),
         ops.StringSlice: None,
     }
@@ -573,6 +575,29 @@ class DuckDBCompiler(SQLGlotCompiler):
 
     visit_ApproxMultiQuantile = visit_ApproxQuantile
 
+    # duckdb has no mergeable sketches, values are aggregated to lists and the
+    # sketches are built by python functions registered by the backend
+    def visit_HLLSketch(self, op, *, arg, where):
+        if not op.arg.dtype.is_binary():
+            arg = self.f.encode(self.cast(arg, dt.string))
+        return self.f.ibis_hll_sketch(self.agg.array_agg(arg, where=where))
+
+    def visit_HLLMerge(self, op, *, arg, where):
+        return self.f.ibis_hll_merge(self.agg.array_agg(arg, where=where))
+
+    def visit_HLLEstimate(self, op, *, arg):
+        return self.f.ibis_hll_estimate(arg)
+
+    def visit_TDigestSketch(self, op, *, arg, where):
+        arg = self.cast(arg, dt.float64)
+        return self.f.ibis_tdigest_sketch(self.agg.array_agg(arg, where=where))
+
+    def visit_TDigestMerge(self, op, *, arg, where):
+        return self.f.ibis_tdigest_merge(self.agg.array_agg(arg, where=where))
+
+    def visit_TDigestQuantile(self, op, *, arg, quantile):
+        return self.f.ibis_tdigest_quantile(arg, self.cast(quantile, dt.float64))
+
     def visit_HexDigest(self, op, *, arg, how):
         if how in ("md5", "sha256"):
             return getattr(self.f, how)(arg)
@@ -15,6 +15,7 @@ from ibis.backends.sql.rewrites import (
     exclude_unsupported_window_frame_from_ops,
     exclude_unsupported_window_frame_from_rank,
     exclude_unsupported_window_frame_from_row_number,
+    lower_in_values_to_memtable,
     rewrite_empty_order_by_window,
     split_select_distinct_with_order_by,
 )
@@ -35,6 +36,8 @@ class ExasolCompiler(SQLGlotCompiler):
 
     post_rewrites = (split_select_distinct_with_order_by,)
 
+    LOWERED_OPS = {ops.InValues: lower_in_values_to_memtable}
+
     UNSUPPORTED_OPS = (
         ops.AnalyticVectorizedUDF,
         ops.ArrayDistinct,
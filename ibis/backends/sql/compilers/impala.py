@@ -15,6 +15,7 @@ from ibis.backends.sql.dialects import Impala
 from ibis.backends.sql.rewrites import (
     FirstValue,
     LastValue,
+    lower_in_values_to_memtable,
     lower_sample,
     rewrite_empty_order_by_window,
     split_select_distinct_with_order_by,
@@ -33,6 +34,7 @@ class ImpalaCompiler(SQLGlotCompiler):
     post_rewrites = (split_select_distinct_with_order_by,)
 
     LOWERED_OPS = {
+        ops.InValues: lower_in_values_to_memtable,
         ops.Sample: lower_sample(
             supported_methods=("block",), physical_tables_only=True
         ),
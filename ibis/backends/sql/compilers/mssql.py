@@ -25,6 +25,7 @@ from ibis.backends.sql.rewrites import (
     exclude_unsupported_window_frame_from_ops,
     exclude_unsupported_window_frame_from_rank,
     exclude_unsupported_window_frame_from_row_number,
+    lower_in_values_to_memtable,
     lower_sample,
     p,
     replace,
@@ -79,6 +80,7 @@ class MSSQLCompiler(SQLGlotCompiler):
     copy_func_args = True
 
     LOWERED_OPS = {
+        ops.InValues: lower_in_values_to_memtable,
         ops.Sample: lower_sample(
             supported_methods=("block",), physical_tables_only=True
         ),
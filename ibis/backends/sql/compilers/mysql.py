@@ -16,6 +16,7 @@ from ibis.backends.sql.rewrites import (
     exclude_unsupported_window_frame_from_ops,
     exclude_unsupported_window_frame_from_rank,
     exclude_unsupported_window_frame_from_row_number,
+    lower_in_values_to_memtable,
     rewrite_empty_order_by_window,
 )
 from ibis.common.patterns import replace
@@ -63,6 +64,9 @@ class MySQLCompiler(SQLGlotCompiler):
         raise NotImplementedError("MySQL does not support Infinity")
 
     NEG_INF = POS_INF
+
+    LOWERED_OPS = {ops.InValues: lower_in_values_to_memtable}
+
     UNSUPPORTED_OPS = (
         ops.ApproxMedian,
         ops.Array,
@@ -14,6 +14,7 @@ from ibis.backends.sql.rewrites import (
     LastValue,
     exclude_unsupported_window_frame_from_ops,
     exclude_unsupported_window_frame_from_row_number,
+    lower_in_values_to_memtable,
     lower_log2,
     lower_log10,
     lower_sample,
@@ -48,6 +49,7 @@ class OracleCompiler(SQLGlotCompiler):
     """Backend's negative infinity literal."""
 
     LOWERED_OPS = {
+        ops.InValues: lower_in_values_to_memtable,
         ops.Log2: lower_log2,
         ops.Log10: lower_log10,
         ops.Sample: lower_sample(physical_tables_only=True),
@@ -84,6 +84,9 @@ class PySparkCompiler(SQLGlotCompiler):
         ops.ArrayAny: "array_max",
         ops.EndsWith: "endswith",
         ops.Hash: "hash",
+        ops.HLLEstimate: "hll_sketch_estimate",
+        ops.HLLMerge: "hll_union_agg",
+        ops.HLLSketch: "hll_sketch_agg",
         ops.Log10: "log10",
         ops.LStrip: "ltrim",
         ops.RStrip: "rtrim",
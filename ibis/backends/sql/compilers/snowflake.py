@@ -136,6 +136,9 @@ class SnowflakeCompiler(SQLGlotCompiler):
         ops.EndsWith: "endswith",
         ops.ExtractIsoYear: "yearofweekiso",
         ops.Hash: "hash",
+        ops.HLLEstimate: "hll_estimate",
+        ops.HLLMerge: "hll_combine",
+        ops.HLLSketch: "hll_accumulate",
         ops.Median: "median",
         ops.Mode: "mode",
         ops.RandomUUID: "uuid_string",
@@ -392,6 +395,27 @@ $$""",
     def visit_ApproxMedian(self, op, *, arg, where):
         return self.agg.approx_percentile(arg, 0.5, where=where)
 
+    # t-digest states are OBJECTs in Snowflake, so they are stored as their
+    # UTF-8 encoded JSON text and parsed back whenever they are merged or queried
+    def _to_tdigest(self, arg):
+        return self.f.parse_json(self.f.to_varchar(arg, "UTF-8"))
+
+    def _from_tdigest(self, state):
+        return self.f.to_binary(self.f.to_json(state), "UTF-8")
+
+    def visit_TDigestSketch(self, op, *, arg, where):
+        return self._from_tdigest(
+            self.agg.approx_percentile_accumulate(arg, where=where)
+        )
+
+    def visit_TDigestMerge(self, op, *, arg, where):
+        return self._from_tdigest(
+            self.agg.approx_percentile_combine(self._to_tdigest(arg), where=where)
+        )
+
+    def visit_TDigestQuantile(self, op, *, arg, quantile):
+        return self.f.approx_percentile_estimate(self._to_tdigest(arg), quantile)
+
     def visit_TimeDelta(self, op, *, part, left, right):
         return self.f.timediff(part, right, left)
 
@@ -11,6 +11,7 @@ import ibis.expr.operations as ops
 from ibis.backends.sql.compilers.base import NULL, AggGen, SQLGlotCompiler
 from ibis.backends.sql.datatypes import SQLiteType
 from ibis.backends.sql.dialects import SQLite
+from ibis.backends.sql.rewrites import lower_in_values_to_memtable
 from ibis.common.temporal import DateUnit, IntervalUnit
 
 
@@ -27,6 +28,8 @@ class SQLiteCompiler(SQLGlotCompiler):
     POS_INF = sge.Literal.number("1e999")
     NEG_INF = sge.Literal.number("-1e999")
 
+    LOWERED_OPS = {ops.InValues: lower_in_values_to_memtable}
+
     UNSUPPORTED_OPS = (
         ops.Levenshtein,
         ops.RegexSplit,
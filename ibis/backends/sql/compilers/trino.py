@@ -133,6 +133,33 @@ class TrinoCompiler(SQLGlotCompiler):
 
     visit_ApproxMultiQuantile = visit_ApproxQuantile
 
+    # sketches are stored as varbinary and cast back to their native type
+    # whenever they are merged or queried
+    def _sketch(self, arg, typ):
+        return sge.Cast(this=arg, to=sge.DataType.build(typ, dialect=self.dialect))
+
+    def visit_HLLSketch(self, op, *, arg, where):
+        return self.cast(self.agg.approx_set(arg, where=where), dt.binary)
+
+    def visit_HLLMerge(self, op, *, arg, where):
+        merged = self.agg.merge(self._sketch(arg, "HyperLogLog"), where=where)
+        return self.cast(merged, dt.binary)
+
+    def visit_HLLEstimate(self, op, *, arg):
+        return self.f.cardinality(self._sketch(arg, "HyperLogLog"))
+
+    def visit_TDigestSketch(self, op, *, arg, where):
+        if not op.arg.dtype.is_floating():
+            arg = self.cast(arg, dt.float64)
+        return self.cast(self.agg.tdigest_agg(arg, where=where), dt.binary)
+
+    def visit_TDigestMerge(self, op, *, arg, where):
+        merged = self.agg.merge(self._sketch(arg, "tdigest"), where=where)
+        return self.cast(merged, dt.binary)
+
+    def visit_TDigestQuantile(self, op, *, arg, quantile):
+        return self.f.value_at_quantile(self._sketch(arg, "tdigest"), quantile)
+
     def visit_BitXor(self, op, *, arg, where):
         a, b = map(sg.to_identifier, "ab")
         input_fn = combine_fn = sge.Lambda(
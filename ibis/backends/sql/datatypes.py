@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import re
 from functools import partial
 from typing import NoReturn
 
@@ -112,6 +114,63 @@ _geotypes = {
 }
 
 
+# single word type names, such as `BIGINT` or `VARCHAR`
+_SIMPLE_TYPE_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# types whose parsing applies dialect specific defaults (e.g., the precision of
+# a bare DECIMAL) or that wrap other types, which must go through the parser
+_NOT_SIMPLE_TYPES = frozenset(
+    {
+        *sge.DataType.NESTED_TYPES,
+        typecode.DECIMAL,
+        typecode.LOWCARDINALITY,
+        typecode.RANGE,
+    }
+)
+
+
+@functools.cache
+def _simple_types(dialect: str | None) -> dict[str, sge.DataType.Type]:
+    """Map the single word type names of `dialect` to their sqlglot type.
+
+    This is the result of tokenizing and parsing the name, without the
+    overhead of running the parser.
+    """
+    dialect = sg.Dialect.get_or_raise(dialect)
+    type_tokens = dialect.parser_class.TYPE_TOKENS
+    simple_types = {}
+    for name, token in dialect.tokenizer_class.KEYWORDS.items():
+        if (
+            token in type_tokens
+            and _SIMPLE_TYPE_NAME.fullmatch(name) is not None
+            and (typ := getattr(typecode, token.value, None)) is not None
+            and typ not in _NOT_SIMPLE_TYPES
+        ):
+            simple_types[name] = typ
+    return simple_types
+
+
+def _parse_type(dialect: str | None, text: str) -> sge.DataType:
+    if (typ := _simple_types(dialect).get(text.upper())) is not None:
+        return sge.DataType(this=typ)
+
+    try:
+        return sg.parse_one(text, into=sge.DataType, read=dialect)
+    except sg.errors.ParseError:
+        # If sqlglot can't parse the type fall back to USERDEFINED,
+        # which will then get turned into ibis.dt.Unknown
+        return sge.DataType(this=typecode.USERDEFINED, kind=text)
+
+
+# schemas repeat the same handful of type strings, so parsed types are cached
+# per type mapper; datatypes are immutable, so cached instances can be shared
+@functools.lru_cache(maxsize=4096)
+def _from_string(
+    mapper: type[SqlglotType], text: str, nullable: bool | None
+) -> dt.DataType:
+    return mapper.to_ibis(_parse_type(mapper.dialect, text), nullable=nullable)
+
+
 class SqlglotType(TypeMapper):
     dialect: str | None = None
     """The dialect this parser is for."""
@@ -186,13 +245,7 @@ class SqlglotType(TypeMapper):
         if nullable is None:
             nullable = cls.default_nullable
 
-        try:
-            sgtype = sg.parse_one(text, into=sge.DataType, read=cls.dialect)
-        except sg.errors.ParseError:
-            # If sqlglot can't parse the type fall back to USERDEFINED,
-            # which will then get turned into ibis.dt.Unknown
-            sgtype = sge.DataType(this=typecode.USERDEFINED, kind=text)
-        return cls.to_ibis(sgtype, nullable=nullable)
+        return _from_string(cls, text, nullable)
 
     @classmethod
     def to_string(cls, dtype: dt.DataType) -> str:
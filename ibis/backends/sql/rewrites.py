@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import collections
+import itertools
 import operator
 import sys
+import threading
+import weakref
 from collections.abc import Mapping
 from functools import reduce
 from typing import TYPE_CHECKING, Any
@@ -14,12 +18,15 @@ from public import public
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+import ibis.expr.rules as rlz
+from ibis import util
 from ibis.common.annotations import attribute
 from ibis.common.collections import FrozenDict  # noqa: TC001
 from ibis.common.deferred import var
 from ibis.common.graph import Graph
 from ibis.common.patterns import InstanceOf, Object, Pattern, replace
 from ibis.common.typing import VarTuple  # noqa: TC001
+from ibis.config import options
 from ibis.expr.rewrites import d, p, replace_parameter
 from ibis.expr.schema import Schema
 
@@ -332,9 +339,112 @@ def merge_select_select(_, **kwargs):
     return result if complexity(result) <= complexity(_) else _
 
 
+# values that only evaluate some of their arguments, depending on the others
+_CONDITIONAL_VALUES = (
+    ops.IfElse,
+    ops.SearchedCase,
+    ops.SimpleCase,
+    ops.Coalesce,
+    ops.And,
+    ops.Or,
+)
+
+
+def _hoistable_values(select, threshold):
+    """Find the value expressions repeated in `select` worth computing once."""
+    blocking = (
+        ops.Analytic,
+        ops.Reduction,
+        ops.WindowFunction,
+        ops.Subquery,
+        ops.Unnest,
+        ops.Impure,
+    )
+    # the predicates stay on the inner Select, where they guard the hoisted
+    # expressions, so they don't share them
+    roots = (*select.selections.values(), *select.qualified, *select.sort_keys)
+
+    # count the distinct expressions that every expression is an argument of,
+    # each of them evaluates it again unless the engine eliminates it. The
+    # arguments of conditional expressions may only be evaluated for rows that
+    # they're valid for, so they're never hoisted out of them.
+    uses = collections.Counter(roots)
+    values = InstanceOf(ops.Value) & ~InstanceOf(_CONDITIONAL_VALUES)
+    for node in Graph.from_bfs(roots, filter=values):
+        if isinstance(node, ops.Value):
+            uses.update(
+                {child for child in node.__children__ if isinstance(child, ops.Value)}
+            )
+
+    parents = frozenset((select.parent,))
+    candidates = [
+        node
+        for node, count in uses.items()
+        if count > 1
+        and not isinstance(node, (ops.Field, ops.Literal, ops.SortKey))
+        and node.relations == parents
+        and complexity(node) >= threshold
+        and not node.find(blocking, filter=ops.Value)
+    ]
+    # only hoist the outermost of nested repeated expressions
+    nested = {
+        child
+        for node in candidates
+        for child in node.find_below(ops.Value, filter=ops.Value)
+    }
+    return [node for node in candidates if node not in nested]
+
+
+@replace(Object(Select))
+def hoist_common_values(_, threshold, **kwargs):
+    """Compute repeated expensive value expressions once in a subquery.
+
+    Value expressions that are used more than once by the selections or sort
+    keys of a Select and whose complexity is at least `threshold` are
+    computed by an inner Select, which also applies the predicates, and the
+    outer Select references them like a column. Impure expressions are never
+    hoisted, since evaluating them once would change the result, and neither
+    are the arguments of conditional expressions, which may be invalid for
+    the rows they aren't evaluated for.
+    """
+    if not (hoisted := _hoistable_values(_, threshold)):
+        return _
+
+    parent = _.parent
+    names = (
+        name
+        for name in map("_ibis_cse_{}".format, itertools.count())
+        if name not in parent.schema
+    )
+    selections = {name: ops.Field(parent, name) for name in parent.schema}
+    selections.update(zip(names, hoisted))
+    # filter the rows before computing the hoisted expressions, which may not
+    # be valid for the rows that the predicates drop
+    inner = Select(parent, selections=selections, predicates=_.predicates)
+
+    subs = {value: ops.Field(inner, name) for name, value in selections.items()}
+
+    def rebase(node, kwargs):
+        # replace the hoisted expressions before their arguments are replaced
+        if (field := subs.get(node)) is not None:
+            return field
+        return node.__recreate__(kwargs) if kwargs else node
+
+    def sub(value):
+        return value.replace(rebase, filter=ops.Value)
+
+    return Select(
+        inner,
+        selections={name: sub(value) for name, value in _.selections.items()},
+        qualified=tuple(map(sub, _.qualified)),
+        sort_keys=tuple(map(sub, _.sort_keys)),
+        distinct=_.distinct,
+    )
+
+
 def extract_ctes(node: ops.Relation) -> set[ops.Relation]:
     cte_types = (Select, ops.Aggregate, ops.JoinChain, ops.Set, ops.Limit, ops.Sample)
-    dont_count = (ops.Field, ops.CountStar, ops.CountDistinctStar)
+    dont_count = (ops.Field, ops.CountStar, ops.ApproxCountStar, ops.CountDistinctStar)
 
     g = Graph.from_bfs(node, filter=~InstanceOf(dont_count))
     result = set()
@@ -353,6 +463,8 @@ def sqlize(
     rewrites: Sequence[Pattern] = (),
     post_rewrites: Sequence[Pattern] = (),
     fuse_selects: bool = True,
+    *,
+    cse_threshold: int | None = None,
 ) -> tuple[ops.Node, list[ops.Node]]:
     """Lower the ibis expression graph to a SQL-like relational algebra.
 
@@ -368,6 +480,9 @@ def sqlize(
         Supplementary rewrites to apply after SQL-specific transforms.
     fuse_selects
         Whether to merge subsequent Select nodes into one where possible.
+    cse_threshold
+        Complexity from which value expressions used more than once by a
+        Select are computed once in a subquery. `None` disables it.
 
     Returns
     -------
@@ -403,6 +518,12 @@ def sqlize(
     if post_rewrites:
         result = result.replace(reduce(operator.or_, post_rewrites))
 
+    # compute repeated expensive expressions once
+    if cse_threshold is not None:
+        result = result.replace(
+            hoist_common_values, context={"threshold": cse_threshold}
+        )
+
     # extract common table expressions while wrapping them in a CTE node
     ctes = extract_ctes(result)
 
@@ -659,6 +780,84 @@ def lower_sample(
     return lower
 
 
+def _large_in_values_options(op: ops.InValues) -> tuple[Any, ...] | None:
+    """Return the option values of `op` if it should be lowered, else `None`."""
+    threshold = options.sql.isin_lowering_threshold
+    if threshold is None or len(op.options) <= threshold:
+        return None
+    # only non-null literals are lowered, anything else changes the semantics
+    # or can't be represented as a single array or table
+    if not all(
+        isinstance(option, ops.Literal) and option.value is not None
+        for option in op.options
+    ):
+        return None
+    return tuple(option.value for option in op.options)
+
+
+@replace(p.InValues)
+def lower_in_values_to_array(_, **kwargs):
+    """Lower an `InValues` with many literal options to an array membership check."""
+    if (values := _large_in_values_options(_)) is None:
+        return _
+    dtype = dt.highest_precedence(option.dtype for option in _.options)
+    contains = ops.ArrayContains(ops.Literal(values, dtype=dt.Array(dtype)), _.value)
+    # `x IN (...)` is NULL when `x` is NULL, which isn't the case for most
+    # backends' array membership functions
+    return ops.IfElse(
+        ops.IsNull(_.value), ops.Literal(None, dtype=dt.boolean), contains
+    )
+
+
+# the relations that `isin` operations are lowered to. Registering memtables
+# and compiling lower an expression separately, so both must get the same
+# memtable, which mustn't outlive the operation.
+_in_values_relations: weakref.WeakKeyDictionary[ops.InValues, ops.Project] = (
+    weakref.WeakKeyDictionary()
+)
+_in_values_relations_lock = threading.Lock()
+
+
+def _in_values_relation(op: ops.InValues) -> ops.Project:
+    import pyarrow as pa
+
+    from ibis.formats.pyarrow import PyArrowTableProxy, PyArrowType
+
+    with _in_values_relations_lock:
+        if (rel := _in_values_relations.get(op)) is not None:
+            return rel
+
+    dtype = dt.highest_precedence(option.dtype for option in op.options)
+    values = pa.array(
+        [option.value for option in op.options], type=PyArrowType.from_ibis(dtype)
+    )
+    memtable = ops.InMemoryTable(
+        name=util.gen_name("isin_memtable"),
+        schema=Schema({"value": dtype}),
+        data=PyArrowTableProxy(pa.table({"value": values})),
+    )
+    rel = ops.Project(memtable, {"value": ops.Field(memtable, "value")})
+    with _in_values_relations_lock:
+        return _in_values_relations.setdefault(op, rel)
+
+
+@replace(p.InValues)
+def lower_in_values_to_memtable(_, **kwargs):
+    """Lower an `InValues` with many literal options to a semi-join.
+
+    The options are moved into an in-memory table, which is registered along
+    with any other memtables before the query is executed. The same operation
+    produces the same table for as long as it's alive, so compiling an
+    expression again doesn't create a new table.
+    """
+    if _large_in_values_options(_) is None:
+        return _
+    rel = _in_values_relation(_)
+    if not rlz.comparable(rel.values["value"], _.value):
+        return _
+    return ops.InSubquery(rel, needle=_.value)
+
+
 @replace(p.ArrayMap | p.ArrayFilter)
 def subtract_one_from_array_map_filter_index(_, **kwargs):
     # no index argument, so do nothing
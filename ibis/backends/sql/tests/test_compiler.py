@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import gc
+import weakref
+
 import sqlglot as sg
 
 import ibis
 from ibis import _
 from ibis.backends.sql.dialects import Trino
+from ibis.backends.sql.rewrites import _in_values_relation
 
 
 def test_window_with_row_number_compiles():
@@ -26,3 +30,87 @@ def test_transpile_join():
         "SELECT * FROM t1 JOIN t2 ON x = y", read="duckdb", write=Trino
     )
     assert "CROSS JOIN" not in result
+
+
+def test_large_isin_is_lowered(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "isin_lowering_threshold", 3)
+    t = ibis.table({"x": "int64"}, name="t")
+
+    small = ibis.to_sql(t.x.isin([1, 2, 3]), dialect="postgres")
+    assert "IN (1, 2, 3)" in small
+
+    array = ibis.to_sql(t.x.isin([1, 2, 3, 4]), dialect="postgres")
+    assert "ARRAY[1, 2, 3, 4]" in array
+    assert " IN " not in array
+
+    # the same options are always lowered to the same in-memory table
+    expr = t.x.isin([1, 2, 3, 4])
+    memtable = ibis.to_sql(expr, dialect="sqlite")
+    assert "ibis_isin_memtable_" in memtable
+    assert memtable == ibis.to_sql(expr, dialect="sqlite")
+
+
+def test_large_isin_memtable_is_released(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "isin_lowering_threshold", 3)
+    t = ibis.table({"x": "int64"}, name="t")
+
+    expr = t.x.isin(list(range(10)))
+    rel = _in_values_relation(expr.op())
+    assert rel is _in_values_relation(expr.op())
+
+    # lists that merely share some of their options get their own tables
+    other = t.x.isin(list(range(11)))
+    other_rel = _in_values_relation(other.op())
+    assert other_rel.parent != rel.parent
+
+    memtable = weakref.ref(rel.parent)
+    del expr, rel
+    gc.collect()
+    assert memtable() is None
+    assert _in_values_relation(other.op()) is other_rel
+
+
+def test_large_isin_with_null_is_not_lowered(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "isin_lowering_threshold", 3)
+    t = ibis.table({"x": "int64"}, name="t")
+
+    sql = ibis.to_sql(t.x.isin([1, 2, 3, None]), dialect="sqlite")
+    assert "ibis_isin_memtable_" not in sql
+
+
+def test_repeated_values_are_hoisted(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 3)
+    t = ibis.table({"s": "string", "x": "int64"}, name="t")
+    num = t.s.re_extract(r"(\d+)", 1).cast("int64")
+    expr = t.filter(num > 3).mutate(a=num + 1, b=num * 2).order_by(num)
+
+    sql = ibis.to_sql(expr, dialect="sqlite")
+    # once for the selections and sort key, and once for the predicate
+    assert sql.count("_IBIS_REGEX_EXTRACT") == 2
+    assert "_ibis_cse_0" in sql
+
+    # cheap expressions are left alone
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 10)
+    assert ibis.to_sql(expr, dialect="sqlite").count("_IBIS_REGEX_EXTRACT") == 4
+
+
+def test_conditional_values_are_not_hoisted(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 1)
+    t = ibis.table({"s": "string"}, name="t")
+    valid = t.s != "abc"
+    num = t.s.cast("int64")
+    expr = t.select(a=valid.ifelse(num + 1, 0), b=valid.ifelse(num * 2, 0))
+
+    sql = ibis.to_sql(expr, dialect="duckdb")
+    assert "_ibis_cse_" not in sql
+
+
+def test_impure_values_are_not_hoisted(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 1)
+    t = ibis.table({"x": "float64"}, name="t")
+    rand = ibis.random() * t.x
+    expr = t.mutate(a=rand + 1, b=rand + 2)
+
+    sql = ibis.to_sql(expr, dialect="duckdb")
+    assert sql.count("RANDOM()") == 2
+    assert "_ibis_cse_" not in sql
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hypothesis as h
 import hypothesis.strategies as st
 import pytest
+import sqlglot as sg
 import sqlglot.expressions as sge
 
 import ibis
@@ -14,7 +15,10 @@ from ibis.backends.sql.datatypes import (
     DuckDBType,
     PostgresType,
     SqlglotType,
+    _parse_type,
+    _simple_types,
 )
+from ibis.util import get_subclasses
 
 
 def assert_dtype_roundtrip(ibis_type, sqlglot_expected=None):
@@ -133,3 +137,29 @@ def test_unknown_repr():
     result = str(dtype)
     expected = 'unknown(DataType(this=Type.USERDEFINED, kind="MySchema"."MyEnum"))'
     assert result == expected
+
+
+TYPE_MAPPERS = sorted(
+    (mapper for mapper in get_subclasses(SqlglotType) if mapper.dialect is not None),
+    key=lambda mapper: mapper.__name__,
+)
+
+
+@pytest.mark.parametrize("mapper", TYPE_MAPPERS, ids=lambda mapper: mapper.__name__)
+def test_simple_types_match_parser(mapper):
+    dialect = mapper.dialect
+    for name in _simple_types(dialect):
+        for text in (name, name.lower()):
+            expected = sg.parse_one(text, into=sge.DataType, read=dialect)
+            assert _parse_type(dialect, text) == expected, text
+
+
+def test_from_string_is_cached(mocker):
+    spy = mocker.spy(sg, "parse_one")
+    text = "STRUCT(a INTEGER, b VARCHAR[])"
+    first = DuckDBType.from_string(text)
+    assert DuckDBType.from_string(text) is first
+    assert spy.call_count <= 1
+
+    # nullability is part of the key
+    assert not DuckDBType.from_string(text, nullable=False).nullable
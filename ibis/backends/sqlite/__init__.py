@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import sqlite3
+import time
 from typing import TYPE_CHECKING, Any
 
 import sqlglot as sg
@@ -22,6 +23,7 @@ from ibis.backends import (
     SupportsTempTables,
     UrlFromPath,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, from_edges
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import C
 from ibis.backends.sqlite.converter import SQLitePandasData
@@ -155,10 +157,32 @@ class Backend(
         register_all(self.con)
         self.con.execute("PRAGMA case_sensitive_like = ON")
 
+    def _connect_worker(self) -> Backend:
+        sqlite3 = _init_sqlite3()
+
+        databases = {
+            name: path
+            for _, name, path in self.con.execute("PRAGMA database_list")
+            if name != "temp"
+        }
+        if not databases["main"] or len(databases) > 1:
+            raise NotImplementedError(
+                "In-memory and attached SQLite databases can't be shared with "
+                "another connection"
+            )
+        con = sqlite3.connect(databases["main"], check_same_thread=False)
+        return self.from_connection(con, type_map=self._type_map)
+
+    def _list_connection_local_tables(self) -> frozenset[str]:
+        query = "SELECT name FROM sqlite_temp_master WHERE type IN ('table', 'view')"
+        return frozenset(name for (name,) in self.con.execute(query))
+
     def raw_sql(self, query: str | sg.Expression, **kwargs: Any) -> Any:
         if not isinstance(query, str):
             query = query.sql(dialect=self.name)
-        return self.con.execute(query, **kwargs)
+        result = self.con.execute(query, **kwargs)
+        self._clear_result_caches_for(query)
+        return result
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
@@ -213,6 +237,29 @@ class Backend(
 
         return self._filter_with_like(results, like)
 
+    def _estimate_rows(
+        self, name: str, /, *, catalog: str | None, database: str | None
+    ) -> int | None:
+        sqlite3 = _init_sqlite3()
+
+        # sqlite_stat1 only exists once ANALYZE has been run. Every row starts
+        # with the number of rows in the table, except for partial indexes, so
+        # prefer the row describing the table itself.
+        sql = (
+            sg.select(C.stat)
+            .from_(sg.table("sqlite_stat1", db=database or "main"))
+            .where(C.tbl.eq(sge.convert(name)))
+            .order_by(C.idx.is_(sge.Null()).desc())
+            .limit(1)
+            .sql(self.dialect)
+        )
+        try:
+            with self._safe_raw_sql(sql) as cur:
+                row = cur.fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return None if row is None else int(row[0].split(maxsplit=1)[0])
+
     def _parse_type(self, typ: str, nullable: bool) -> dt.DataType:
         typ = typ.lower()
         try:
@@ -326,6 +373,32 @@ class Backend(
 
         return schema
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        with self._safe_raw_sql(f"EXPLAIN QUERY PLAN {query}") as cur:
+            rows = cur.fetchall()
+
+        root = from_edges(
+            ((id, parent, PlanNode(name=detail)) for id, parent, _, detail in rows),
+            root_name="QUERY PLAN",
+        )
+
+        # SQLite doesn't collect per-operator statistics, so the best we can
+        # do when analyzing is to time the query as a whole
+        execution_time = None
+        if analyze:
+            start = time.perf_counter()
+            with self._safe_raw_sql(query) as cur:
+                cur.fetchall()
+            execution_time = time.perf_counter() - start
+
+        return QueryPlan(
+            query=query,
+            raw="\n".join(f"{id}|{parent}|{detail}" for id, parent, _, detail in rows),
+            root=root,
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
+
     def _fetch_from_cursor(
         self, cursor: sqlite3.Cursor, schema: sch.Schema
     ) -> pd.DataFrame:
@@ -349,9 +422,10 @@ class Backend(
 
         self._run_pre_execute_hooks(expr)
 
-        schema = expr.as_table().schema()
+        table = self._resolve_approx_counts(expr)
+        schema = table.schema()
         with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
+            self.compile(table, limit=limit, params=params)
         ) as cursor:
             df = self._fetch_from_cursor(cursor, schema)
         table = pa.Table.from_pandas(
@@ -368,20 +442,32 @@ class Backend(
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         catalog = "temp"
-        table = sg.table(name := op.name, quoted=self.compiler.quoted, catalog=catalog)
-        create_stmt = self._generate_create_table(table, schema := op.schema).sql(
-            self.dialect
-        )
-        df = op.data.to_frame()
+        table = sg.table(op.name, quoted=self.compiler.quoted, catalog=catalog)
+        create_stmt = self._generate_create_table(table, op.schema).sql(self.dialect)
 
-        data = df.itertuples(index=False)
-        insert_stmt = self._build_insert_template(
-            name, schema=schema, catalog=catalog, columns=True
-        )
+        sqlite3 = _init_sqlite3()
+
+        # the limit can only be queried as of Python 3.11
+        if (limit := getattr(sqlite3, "SQLITE_LIMIT_VARIABLE_NUMBER", None)) is None:
+            max_parameters = 999
+        else:
+            max_parameters = self.con.getlimit(limit)
 
         with self.begin() as cur:
             cur.execute(create_stmt)
-            cur.executemany(insert_stmt, data)
+            self._insert_in_memory_table(
+                cur, op, catalog=catalog, max_parameters=max_parameters
+            )
+
+    def _in_memory_column_values(self, column: pa.Array) -> list:
+        import pyarrow as pa
+
+        values = super()._in_memory_column_values(column)
+        if pa.types.is_timestamp(column.type):
+            # bind timestamps the same way as the adapter for pandas
+            # Timestamps, since the default datetime adapter is deprecated
+            return [None if value is None else value.isoformat() for value in values]
+        return values
 
     def _register_udfs(self, expr: ir.Expr) -> None:
         import ibis.expr.operations as ops
@@ -552,6 +638,8 @@ class Backend(
                     f"ALTER TABLE {created_table.sql(dialect)} RENAME TO {quoted_name}"
                 )
 
+        self._clear_result_caches()
+
         if schema is None:
             return self.table(name, database=database)
 
@@ -575,6 +663,7 @@ class Backend(
         )
         with self._safe_raw_sql(drop_stmt):
             pass
+        self._clear_result_caches()
 
     def create_view(
         self,
@@ -602,6 +691,7 @@ class Backend(
             for stmt in stmts:
                 cur.execute(stmt)
 
+        self._clear_result_caches()
         return self.table(name, database=database)
 
     def insert(
@@ -647,3 +737,4 @@ class Backend(
             if overwrite:
                 cur.execute(sge.Delete(this=table).sql(dialect))
             cur.execute(insert_stmt)
+        self._clear_result_caches()
@@ -110,3 +110,37 @@ def test_create_table_from_in_memory_data(temp):
     con.create_table("foo", pd.DataFrame({"id": [1, 2, 3]}), temp=temp)
 
     assert con.list_tables() == ["foo"]
+
+
+def test_estimate_rows_from_analyze():
+    con = ibis.sqlite.connect()
+    t = con.create_table("foo", pd.DataFrame({"id": range(100)}))
+    expr = t.count(approx=True)
+
+    # no statistics until ANALYZE is run, so rows are counted
+    assert con.estimate_rows(t) is None
+    assert con.execute(expr) == 100
+
+    con.raw_sql("ANALYZE")
+    assert con.estimate_rows(t) == 100
+
+    # the estimate is read when the expression is executed, so it's only as
+    # fresh as the statistics
+    con.insert("foo", pd.DataFrame({"id": range(50)}))
+    assert con.execute(expr) == 100
+    con.raw_sql("ANALYZE")
+    assert con.execute(expr) == 150
+
+
+def test_approx_count_compiles_exactly():
+    con = ibis.sqlite.connect()
+    t = con.create_table("foo", pd.DataFrame({"id": range(100)}))
+    con.raw_sql("ANALYZE")
+    expr = t.count(approx=True)
+
+    # estimates are only read on execution, never embedded in SQL
+    assert "COUNT(*)" in con.compile(expr)
+    view = con.create_view("bar", expr.as_table())
+    con.insert("foo", pd.DataFrame({"id": range(50)}))
+    assert con.execute(view).iat[0, 0] == 150
+    assert con.execute(expr) == 100
@@ -0,0 +1,11 @@
+SELECT
+  hll_count.merge_partial(`t1`.`sketch`) AS `merged`,
+  hll_count.extract(hll_count.merge_partial(`t1`.`sketch`)) AS `estimate`
+FROM (
+  SELECT
+    `t0`.`g`,
+    hll_count.init(`t0`.`x`) AS `sketch`
+  FROM `t` AS `t0`
+  GROUP BY
+    1
+) AS `t1`
\ No newline at end of file
@@ -0,0 +1,13 @@
+SELECT
+  CAST(uniqCombinedMergeState(CAST("t1"."sketch" AS AggregateFunction(uniqCombined, UInt64))) AS Nullable(String)) AS "merged",
+  finalizeAggregation(
+    CAST(CAST(uniqCombinedMergeState(CAST("t1"."sketch" AS AggregateFunction(uniqCombined, UInt64))) AS Nullable(String)) AS AggregateFunction(uniqCombined, UInt64))
+  ) AS "estimate"
+FROM (
+  SELECT
+    "t0"."g" AS "g",
+    CAST(uniqCombinedState(cityHash64("t0"."x")) AS Nullable(String)) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    "t0"."g"
+) AS "t1"
\ No newline at end of file
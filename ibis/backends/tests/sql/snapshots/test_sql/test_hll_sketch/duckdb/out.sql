@@ -0,0 +1,11 @@
+SELECT
+  IBIS_HLL_MERGE(ARRAY_AGG("t1"."sketch")) AS "merged",
+  IBIS_HLL_ESTIMATE(IBIS_HLL_MERGE(ARRAY_AGG("t1"."sketch"))) AS "estimate"
+FROM (
+  SELECT
+    "t0"."g",
+    IBIS_HLL_SKETCH(ARRAY_AGG(ENCODE(CAST("t0"."x" AS TEXT)))) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
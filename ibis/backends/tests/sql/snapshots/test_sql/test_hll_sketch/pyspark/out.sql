@@ -0,0 +1,11 @@
+SELECT
+  HLL_UNION_AGG(`t1`.`sketch`) AS `merged`,
+  HLL_SKETCH_ESTIMATE(HLL_UNION_AGG(`t1`.`sketch`)) AS `estimate`
+FROM (
+  SELECT
+    `t0`.`g`,
+    HLL_SKETCH_AGG(`t0`.`x`) AS `sketch`
+  FROM `t` AS `t0`
+  GROUP BY
+    1
+) AS `t1`
\ No newline at end of file
@@ -0,0 +1,11 @@
+SELECT
+  HLL_COMBINE("t1"."sketch") AS "merged",
+  HLL_ESTIMATE(HLL_COMBINE("t1"."sketch")) AS "estimate"
+FROM (
+  SELECT
+    "t0"."g",
+    HLL_ACCUMULATE("t0"."x") AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
@@ -0,0 +1,13 @@
+SELECT
+  CAST(MERGE(CAST("t1"."sketch" AS HYPERLOGLOG)) AS VARBINARY) AS "merged",
+  CARDINALITY(
+    CAST(CAST(MERGE(CAST("t1"."sketch" AS HYPERLOGLOG)) AS VARBINARY) AS HYPERLOGLOG)
+  ) AS "estimate"
+FROM (
+  SELECT
+    "t0"."g",
+    CAST(APPROX_SET("t0"."x") AS VARBINARY) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
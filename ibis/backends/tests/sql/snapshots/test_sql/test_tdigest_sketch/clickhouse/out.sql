@@ -0,0 +1,16 @@
+SELECT
+  CAST(quantileTDigestMergeState(CAST("t1"."sketch" AS AggregateFunction(quantileTDigest, Float64))) AS Nullable(String)) AS "merged",
+  arrayReduce(
+    'quantileTDigestMerge(0.5)',
+    [
+      CAST(CAST(quantileTDigestMergeState(CAST("t1"."sketch" AS AggregateFunction(quantileTDigest, Float64))) AS Nullable(String)) AS AggregateFunction(quantileTDigest, Float64))
+    ]
+  ) AS "median"
+FROM (
+  SELECT
+    "t0"."g" AS "g",
+    CAST(quantileTDigestState(toFloat64("t0"."x")) AS Nullable(String)) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    "t0"."g"
+) AS "t1"
\ No newline at end of file
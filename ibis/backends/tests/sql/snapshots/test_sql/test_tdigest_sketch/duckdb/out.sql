@@ -0,0 +1,11 @@
+SELECT
+  IBIS_TDIGEST_MERGE(ARRAY_AGG("t1"."sketch")) AS "merged",
+  IBIS_TDIGEST_QUANTILE(IBIS_TDIGEST_MERGE(ARRAY_AGG("t1"."sketch")), CAST(0.5 AS DOUBLE)) AS "median"
+FROM (
+  SELECT
+    "t0"."g",
+    IBIS_TDIGEST_SKETCH(ARRAY_AGG(CAST("t0"."x" AS DOUBLE))) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
@@ -0,0 +1,25 @@
+SELECT
+  TO_BINARY(
+    TO_JSON(APPROX_PERCENTILE_COMBINE(PARSE_JSON(TO_CHAR("t1"."sketch", 'UTF-8')))),
+    'UTF-8'
+  ) AS "merged",
+  APPROX_PERCENTILE_ESTIMATE(
+    PARSE_JSON(
+      TO_CHAR(
+        TO_BINARY(
+          TO_JSON(APPROX_PERCENTILE_COMBINE(PARSE_JSON(TO_CHAR("t1"."sketch", 'UTF-8')))),
+          'UTF-8'
+        ),
+        'UTF-8'
+      )
+    ),
+    0.5
+  ) AS "median"
+FROM (
+  SELECT
+    "t0"."g",
+    TO_BINARY(TO_JSON(APPROX_PERCENTILE_ACCUMULATE("t0"."x")), 'UTF-8') AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
@@ -0,0 +1,14 @@
+SELECT
+  CAST(MERGE(CAST("t1"."sketch" AS TDIGEST)) AS VARBINARY) AS "merged",
+  VALUE_AT_QUANTILE(
+    CAST(CAST(MERGE(CAST("t1"."sketch" AS TDIGEST)) AS VARBINARY) AS TDIGEST),
+    CAST(0.5 AS DOUBLE)
+  ) AS "median"
+FROM (
+  SELECT
+    "t0"."g",
+    CAST(TDIGEST_AGG(CAST("t0"."x" AS DOUBLE)) AS VARBINARY) AS "sketch"
+  FROM "t" AS "t0"
+  GROUP BY
+    1
+) AS "t1"
\ No newline at end of file
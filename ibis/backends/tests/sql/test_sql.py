@@ -20,6 +20,7 @@ import pytest
 from pytest import param
 
 import ibis
+import ibis.common.exceptions as com
 from ibis import _
 from ibis.backends.tests.sql.conftest import to_sql
 from ibis.tests.util import assert_decompile_roundtrip
@@ -679,3 +680,43 @@ def test_struct_field_simplified(snapshot, accessor):
     for _i in range(5):
         s = ibis.struct({"i": accessor(s, "i") + 1, "s": accessor(s, "s") + "bar"})
     snapshot.assert_match(ibis.to_sql(s.i, dialect="duckdb"), "out.sql")
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        "bigquery",
+        "clickhouse",
+        "databricks",
+        "duckdb",
+        "pyspark",
+        "snowflake",
+        "trino",
+    ],
+)
+def test_hll_sketch(snapshot, dialect):
+    t = ibis.table({"g": "string", "x": "int64"}, name="t")
+    sketches = t.group_by("g").agg(sketch=t.x.hll_sketch())
+    expr = sketches.agg(
+        merged=sketches.sketch.hll_merge(),
+        estimate=sketches.sketch.hll_merge().hll_estimate(),
+    )
+    snapshot.assert_match(ibis.to_sql(expr, dialect=dialect), "out.sql")
+
+
+@pytest.mark.parametrize("dialect", ["clickhouse", "duckdb", "snowflake", "trino"])
+def test_tdigest_sketch(snapshot, dialect):
+    t = ibis.table({"g": "string", "x": "int64"}, name="t")
+    sketches = t.group_by("g").agg(sketch=t.x.tdigest_sketch())
+    expr = sketches.agg(
+        merged=sketches.sketch.tdigest_merge(),
+        median=sketches.sketch.tdigest_merge().tdigest_quantile(0.5),
+    )
+    snapshot.assert_match(ibis.to_sql(expr, dialect=dialect), "out.sql")
+
+
+@pytest.mark.parametrize("dialect", ["postgres", "sqlite"])
+def test_sketches_unsupported(dialect):
+    t = ibis.table({"x": "int64"}, name="t")
+    with pytest.raises(com.OperationNotDefinedError):
+        ibis.to_sql(t.agg(sketch=t.x.hll_sketch()), dialect=dialect)
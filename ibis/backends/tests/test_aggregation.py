@@ -688,10 +688,6 @@ def test_first_last_ordered(alltypes, method, filtered, include_null):
         assert res == sol
 
 
-@pytest.mark.notimpl(
-    ["polars"],
-    raises=com.OperationNotDefinedError,
-)
 @pytest.mark.notimpl(
     ["risingwave"],
     raises=PsycoPg2InternalError,
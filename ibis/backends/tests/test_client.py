@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import builtins
+import concurrent.futures
 import contextlib
 import importlib
 import inspect
@@ -10,6 +11,8 @@ import re
 import string
 import subprocess
 import sys
+import threading
+import time
 from operator import itemgetter
 from typing import TYPE_CHECKING
 
@@ -2020,6 +2023,46 @@ def test_memtable_registered_exactly_once(con, mocker):
     spy.assert_called_once_with(t.op())
 
 
+def test_memtable_registered_exactly_once_concurrently(con, mocker):
+    # widen the window between checking and registering the memtable
+    register = mocker.patch.object(
+        con, "_register_in_memory_table", side_effect=lambda _: time.sleep(0.01)
+    )
+    mocker.patch.object(con, "_make_memtable_finalizer", return_value=None)
+
+    t = ibis.memtable({"a": [1, 2, 3]})
+    barrier = threading.Barrier(8)
+
+    def run():
+        barrier.wait()
+        con._register_in_memory_tables(t)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(run) for _ in range(8)]:
+            future.result()
+
+    register.assert_called_once_with(t.op())
+
+
+@pytest.mark.notimpl(["druid"])
+@pytest.mark.notimpl(
+    ["flink"],
+    reason="Flink backend supports creating only TEMPORARY VIEW for in-memory data.",
+)
+def test_estimate_rows(con, temp_table):
+    t = con.create_table(temp_table, ibis.memtable({"a": [1, 2, 3]}))
+
+    # not every backend keeps statistics, or keeps them up to date
+    estimate = con.estimate_rows(t)
+    assert estimate is None or estimate >= 0
+    assert con.estimate_rows(temp_table) == estimate
+    assert con.estimate_rows(t.filter(t.a > 1)) is None
+
+    expected = 3 if estimate is None else estimate
+    assert con.execute(t.count(approx=True)) == expected
+    assert con.execute(t.count(where=t.a > 1, approx=True)) == 2
+
+
 def test_stateful_data_is_loaded_once(
     con, data_dir, tmp_path_factory, worker_id, mocker
 ):
@@ -2039,3 +2082,77 @@ def test_stateful_data_is_loaded_once(
     # Ensure that the stateful load is called only once the one time it is
     # called is from the `con` input, which *should* work across processes
     spy.assert_not_called()
+
+
+def test_execute_many(con, alltypes):
+    t = ibis.memtable({"x": [1, 2, 3]})
+    exprs = [alltypes.count(), alltypes.int_col.max(), t.x.sum(), t.count()]
+
+    result = con.execute_many(exprs, max_concurrency=2)
+
+    assert result == [con.execute(expr) for expr in exprs]
+
+
+def test_execute_many_fuse(backend, con, alltypes):
+    t = alltypes.filter(alltypes.bool_col)
+    exprs = [
+        alltypes.count(),
+        alltypes.int_col.max(),
+        t.count(),
+        t.double_col.sum(where=t.int_col > 3),
+        t.filter(t.int_col < 5).string_col.nunique(),
+        alltypes.group_by("bool_col").agg(n=alltypes.count()).order_by("bool_col"),
+    ]
+
+    *result, grouped = con.execute_many(exprs, fuse=True)
+    *expected, expected_grouped = (con.execute(expr) for expr in exprs)
+
+    assert result == pytest.approx(expected)
+    backend.assert_frame_equal(grouped, expected_grouped)
+
+
+@mark.notimpl(["trino", "druid", "athena"], reason="doesn't implement temporary tables")
+@mark.notimpl(["exasol"], reason="Exasol does not support temporary tables")
+@pytest.mark.notimpl(
+    ["impala", "pyspark"],
+    reason="temporary tables not implemented",
+    raises=NotImplementedError,
+)
+@pytest.mark.never(
+    ["risingwave", "databricks"],
+    raises=com.UnsupportedOperationError,
+    reason="Feature is not yet implemented: CREATE TEMPORARY TABLE",
+)
+@pytest.mark.notyet(
+    ["datafusion"],
+    raises=Exception,
+    reason="temp tables are not supported upstream in datafusion",
+)
+@pytest.mark.notimpl(
+    ["flink"], reason="`tbl_properties` is required when creating temporary tables"
+)
+def test_execute_many_temp_table(con):
+    t = con.create_table(
+        gen_name("execute_many_temp"), ibis.memtable({"x": [1, 2, 3]}), temp=True
+    )
+    exprs = [t.x.sum(), t.count(), t.x.max()]
+
+    assert con.execute_many(exprs) == [6, 3, 3]
+    assert con.execute_many(exprs, fuse=True) == [6, 3, 3]
+
+
+def test_execute_many_return_exceptions(con, alltypes):
+    missing = ops.DatabaseTable(
+        gen_name("missing"),
+        schema=ibis.schema({"x": "int64"}),
+        source=con,
+        namespace=ops.Namespace(),
+    ).to_expr()
+    exprs = [alltypes.count(), missing.count()]
+
+    first, second = con.execute_many(exprs, return_exceptions=True)
+    assert first == con.execute(alltypes.count())
+    assert isinstance(second, Exception)
+
+    with pytest.raises(type(second)):
+        con.execute_many(exprs)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import pytest
+
+import ibis
+import ibis.common.exceptions as com
+from ibis.backends.explain import (
+    PlanNode,
+    QueryPlan,
+    from_edges,
+    from_indented,
+    to_seconds,
+)
+
+pytestmark = [
+    pytest.mark.notimpl(
+        [
+            "athena",
+            "bigquery",
+            "databricks",
+            "druid",
+            "exasol",
+            "flink",
+            "mssql",
+            "mysql",
+            "oracle",
+            "pyspark",
+            "risingwave",
+            "singlestoredb",
+        ],
+        raises=NotImplementedError,
+    )
+]
+
+
+@pytest.fixture
+def expr(alltypes):
+    t = alltypes.filter(alltypes.int_col > 1)
+    return t.group_by("string_col").agg(total=t.double_col.sum())
+
+
+def test_explain(con, expr):
+    plan = con.explain(expr)
+
+    assert isinstance(plan, QueryPlan)
+    assert plan.raw
+    assert str(plan) == plan.raw
+    assert not plan.analyzed
+
+
+@pytest.mark.notyet(
+    ["impala", "materialize"], reason="plan output isn't a tree", raises=AssertionError
+)
+def test_explain_tree(con, expr):
+    plan = con.explain(expr)
+
+    assert plan.root is not None
+    assert all(isinstance(node, PlanNode) for node in plan.walk())
+    assert len(list(plan.walk())) > 1
+
+
+@pytest.mark.never(["polars"], reason="not a SQL backend", raises=AttributeError)
+def test_explain_sql(con, expr):
+    query = con.compile(expr)
+    plan = con.explain(query)
+    assert plan.query == query
+
+
+@pytest.mark.notyet(
+    ["impala", "materialize"],
+    reason="no support for analyzing plans",
+    raises=com.UnsupportedOperationError,
+)
+def test_explain_analyze(con, expr):
+    plan = con.explain(expr, analyze=True)
+    assert plan.analyzed
+    assert plan.root is not None
+
+
+def test_explain_params(con, alltypes):
+    value = ibis.param("int64")
+    expr = alltypes.filter(alltypes.int_col > value)
+
+    plan = con.explain(expr, params={value: 1})
+    assert "1" in plan.query
+
+
+def test_from_edges():
+    rows = [
+        (1, None, PlanNode(name="Aggregate")),
+        (2, 1, PlanNode(name="Filter")),
+        (3, 2, PlanNode(name="Scan", estimated_rows=10.0)),
+    ]
+    root = from_edges(rows)
+    assert root.name == "Aggregate"
+    assert [node.name for node in root.walk()] == ["Aggregate", "Filter", "Scan"]
+    assert root.find("scan")[0].estimated_rows == 10.0
+
+
+def test_from_edges_multiple_roots():
+    rows = [(1, 0, PlanNode(name="Scan a")), (2, 0, PlanNode(name="Scan b"))]
+    root = from_edges(rows, root_name="UNION")
+    assert root.name == "UNION"
+    assert [child.name for child in root.children] == ["Scan a", "Scan b"]
+
+
+def test_from_edges_empty():
+    assert from_edges([]) is None
+
+
+def test_from_indented():
+    text = """\
+HashJoin
+  Filter
+    Scan a
+  Scan b"""
+    root = from_indented(text)
+    assert root.name == "HashJoin"
+    assert [child.name for child in root.children] == ["Filter", "Scan b"]
+    assert root.children[0].children[0].name == "Scan a"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("250ns", 250e-9),
+        ("1.5µs", 1.5e-6),
+        ("12.5 ms", 12.5e-3),
+        ("2s", 2.0),
+        ("1.5m", 90.0),
+        ("2h", 7200.0),
+        ("12 rows", None),
+    ],
+)
+def test_to_seconds(value, expected):
+    assert to_seconds(value) == pytest.approx(expected)
+
+
+def test_plan_format():
+    plan = QueryPlan(
+        query="SELECT 1",
+        raw="raw plan",
+        root=PlanNode(
+            name="Projection",
+            children=(PlanNode(name="Scan", estimated_rows=3.0),),
+        ),
+    )
+    assert str(plan) == "raw plan"
+    assert plan.root.format() == "Projection\n  Scan (rows=3)"
+    assert plan.estimated_rows is None
+    assert QueryPlan(query="", raw="").find("scan") == ()
@@ -57,6 +57,51 @@ def test_table___arrow_c_stream__(awards_players):
     assert len(res) == len(sol)
 
 
+@pytest.mark.skipif(
+    vparse(pa.__version__) < vparse("15"), reason="pyarrow >= 15 required"
+)
+def test_table___arrow_c_stream___is_streamed(con, awards_players, mocker):
+    spy = mocker.spy(con, "to_pyarrow")
+
+    with pa.RecordBatchReader.from_stream(awards_players) as reader:
+        assert reader.schema.equals(awards_players.schema().to_pyarrow())
+        result = reader.read_all()
+
+    assert len(result) == awards_players.count().execute()
+    spy.assert_not_called()
+
+
+@pytest.mark.skipif(
+    vparse(pa.__version__) < vparse("16"), reason="pyarrow >= 16 required"
+)
+def test_table___arrow_c_stream___requested_schema(awards_players):
+    t = awards_players.select("playerID", "yearID")
+    schema = pa.schema([("playerID", pa.large_string()), ("yearID", pa.float64())])
+
+    result = pa.RecordBatchReader.from_stream(t, schema=schema).read_all()
+    assert result.schema.equals(schema)
+    assert len(result) == t.count().execute()
+
+
+@pytest.mark.skipif(
+    vparse(pa.__version__) < vparse("14"), reason="pyarrow >= 14 required"
+)
+def test_table___arrow_c_stream___requested_schema_old_pyarrow(
+    con, awards_players, monkeypatch, mocker
+):
+    # readers can't be cast before pyarrow 16, so the result is materialized
+    monkeypatch.setattr(pa, "__version__", "15.0.0")
+    spy = mocker.spy(con, "to_pyarrow")
+
+    t = awards_players.select("playerID", "yearID")
+    schema = pa.schema([("playerID", pa.large_string()), ("yearID", pa.float64())])
+
+    result = pa.table(t, schema=schema)
+    assert result.schema.equals(schema)
+    assert len(result) == t.count().execute()
+    spy.assert_called_once()
+
+
 @pytest.mark.parametrize("limit", limit_no_limit)
 def test_table_to_pyarrow_batches(limit, awards_players):
     with awards_players.to_pyarrow_batches(limit=limit) as batch_reader:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+
 import pytest
 from pytest import mark
 
@@ -138,3 +141,75 @@ def test_persist_expression_release(con, alltypes):
 
     with pytest.raises(Exception, match=cached_table.op().name):
         cached_table.execute()
+
+
+@mark.notimpl(["flink", "impala", "trino", "druid"])
+@mark.notimpl(["exasol"], reason="Exasol does not support temporary tables")
+@pytest.mark.never(
+    ["risingwave"],
+    raises=com.UnsupportedOperationError,
+    reason="Feature is not yet implemented: CREATE TEMPORARY TABLE",
+)
+@pytest.mark.parametrize("spill", [False, True], ids=["recompute", "spill"])
+def test_cache_budget(con, alltypes, spill, tmp_path):
+    expr = alltypes.select("id", "string_col")
+    evens = expr.filter(expr.id % 2 == 0)
+    odds = expr.filter(expr.id % 2 == 1)
+    expected = evens.count().execute()
+
+    con.set_cache_budget(bytes=1, spill=tmp_path if spill else False)
+    try:
+        cached_evens = evens.cache()
+        cached_odds = odds.cache()
+
+        # the least recently used table is evicted to stay within budget
+        name = cached_evens.op().name
+        assert name not in con.list_tables()
+        assert cached_odds.op().name in con.list_tables()
+        assert tmp_path.joinpath(f"{name}.parquet").exists() == spill
+
+        # and brought back transparently when used again
+        assert cached_evens.count().execute() == expected
+        assert name in con.list_tables()
+        assert cached_odds.op().name not in con.list_tables()
+    finally:
+        con.set_cache_budget(None)
+
+
+@mark.notimpl(["flink", "impala", "trino", "druid"])
+@mark.notimpl(["exasol"], reason="Exasol does not support temporary tables")
+@pytest.mark.never(
+    ["risingwave"],
+    raises=com.UnsupportedOperationError,
+    reason="Feature is not yet implemented: CREATE TEMPORARY TABLE",
+)
+def test_cache_release_does_not_wait_for_queries(con, alltypes, mocker):
+    other = alltypes.select("id").cache()
+
+    started = threading.Event()
+    proceed = threading.Event()
+    create = con._create_cached_table
+
+    def slow_create(name, expr):
+        started.set()
+        proceed.wait(10)
+        return create(name, expr)
+
+    mocker.patch.object(con, "_create_cached_table", side_effect=slow_create)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(alltypes.select("string_col").cache)
+        assert started.wait(10)
+
+        # cached tables are released, e.g. by the garbage collector, while
+        # another thread is creating a cached table
+        release = threading.Thread(target=other.release)
+        release.start()
+        release.join(5)
+        assert not release.is_alive()
+
+        proceed.set()
+        cached = future.result()
+
+    assert other.op().name not in con._cache_name_to_entry
+    assert cached.count().execute() == alltypes.count().execute()
@@ -338,6 +338,87 @@ def test_notin(backend, alltypes, sorted_df, column, elements):
     backend.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    ("column", "elements"),
+    [
+        param("int_col", list(range(0, 10, 2)), id="int"),
+        param("string_col", list(map(str, range(0, 10, 2))), id="string"),
+    ],
+)
+@pytest.mark.parametrize("method", ["isin", "notin"])
+@pytest.mark.notimpl(["druid"])
+def test_isin_lowered(
+    backend, alltypes, sorted_df, column, elements, method, monkeypatch
+):
+    monkeypatch.setattr(ibis.options.sql, "isin_lowering_threshold", 2)
+
+    sorted_alltypes = alltypes.order_by("id")
+    expr = sorted_alltypes.select(
+        "id", getattr(sorted_alltypes[column], method)(elements).name("tmp")
+    ).order_by("id")
+    result = expr.execute().tmp
+
+    expected = sorted_df[column].isin(elements)
+    if method == "notin":
+        expected = ~expected
+    expected = backend.default_series_rename(expected)
+    backend.assert_series_equal(result, expected)
+
+
+def test_repeated_values_hoisted(backend, alltypes, df, monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 3)
+
+    value = (alltypes.int_col * 2 + alltypes.smallint_col) % 7
+    expr = (
+        alltypes.filter(value > 2)
+        .select("id", a=value + 1, b=value * 3)
+        .order_by(["a", "id"])
+    )
+    result = expr.execute()
+
+    value = (df.int_col * 2 + df.smallint_col) % 7
+    expected = (
+        df.assign(value=value, a=value + 1, b=value * 3)
+        .loc[lambda df: df.value > 2]
+        .sort_values(["value", "id"])[["id", "a", "b"]]
+        .reset_index(drop=True)
+    )
+    backend.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    ("make_expr", "expected"),
+    [
+        param(
+            lambda t, num: t.select(
+                a=(t.s != "abc").ifelse(num + 1, 0),
+                b=(t.s != "abc").ifelse(num * 2, 0),
+            ),
+            {"a": [0, 2, 3], "b": [0, 2, 4]},
+            id="ifelse",
+            marks=pytest.mark.notimpl(
+                ["polars"],
+                raises=PolarsInvalidOperationError,
+                reason="polars evaluates both branches of a conditional",
+            ),
+        ),
+        param(
+            lambda t, num: t.filter(t.s != "abc").select(a=num + 1, b=num * 2),
+            {"a": [2, 3], "b": [2, 4]},
+            id="filter",
+        ),
+    ],
+)
+def test_guarded_values_not_hoisted(con, make_expr, expected, monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "cse_complexity_threshold", 1)
+
+    t = ibis.memtable({"s": ["1", "2", "abc"]})
+    # casting "abc" fails on most backends, so it must stay guarded
+    expr = make_expr(t, t.s.cast("int64")).order_by("b")
+    result = con.execute(expr).reset_index(drop=True)
+    tm.assert_frame_equal(result, pd.DataFrame(expected), check_dtype=False)
+
+
 @pytest.mark.parametrize(
     ("predicate_fn", "expected_fn"),
     [
@@ -380,7 +461,6 @@ def test_filter(backend, alltypes, sorted_df, predicate_fn, expected_fn):
     raises=PyDruidProgrammingError,
     reason="requires enabling window functions",
 )
-@pytest.mark.notimpl(["polars"], raises=com.OperationNotDefinedError)
 @pytest.mark.notyet(
     ["oracle"],
     raises=OracleDatabaseError,
@@ -1609,11 +1689,6 @@ def test_select_distinct_filter_order_by_commute(backend, alltypes, df, ops):
     raises=(NotImplementedError, OracleDatabaseError, com.OperationNotDefinedError),
     reason="arbitrary not implemented in the backend",
 )
-@pytest.mark.notimpl(
-    ["polars"],
-    raises=com.OperationNotDefinedError,
-    reason="backend doesn't implement ops.WindowFunction",
-)
 @pytest.mark.notimpl(
     ["flink"],
     raises=Py4JJavaError,
@@ -1672,11 +1747,6 @@ def test_distinct_on_keep(backend, on, keep):
     raises=(NotImplementedError, OracleDatabaseError, com.OperationNotDefinedError),
     reason="arbitrary not implemented in the backend",
 )
-@pytest.mark.notimpl(
-    ["polars"],
-    raises=com.OperationNotDefinedError,
-    reason="backend doesn't implement ops.WindowFunction",
-)
 @pytest.mark.notimpl(
     ["flink"],
     raises=Py4JJavaError,
@@ -2745,6 +2815,60 @@ def test_simple_pivot_wider(con, backend, monkeypatch):
     backend.assert_frame_equal(result, expected)
 
 
+@pytest.mark.notyet(
+    [
+        "mysql",
+        "singlestoredb",
+        "risingwave",
+        "impala",
+        "mssql",
+        "exasol",
+        "oracle",
+    ],
+    raises=com.OperationNotDefinedError,
+    reason="backend doesn't support Arbitrary agg",
+)
+@pytest.mark.notyet(
+    ["materialize"],
+    raises=com.OperationNotDefinedError,
+    reason="function first does not exist",
+)
+@pytest.mark.notyet(["druid"], raises=NotImplementedError)
+@pytest.mark.notyet(["flink"], raises=com.IbisError)
+@pytest.mark.notyet(
+    ["athena"],
+    raises=com.UnsupportedOperationError,
+    reason="no reasonable implementation is supported by the database",
+)
+def test_pivot_wider_names_are_cached(con, mocker, temp_table):
+    t = con.create_table(
+        temp_table, pd.DataFrame({"outcome": ["yes", "no"], "counted": [3, 4]})
+    )
+    spy = mocker.spy(con, "execute")
+
+    def pivot():
+        return t.pivot_wider(
+            names_from="outcome", values_from="counted", names_sort=True
+        )
+
+    assert pivot().columns == ("no", "yes")
+    assert pivot().columns == ("no", "yes")
+    assert spy.call_count == 1
+
+    # modifying the table through the backend invalidates the names
+    con.create_table(
+        temp_table,
+        pd.DataFrame({"outcome": ["maybe", "no"], "counted": [5, 4]}),
+        overwrite=True,
+    )
+    assert pivot().columns == ("maybe", "no")
+    assert spy.call_count == 2
+
+    con.clear_pivot_names_cache()
+    pivot()
+    assert spy.call_count == 3
+
+
 def test_named_literal(con, backend):
     lit = ibis.literal(1, type="int64").name("one")
     expr = lit.as_table()
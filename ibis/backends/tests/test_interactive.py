@@ -126,3 +126,49 @@ def test_scalar_uses_pyarrow(con, table, monkeypatch, mocker):
 
     # execute doesn't get called
     execute_spy.assert_not_called()
+
+
+def test_preview_is_cached(con, monkeypatch, mocker):
+    monkeypatch.setattr(ibis.options, "interactive", True)
+    monkeypatch.setattr(ibis.options.repr.interactive, "cache_size", 2)
+
+    name = ibis.util.gen_name("preview_cache")
+    t = con.create_table(name, ibis.memtable({"a": [1, 2, 3]}))
+    try:
+        spy = mocker.spy(con, "to_pyarrow")
+
+        assert "3" in repr(t)
+        repr(t)
+        assert spy.call_count == 1
+
+        # changing the preview settings or the selected columns is a new preview
+        monkeypatch.setattr(ibis.options.repr.interactive, "max_rows", 1)
+        repr(t)
+        assert spy.call_count == 2
+
+        # modifying the table through the backend invalidates the previews
+        con.create_table(name, ibis.memtable({"a": [4]}), overwrite=True)
+        monkeypatch.setattr(ibis.options.repr.interactive, "max_rows", 10)
+        assert "4" in repr(t)
+        assert spy.call_count == 3
+
+        con.clear_preview_cache()
+        repr(t)
+        assert spy.call_count == 4
+
+        # the cache can be disabled
+        monkeypatch.setattr(ibis.options.repr.interactive, "cache_size", 0)
+        repr(t)
+        assert spy.call_count == 5
+    finally:
+        con.drop_table(name, force=True)
+
+
+def test_preview_is_not_cached_by_default(con, table, monkeypatch, mocker):
+    monkeypatch.setattr(ibis.options, "interactive", True)
+    spy = mocker.spy(con, "to_pyarrow")
+
+    expr = table.select("id", "bool_col")
+    repr(expr)
+    repr(expr)
+    assert spy.call_count == 2
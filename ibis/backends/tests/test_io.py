@@ -293,6 +293,30 @@ def read_table(path: Path) -> Iterator[tuple[str, pa.Table]]:
     return pac.read_csv(data_dir / f"{table_name}.csv", convert_options=convert_options)
 
 
+@pytest.mark.notyet(
+    [
+        "flink",
+        "impala",
+        "mssql",
+        "mysql",
+        "singlestoredb",
+        "postgres",
+        "risingwave",
+        "sqlite",
+        "trino",
+        "athena",
+    ]
+)
+def test_execute_many_read_parquet(con, data_dir):
+    path = Path(data_dir).absolute() / "parquet" / "functional_alltypes.parquet"
+    t = con.read_parquet(path)
+    exprs = [t.int_col.sum(), t.count(), t.string_col.nunique()]
+    expected = [con.execute(expr) for expr in exprs]
+
+    assert con.execute_many(exprs) == expected
+    assert con.execute_many(exprs, fuse=True) == expected
+
+
 @pytest.mark.notyet(
     [
         "bigquery",
@@ -28,12 +28,6 @@ from ibis.legacy.udf.vectorized import analytic, reduction
 np = pytest.importorskip("numpy")
 pd = pytest.importorskip("pandas")
 
-pytestmark = pytest.mark.notimpl(
-    ["polars"],
-    raises=com.OperationNotDefinedError,
-    reason="window functions aren't yet implemented for the polars backend",
-)
-
 
 # adapted from https://gist.github.com/xmnlab/2c1f93df1a6c6bde4e32c8579117e9cc
 def pandas_ntile(x, bucket: int):
@@ -164,7 +158,7 @@ with pytest.warns(FutureWarning, match="v9.0"):
             id="ntile",
             marks=[
                 pytest.mark.notimpl(
-                    ["polars", "materialize"], raises=com.OperationNotDefinedError
+                    ["materialize"], raises=com.OperationNotDefinedError
                 ),
                 pytest.mark.notimpl(
                     ["impala"],
@@ -386,6 +380,7 @@ def test_grouped_bounded_expanding_window(
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
@@ -578,6 +573,7 @@ def test_grouped_bounded_preceding_window(
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
@@ -732,6 +728,7 @@ def test_simple_ungrouped_window_with_scalar_order_by(alltypes):
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
@@ -771,6 +768,7 @@ def test_simple_ungrouped_window_with_scalar_order_by(alltypes):
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
@@ -897,6 +895,7 @@ def test_simple_ungrouped_window_with_scalar_order_by(alltypes):
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
@@ -931,6 +930,7 @@ def test_simple_ungrouped_window_with_scalar_order_by(alltypes):
                         "databricks",
                         "athena",
                         "materialize",
+                        "polars",
                     ],
                     raises=com.OperationNotDefinedError,
                 ),
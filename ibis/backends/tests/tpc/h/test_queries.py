@@ -291,7 +291,7 @@ def test_09(part, supplier, lineitem, partsupp, orders, nation):
     return q
 
 
-@tpc_test
+@tpc_test("h")
 def test_10(customer, orders, lineitem, nation):
     """Returned Item Reporting Query (Q10)"""
     DATE = "1993-10-01"
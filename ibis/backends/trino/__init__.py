@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import contextlib
+import json
+import math
+import re
 from functools import cached_property
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
@@ -26,6 +29,7 @@ from ibis.backends import (
     HasCurrentDatabase,
     NoExampleLoader,
 )
+from ibis.backends.explain import PlanNode, QueryPlan, to_details, to_seconds
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import AlterTable, C, RenameTable
 
@@ -89,6 +93,7 @@ class Backend(
         else:
             if con.transaction is not None:
                 con.commit()
+            self._clear_result_caches_for(query)
             return cur
 
     @contextlib.contextmanager
@@ -330,6 +335,30 @@ class Backend(
         new_backend.con = con
         return new_backend
 
+    def _explain(self, query: str, /, *, analyze: bool) -> QueryPlan:
+        with self._safe_raw_sql(f"EXPLAIN (FORMAT JSON) {query}") as cur:
+            [(raw,)] = cur.fetchall()
+
+        root = _to_plan_node(json.loads(raw))
+
+        # EXPLAIN ANALYZE only supports the text format, so the structured
+        # plan holds the planner's estimates and the query's execution time
+        # is parsed out of the textual report
+        execution_time = None
+        if analyze:
+            with self._safe_raw_sql(f"EXPLAIN ANALYZE {query}") as cur:
+                [(raw,)] = cur.fetchall()
+            if match := re.search(r"Execution: ([\d.]+(?:ns|us|ms|s|m|h))\b", raw):
+                execution_time = to_seconds(match.group(1))
+
+        return QueryPlan(
+            query=query,
+            raw=raw,
+            root=root,
+            analyzed=analyze,
+            execution_time=execution_time,
+        )
+
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name(f"{self.name}_metadata")
         with self.begin() as cur:
@@ -374,6 +403,7 @@ class Backend(
             )
         ):
             pass
+        self._clear_result_caches()
 
     def create_table(
         self,
@@ -511,6 +541,7 @@ class Backend(
                     ).sql(self.name)
                 )
 
+        self._clear_result_caches()
         return self.table(orig_table_ref.name, database=(catalog, db))
 
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
@@ -557,3 +588,22 @@ class Backend(
             cur.execute(create_stmt)
             for row in data:
                 cur.execute(insert_stmt, row)
+
+
+def _finite(value: Any) -> float | None:
+    if value is None or math.isnan(value := float(value)):
+        return None
+    return value
+
+
+def _to_plan_node(node: Mapping[str, Any]) -> PlanNode:
+    [estimates, *_] = node.get("estimates") or [{}]
+    details = dict(node.get("descriptor", {}))
+    details["details"] = node.get("details")
+    return PlanNode(
+        name=node["name"],
+        children=tuple(map(_to_plan_node, node.get("children", ()))),
+        estimated_rows=_finite(estimates.get("outputRowCount")),
+        estimated_cost=_finite(estimates.get("cpuCost")),
+        details=to_details(details),
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+import sys
 import types
 from typing import TYPE_CHECKING
 from typing import Any as AnyType
@@ -10,11 +11,20 @@ from typing_extensions import Self
 
 from ibis.common.bases import Immutable, Slotted
 from ibis.common.patterns import (
+    AllOf,
     Any,
+    AnyOf,
+    CoercedTo,
     FrozenDictOf,
+    GenericCoercedTo,
+    GenericMappingOf,
+    InstanceOf,
+    IsIn,
     NoMatch,
+    Not,
     Option,
     Pattern,
+    SequenceOf,
     TupleOf,
 )
 from ibis.common.patterns import pattern as ensure_pattern
@@ -96,6 +106,64 @@ class SignatureValidationError(ValidationError):
         return self.msg.format(sig=sig, call=call, cause=cause, errors=errors)
 
 
+def _always(_: AnyType) -> bool:
+    return True
+
+
+def trusted_check(pattern: Pattern) -> Callable[[AnyType], bool] | None:
+    """Return a quick check of whether a value is already valid for `pattern`.
+
+    The check accepts values that `pattern` would return unchanged, so it may
+    only be used for values taken from already validated objects. Return
+    `None` if there is no quick check for `pattern`.
+    """
+    if isinstance(pattern, Any):
+        return _always
+    elif isinstance(pattern, (InstanceOf, CoercedTo)):
+        typ = pattern.type
+        return lambda value: isinstance(value, typ)
+    elif isinstance(pattern, GenericCoercedTo):
+        # the type parameters, e.g. the dtype and shape of values, must match
+        checker = pattern.checker
+        return lambda value: checker.match(value, {}) is not NoMatch
+    elif isinstance(pattern, IsIn):
+        haystack = pattern.haystack
+        return lambda value: value in haystack
+    elif isinstance(pattern, Not) and isinstance(pattern.pattern, InstanceOf):
+        typ = pattern.pattern.type
+        return lambda value: not isinstance(value, typ)
+    elif isinstance(pattern, Option):
+        if pattern.default is not None or (
+            (inner := trusted_check(pattern.pattern)) is None
+        ):
+            return None
+        return lambda value: value is None or inner(value)
+    elif isinstance(pattern, (AllOf, AnyOf)):
+        checks = tuple(map(trusted_check, pattern.patterns))
+        if None in checks:
+            return None
+        combine = all if isinstance(pattern, AllOf) else any
+        return lambda value: combine(check(value) for check in checks)
+    elif isinstance(pattern, SequenceOf):
+        typ = pattern.type
+        if (item := trusted_check(pattern.item)) is None:
+            return None
+        return lambda value: type(value) is typ and all(map(item, value))
+    elif isinstance(pattern, GenericMappingOf) and isinstance(pattern.type, CoercedTo):
+        typ = pattern.type.type
+        key = trusted_check(pattern.key)
+        item = trusted_check(pattern.value)
+        if key is None or item is None:
+            return None
+        return lambda value: (
+            type(value) is typ
+            and all(map(key, value.keys()))
+            and all(map(item, value.values()))
+        )
+    else:
+        return None
+
+
 class Annotation(Slotted, Immutable):
     """Base class for all annotations.
 
@@ -538,6 +606,63 @@ class Signature(inspect.Signature):
 
         return this
 
+    def trusted_checks(self) -> tuple:
+        """Return the quick checks of the parameters used by `validate_trusted`."""
+        return tuple(
+            (
+                name,
+                param.default,
+                param.annotation.pattern,
+                trusted_check(param.annotation.pattern),
+            )
+            for name, param in self.parameters.items()
+        )
+
+    def validate_trusted(self, func, kwargs, checks):
+        """Validate arguments taken from already validated objects.
+
+        Used when reconstructing objects in rewrites, where most arguments are
+        the arguments of an existing object. Arguments passing the quick check
+        of their parameter are kept as is, the rest are validated as in
+        `validate_nobind`. In Python's development mode (`python -X dev`) all
+        arguments are validated and compared with the quick result instead.
+
+        Parameters
+        ----------
+        func
+            The callable the arguments are validated for.
+        kwargs
+            The keyword arguments.
+        checks
+            The result of `trusted_checks`.
+        """
+        if sys.flags.dev_mode:
+            return self._validate_trusted_checked(func, kwargs, checks)
+
+        this = {}
+        for name, default, pattern, check in checks:
+            value = kwargs.get(name, default)
+            if check is not None and check(value):
+                this[name] = value
+            elif value is EMPTY or (result := pattern.match(value, this)) is NoMatch:
+                # raise the proper error
+                return self.validate_nobind(func, kwargs)
+            else:
+                this[name] = result
+        return this
+
+    def _validate_trusted_checked(self, func, kwargs, checks):
+        validated = self.validate_nobind(func, kwargs)
+        for name, _, _, check in checks:
+            value = kwargs.get(name, validated[name])
+            if check is not None and check(value) and value is not validated[name]:
+                if value != validated[name]:
+                    raise ValidationError(
+                        f"Trusted argument `{name}` of {func.__name__} is "
+                        f"{value!r} but validates to {validated[name]!r}"
+                    )
+        return validated
+
     def validate_return(self, func, value):
         """Validate the return value of a function.
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import collections.abc
+import threading
+import weakref
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 from weakref import WeakValueDictionary
@@ -99,6 +101,7 @@ class Singleton(Abstract):
     """Cache instances of the class based on instantiation arguments."""
 
     __instances__: Mapping[Any, Self] = WeakValueDictionary()
+    __instances_lock__ = threading.Lock()
 
     @classmethod
     def __create__(cls, *args, **kwargs) -> Self:
@@ -106,9 +109,14 @@ class Singleton(Abstract):
         try:
             return cls.__instances__[key]
         except KeyError:
-            instance = super().__create__(*args, **kwargs)
-            cls.__instances__[key] = instance
-            return instance
+            pass
+        # looking up existing instances doesn't need the lock, only registering
+        # a new one does so that threads racing to create it get the same one;
+        # the instance is created outside of the lock since creating it may
+        # create other singletons
+        instance = super().__create__(*args, **kwargs)
+        with cls.__instances_lock__:
+            return cls.__instances__.setdefault(key, instance)
 
 
 class Final(Abstract):
@@ -134,14 +142,16 @@ class Comparable(Abstract):
 
     The subclasses must implement the `__equals__` method that returns a boolean
     value indicating whether the two instances are equal. This method is called
-    only if the two instances are of the same type and the result is cached for
-    future comparisons.
+    only if the two instances are of the same type.
 
-    Since the class holds a global cache of comparison results, it is important
-    to make sure that the instances are not kept alive longer than necessary.
+    When two instances are found to be equal, each of them keeps a weak
+    reference to the other one, so comparing them again is quick. This is
+    common when comparing expressions, since their subexpressions are shared.
+    Only the last equal instance is remembered, so the cache takes a single
+    weak reference per instance and goes away together with the instance.
     """
 
-    __cache__ = {}
+    __slots__ = ("__equal__",)
 
     @abstractmethod
     def __equals__(self, other) -> bool: ...
@@ -154,25 +164,19 @@ class Comparable(Abstract):
         if type(self) is not type(other):
             return False
 
-        id1 = id(self)
-        id2 = id(other)
         try:
-            return self.__cache__[id1][id2]
-        except KeyError:
-            result = self.__equals__(other)
-            self.__cache__.setdefault(id1, {})[id2] = result
-            self.__cache__.setdefault(id2, {})[id1] = result
-            return result
+            if self.__equal__() is other:
+                return True
+        except AttributeError:
+            # the instance hasn't been found equal to another one yet
+            pass
 
-    __hash__ = None
+        if result := self.__equals__(other):
+            object.__setattr__(self, "__equal__", weakref.ref(other))
+            object.__setattr__(other, "__equal__", weakref.ref(self))
+        return result
 
-    def __del__(self):
-        id1 = id(self)
-        for id2 in self.__cache__.pop(id1, ()):
-            eqs2 = self.__cache__[id2]
-            del eqs2[id1]
-            if not eqs2:
-                del self.__cache__[id2]
+    __hash__ = None
 
 
 class SlottedMeta(AbstractMeta):
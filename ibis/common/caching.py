@@ -18,7 +18,7 @@ def memoize(func: Callable) -> Callable:
             return cache[key]
         except KeyError:
             result = func(*args, **kwargs)
-            cache[key] = result
-            return result
+            # another thread may have computed the result in the meantime
+            return cache.setdefault(key, result)
 
     return wrapper
@@ -88,6 +88,7 @@ class AnnotableMeta(AbstractMeta):
             __attributes__=attributes,
             __match_args__=argnames,
             __signature__=signature,
+            __trusted_checks__=signature.trusted_checks(),
             __slots__=tuple(slots),
         )
         return super().__new__(metacls, clsname, bases, namespace, **kwargs)
@@ -113,6 +114,9 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
     __match_args__: ClassVar[tuple[str, ...]]
     """Names of the arguments to be used for pattern matching."""
 
+    __trusted_checks__: ClassVar[tuple]
+    """Quick checks of the arguments used when recreating instances."""
+
     @classmethod
     def __create__(cls, *args: Any, **kwargs: Any) -> Self:
         # construct the instance by passing only validated keyword arguments
@@ -121,8 +125,10 @@ class Annotable(Abstract, metaclass=AnnotableMeta):
 
     @classmethod
     def __recreate__(cls, kwargs: Any) -> Self:
-        # bypass signature binding by requiring keyword arguments only
-        kwargs = cls.__signature__.validate_nobind(cls, kwargs)
+        # bypass signature binding by requiring keyword arguments only, the
+        # arguments are mostly taken from existing instances so skip
+        # validating those which already have the right type
+        kwargs = cls.__signature__.validate_trusted(cls, kwargs, cls.__trusted_checks__)
         return super().__create__(**kwargs)
 
     def __init__(self, **kwargs: Any) -> None:
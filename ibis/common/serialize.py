@@ -0,0 +1,187 @@
+"""Compact serialization of graphs of `Concrete` objects.
+
+Pickling a `Concrete` object recursively pickles its arguments and validates
+them again when unpickling. Graphs are instead flattened to a table of
+objects in topological order where every argument referencing another object
+is the index of an earlier row, so that equal subgraphs are stored once and
+objects are reconstructed from their already validated arguments.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+from ibis.common.bases import Singleton
+from ibis.common.collections import FrozenDict
+from ibis.common.grounds import Concrete
+
+FORMAT_VERSION = 1
+"""Version of the node table format, incremented on incompatible changes."""
+
+# kinds of arguments
+_LEAF = 0
+_REF = 1
+_REFS = 2
+_MAPPING = 3
+
+
+def _is_refs(arg) -> bool:
+    return type(arg) is tuple and all(isinstance(item, Concrete) for item in arg)
+
+
+def _is_mapping(arg) -> bool:
+    return isinstance(arg, FrozenDict) and all(
+        isinstance(value, Concrete) for value in arg.values()
+    )
+
+
+def _children(obj: Concrete):
+    for arg in obj.__args__:
+        if isinstance(arg, Concrete):
+            yield arg
+        elif _is_refs(arg):
+            yield from arg
+        elif _is_mapping(arg):
+            yield from arg.values()
+
+
+def to_node_table(root: Concrete) -> tuple:
+    """Flatten the graph of `Concrete` objects reachable from `root`.
+
+    Parameters
+    ----------
+    root
+        The root of the graph.
+
+    Returns
+    -------
+    tuple
+        The format version and the rows of the table. The last row is `root`.
+    """
+    index = {}
+    rows = []
+    # share identical argument kinds between rows, pickle then stores them once
+    kinds_cache = {}
+
+    stack = [(root, False)]
+    while stack:
+        obj, visited = stack.pop()
+        if obj in index:
+            continue
+        if not visited:
+            stack.append((obj, True))
+            stack.extend(
+                (child, False) for child in _children(obj) if child not in index
+            )
+            continue
+
+        kinds = bytearray()
+        args = []
+        for arg in obj.__args__:
+            if isinstance(arg, Concrete):
+                kinds.append(_REF)
+                args.append(index[arg])
+            elif _is_refs(arg):
+                kinds.append(_REFS)
+                args.append(tuple(index[item] for item in arg))
+            elif _is_mapping(arg):
+                kinds.append(_MAPPING)
+                args.append(
+                    (type(arg), tuple(arg), tuple(index[v] for v in arg.values()))
+                )
+            else:
+                kinds.append(_LEAF)
+                args.append(arg)
+
+        kinds = kinds_cache.setdefault(bytes(kinds), bytes(kinds))
+        index[obj] = len(rows)
+        rows.append((type(obj), kinds, tuple(args)))
+
+    return FORMAT_VERSION, tuple(rows)
+
+
+def _construct(cls: type[Concrete], kwargs: dict[str, Any]) -> Concrete:
+    if issubclass(cls, Singleton):
+        return cls.__recreate__(kwargs)
+    # the arguments were validated when the object was serialized
+    return type.__call__(cls, **kwargs)
+
+
+def from_node_table(table: tuple) -> Concrete:
+    """Reconstruct a graph flattened by `to_node_table`.
+
+    Parameters
+    ----------
+    table
+        The result of `to_node_table`.
+
+    Returns
+    -------
+    Concrete
+        The root of the graph.
+    """
+    version, rows = table
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported node table format version {version}, "
+            f"expected {FORMAT_VERSION}"
+        )
+
+    objs = []
+    for cls, kinds, args in rows:
+        argnames = cls.__argnames__
+        if len(argnames) != len(args):
+            raise ValueError(
+                f"{cls.__name__} expects {len(argnames)} arguments, "
+                f"the node table has {len(args)}"
+            )
+        kwargs = {}
+        for name, kind, arg in zip(argnames, kinds, args):
+            if kind == _REF:
+                arg = objs[arg]
+            elif kind == _REFS:
+                arg = tuple(map(objs.__getitem__, arg))
+            elif kind == _MAPPING:
+                typ, keys, values = arg
+                arg = typ(zip(keys, map(objs.__getitem__, values)))
+            kwargs[name] = arg
+        objs.append(_construct(cls, kwargs))
+
+    return objs[-1]
+
+
+def dumps(obj: Concrete, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+    """Serialize `obj` as a node table.
+
+    Parameters
+    ----------
+    obj
+        The object to serialize.
+    protocol
+        The pickle protocol used to encode the node table.
+
+    Returns
+    -------
+    bytes
+        The serialized object.
+    """
+    return pickle.dumps(to_node_table(obj), protocol=protocol)
+
+
+def loads(data: bytes) -> Concrete:
+    """Deserialize an object serialized with `dumps`.
+
+    Only load data from trusted sources, like `pickle.loads`.
+
+    Parameters
+    ----------
+    data
+        The serialized object.
+
+    Returns
+    -------
+    Concrete
+        The deserialized object.
+    """
+    return from_node_table(pickle.loads(data))  # noqa: S301
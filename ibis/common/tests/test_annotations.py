@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import pickle
+import sys
 from typing import Annotated, Union
 
 import pytest
@@ -185,6 +186,30 @@ def test_signature_from_callable():
     assert kwargs == {}
 
 
+def test_signature_validate_trusted(monkeypatch):
+    def test(a: int, b: tuple[int, ...], c: Union[int, str] = 1, d: float = 0.5): ...
+
+    sig = Signature.from_callable(test)
+    checks = sig.trusted_checks()
+    assert sig.validate_trusted(test, {"a": 1, "b": (2, 3)}, checks) == {
+        "a": 1,
+        "b": (2, 3),
+        "c": 1,
+        "d": 0.5,
+    }
+    # arguments failing the quick check are validated
+    assert sig.validate_trusted(test, {"a": 1, "b": [2, 3]}, checks)["b"] == (2, 3)
+    with pytest.raises(ValidationError):
+        sig.validate_trusted(test, {"a": "1", "b": (2, 3)}, checks)
+
+    # in development mode the trusted arguments are validated as well
+    class flags:
+        dev_mode = True
+
+    monkeypatch.setattr(sys, "flags", flags)
+    assert sig.validate_trusted(test, {"a": 1, "b": [2, 3]}, checks)["b"] == (2, 3)
+
+
 def test_signature_from_callable_with_varargs():
     def test(a: int, b: int, *args: int): ...
 
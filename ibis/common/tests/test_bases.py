@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import pickle
+import threading
+import time
 import weakref
 from abc import ABCMeta, abstractmethod
 
@@ -78,19 +81,7 @@ def test_immutable():
     assert copy.deepcopy(foo) is foo
 
 
-class Cache(dict):
-    def setpair(self, a, b, value):
-        a, b = id(a), id(b)
-        self.setdefault(a, {})[b] = value
-        self.setdefault(b, {})[a] = value
-
-    def getpair(self, a, b):
-        return self.get(id(a), {}).get(id(b))
-
-
 class Node(Comparable):
-    # override the default cache object
-    __cache__ = Cache()
     __slots__ = ("name",)
     num_equal_calls = 0
 
@@ -109,11 +100,9 @@ class Node(Comparable):
 
 
 @pytest.fixture
-def cache():
+def num_equal_calls():
     Node.num_equal_calls = 0
-    cache = Node.__cache__
-    yield cache
-    assert not cache
+    return lambda: Node.num_equal_calls
 
 
 def test_comparable_basic():
@@ -127,115 +116,52 @@ def test_comparable_basic():
     del c
 
 
-def test_comparable_caching(cache):
+def test_comparable_caching(num_equal_calls):
     a = Node(name="a")
-    b = Node(name="b")
-    c = Node(name="c")
+    b = Node(name="a")
+    c = Node(name="a")
     d = Node(name="d")
-    e = Node(name="e")
-
-    cache.setpair(a, b, True)
-    cache.setpair(a, c, False)
-    cache.setpair(c, d, True)
-    cache.setpair(b, d, False)
-    expected = {
-        id(a): {id(b): True, id(c): False},
-        id(b): {id(a): True, id(d): False},
-        id(c): {id(a): False, id(d): True},
-        id(d): {id(c): True, id(b): False},
-    }
-    assert cache == expected
 
+    assert a == b
+    assert num_equal_calls() == 1
     assert a == b
     assert b == a
-    assert a != c
-    assert c != a
-    assert c == d
-    assert d == c
-    assert b != d
-    assert d != b
-    assert Node.num_equal_calls == 0
-    assert cache == expected
-
-    # no cache hit
-    assert cache.getpair(a, e) is None
-    assert a != e
-    assert cache.getpair(a, e) is False
-    assert Node.num_equal_calls == 1
-    expected = {
-        id(a): {id(b): True, id(c): False, id(e): False},
-        id(b): {id(a): True, id(d): False},
-        id(c): {id(a): False, id(d): True},
-        id(d): {id(c): True, id(b): False},
-        id(e): {id(a): False},
-    }
-    assert cache == expected
-
-    # run only once
-    assert e != a
-    assert Node.num_equal_calls == 1
-    assert cache.getpair(a, e) is False
-    assert cache == expected
-
-
-def test_comparable_garbage_collection(cache):
-    a = Node(name="a")
-    b = Node(name="b")
-    c = Node(name="c")
-    d = Node(name="d")
-
-    cache.setpair(a, b, True)
-    cache.setpair(a, c, False)
-    cache.setpair(c, d, True)
-    cache.setpair(b, d, False)
+    assert num_equal_calls() == 1
 
-    assert cache.getpair(a, c) is False
-    assert cache.getpair(c, d) is True
-    del c
-    assert cache == {
-        id(a): {id(b): True},
-        id(b): {id(a): True, id(d): False},
-        id(d): {id(b): False},
-    }
-
-    assert cache.getpair(a, b) is True
-    assert cache.getpair(b, d) is False
-    del b
-    assert cache == {}
+    # only the last equal instance is remembered
+    assert a == c
+    assert num_equal_calls() == 2
+    assert c == a
+    assert num_equal_calls() == 2
+    assert a == b
+    assert num_equal_calls() == 3
 
+    # unequal results aren't cached
     assert a != d
-    assert cache == {id(a): {id(d): False}, id(d): {id(a): False}}
-    del a
-    assert cache == {}
+    assert a != d
+    assert num_equal_calls() == 5
 
 
-def test_comparable_cache_reuse(cache):
-    nodes = [
-        Node(name="a"),
-        Node(name="b"),
-        Node(name="c"),
-        Node(name="d"),
-        Node(name="e"),
-    ]
+def test_comparable_garbage_collection(num_equal_calls):
+    a = Node(name="a")
+    b = Node(name="a")
+    assert a == b
 
-    expected = 0
-    for a, b in zip(nodes, nodes):
-        a == a  # noqa: B015
-        a == b  # noqa: B015
-        b == a  # noqa: B015
-        if a != b:
-            expected += 1
-        assert Node.num_equal_calls == expected
+    ref = weakref.ref(b)
+    del b
+    assert ref() is None
 
-    assert len(cache) == expected
+    # an instance reusing the id of the collected one isn't considered equal
+    c = Node(name="c")
+    assert a != c
+    assert num_equal_calls() == 2
 
-    # check that cache is evicted once nodes get collected
-    del nodes
-    assert len(cache) == 0
 
-    a = Node(name="a")
-    b = Node(name="a")
-    assert a == b
+def test_comparable_identity(num_equal_calls):
+    nodes = [Node(name=name) for name in "abcde"]
+    for a, b in zip(nodes, nodes):
+        assert a == b
+    assert num_equal_calls() == 0
 
 
 class OneAndOnly(Singleton):
@@ -285,6 +211,28 @@ def test_singleton_with_argument() -> None:
     assert len(DataType.__instances__) == 0
 
 
+def test_singleton_created_concurrently() -> None:
+    class Slow(Singleton):
+        __instances__ = weakref.WeakValueDictionary()
+
+        def __init__(self):
+            # widen the window between looking up and registering the instance
+            time.sleep(0.01)
+
+    barrier = threading.Barrier(8)
+
+    def create():
+        barrier.wait()
+        return Slow()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(create) for _ in range(8)]
+        instances = [future.result() for future in futures]
+
+    assert all(instance is instances[0] for instance in instances)
+    assert len(Slow.__instances__) == 1
+
+
 def test_final():
     class A(Final):
         pass
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+import ibis
+from ibis.common.collections import FrozenDict  # noqa: TC001
+from ibis.common.grounds import Concrete
+from ibis.common.serialize import (
+    FORMAT_VERSION,
+    dumps,
+    from_node_table,
+    loads,
+    to_node_table,
+)
+from ibis.common.typing import VarTuple  # noqa: TC001
+
+
+class Leaf(Concrete):
+    value: int
+
+
+class Pair(Concrete):
+    left: Concrete
+    right: Concrete
+    others: VarTuple[Concrete] = ()
+    named: FrozenDict[str, Concrete] = {}
+    label: str = ""
+
+
+def test_roundtrip():
+    shared = Pair(Leaf(1), Leaf(2), label="shared")
+    root = Pair(
+        shared,
+        Pair(Leaf(1), Leaf(3)),
+        others=(shared, Leaf(4)),
+        named={"a": Leaf(2), "b": shared},
+        label="root",
+    )
+
+    result = loads(dumps(root))
+    assert result == root
+    assert result.left is result.others[0] is result.named["b"]
+
+
+def test_equal_subgraphs_are_stored_once():
+    left = Pair(Leaf(1), Leaf(2))
+    right = Pair(Leaf(1), Leaf(2))
+    assert left is not right
+
+    _, rows = to_node_table(Pair(left, right))
+    # two leaves, the equal pairs and the root
+    assert len(rows) == 4
+
+
+def test_unsupported_version():
+    _, rows = to_node_table(Leaf(1))
+    with pytest.raises(ValueError, match="Unsupported node table format version"):
+        from_node_table((FORMAT_VERSION + 1, rows))
+
+
+def test_pickle_deep_expression():
+    t = ibis.table({"a": "int64"}, name="t")
+    for i in range(1500):
+        t = t.filter(t.a > i)
+
+    data = pickle.dumps(t)
+    result = pickle.loads(data)
+
+    assert result.op() is not t.op()
+    assert pickle.dumps(result) == data
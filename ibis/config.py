@@ -40,12 +40,45 @@ class SQL(Config):
         explicit limit. [](`None`) means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    isin_lowering_threshold : int | None
+        Number of literal options above which `isin` is compiled to a single
+        array membership check or a semi-join against an in-memory table,
+        depending on the backend, instead of an `IN` list. [](`None`) means
+        `isin` is always compiled to an `IN` list.
+    cse_complexity_threshold : int | None
+        Number of operations from which an expression that is used more than
+        once by a query is computed once in a subquery, for engines that
+        don't eliminate common subexpressions themselves. Impure expressions
+        such as `ibis.random()` are never affected. [](`None`) means repeated
+        expressions are compiled as written.
 
     """
 
     fuse_selects: bool = True
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    isin_lowering_threshold: Optional[PosInt] = 1000
+    cse_complexity_threshold: Optional[PosInt] = None
+
+
+class Memtable(Config):
+    """Options controlling the storage of `ibis.memtable` data.
+
+    Attributes
+    ----------
+    spill_threshold : int | None
+        Size in bytes above which in-memory tables are written once to an
+        Arrow IPC file and memory-mapped from there, so that backends read
+        the data without holding additional copies in memory. [](`None`)
+        means in-memory tables are never spilled.
+    spill_directory : str | None
+        Directory in which spilled in-memory tables are written. [](`None`)
+        means the platform's default temporary directory.
+
+    """
+
+    spill_threshold: Optional[PosInt] = None
+    spill_directory: Optional[str] = None
 
 
 class Interactive(Config):
@@ -67,6 +100,12 @@ class Interactive(Config):
         Maximum depth for nested data types.
     show_types : bool
         Show the inferred type of value expressions in the interactive repr.
+    cache_size : int
+        Maximum number of previews whose results are cached per backend, so
+        that re-displaying a table doesn't re-run its query. The cache of a
+        backend is cleared when a table is modified through it, including by
+        `raw_sql`, but not when data is modified by other means such as
+        another connection. Disabled (0) by default.
 
     """
 
@@ -76,6 +115,7 @@ class Interactive(Config):
     max_string: int = 80
     max_depth: int = 1
     show_types: bool = True
+    cache_size: int = 0
 
 
 class Repr(Config):
@@ -130,6 +170,8 @@ class Options(Config):
         set.
     sql: SQL
         SQL-related options.
+    memtable: Memtable
+        Options controlling the storage of in-memory tables.
     clickhouse : Config | None
         Clickhouse specific options.
     impala : Config | None
@@ -148,6 +190,7 @@ class Options(Config):
     graphviz_repr: bool = False
     default_backend: Optional[Any] = None
     sql: SQL = SQL()
+    memtable: Memtable = Memtable()
     clickhouse: Optional[Config] = None
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
@@ -56,6 +56,8 @@ if TYPE_CHECKING:
     import pyarrow as pa
     import pyarrow.dataset as ds
 
+    from ibis.formats import TableProxy
+
 
 __all__ = (
     "Column",
@@ -87,6 +89,7 @@ __all__ = (
     "difference",
     "dtype",
     "e",
+    "execute_many",
     "following",
     "get_backend",
     "greatest",
@@ -460,6 +463,25 @@ Supported types include:
 """
 
 
+def _in_memory_table(name: str, schema: IntoSchema, data: TableProxy) -> Table:
+    """Construct an in-memory table, spilling large inputs to disk.
+
+    Inputs larger than `ibis.options.memtable.spill_threshold` are written to
+    a memory-mapped Arrow IPC file, which backends then read without copying.
+    """
+    import ibis
+
+    options = ibis.options.memtable
+    if (threshold := options.spill_threshold) is not None and data.nbytes() > threshold:
+        from ibis.formats.pyarrow import PyArrowIPCFileProxy
+
+        schema = sch.schema(schema)
+        data = PyArrowIPCFileProxy.from_pyarrow(
+            data.to_pyarrow(schema), directory=options.spill_directory
+        )
+    return ops.InMemoryTable(name=name, schema=schema, data=data).to_expr()
+
+
 @lazy_singledispatch
 def _memtable(
     data: Any,
@@ -524,12 +546,11 @@ def _memtable_from_pandas_dataframe(
             f"Duplicate column names found in DataFrame when constructing memtable: {dupes}"
         )
 
-    op = ops.InMemoryTable(
+    return _in_memory_table(
         name=util.gen_name("pandas_memtable"),
         schema=sch.infer(data) if schema is None else schema,
         data=PandasDataFrameProxy(data),
     )
-    return op.to_expr()
 
 
 @_memtable.register("pyarrow.Table")
@@ -544,11 +565,11 @@ def _memtable_from_pyarrow_table(
     if columns is not None:
         assert schema is None, "if `columns` is not `None` then `schema` must be `None`"
         schema = sch.Schema(dict(zip(columns, sch.infer(data).values())))
-    return ops.InMemoryTable(
+    return _in_memory_table(
         name=util.gen_name("pyarrow_memtable"),
         schema=sch.infer(data) if schema is None else schema,
         data=PyArrowTableProxy(data),
-    ).to_expr()
+    )
 
 
 @_memtable.register("pyarrow.dataset.Dataset")
@@ -598,11 +619,11 @@ def _memtable_from_polars_dataframe(
     if columns is not None:
         assert schema is None, "if `columns` is not `None` then `schema` must be `None`"
         schema = sch.Schema(dict(zip(columns, sch.infer(data).values())))
-    return ops.InMemoryTable(
+    return _in_memory_table(
         name=util.gen_name("polars_memtable"),
         schema=sch.infer(data) if schema is None else schema,
         data=PolarsDataFrameProxy(data),
-    ).to_expr()
+    )
 
 
 @_memtable.register("geopandas.geodataframe.GeoDataFrame")
@@ -1836,6 +1857,81 @@ def get_backend(expr: Expr | None = None, /) -> BaseBackend:
     return expr._find_backend(use_default=True)
 
 
+def execute_many(
+    exprs: Iterable[Expr],
+    /,
+    *,
+    params: Mapping[ir.Scalar, Any] | None = None,
+    limit: int | str | None = "default",
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+    fuse: bool = False,
+) -> list[Any]:
+    """Execute independent expressions concurrently.
+
+    Expressions are grouped by backend and each group is executed with
+    [`BaseBackend.execute_many()`](./connection.qmd#ibis.backends.BaseBackend.execute_many).
+
+    Parameters
+    ----------
+    exprs
+        Ibis expressions to execute.
+    params
+        Mapping of scalar parameter expressions to value, shared by all
+        expressions.
+    limit
+        An integer to effect a specific row limit. A value of `None` means
+        "no limit". The default is in `ibis/config.py`.
+    max_concurrency
+        The maximum number of queries to run at the same time against each
+        backend.
+    return_exceptions
+        If `True`, an expression that fails to execute produces its exception
+        in the returned list. Otherwise the first failure, in the order of
+        `exprs`, is raised.
+    fuse
+        If `True`, scalar reductions of the same table, optionally filtered,
+        are computed together by a single aggregation that reads the table
+        once.
+
+    Returns
+    -------
+    list
+        The result of every expression, in the same order as `exprs`.
+
+    Examples
+    --------
+    >>> import ibis
+    >>> t = ibis.memtable({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    >>> ibis.execute_many([t.a.sum(), t.b.nunique(), t.count()])
+    [6, 2, 3]
+    """
+    exprs = list(exprs)
+    # group by identity, distinct connections can compare equal
+    groups = {}
+    for i, expr in enumerate(exprs):
+        backend = expr._find_backend(use_default=True)
+        _, positions, group = groups.setdefault(id(backend), (backend, [], []))
+        positions.append(i)
+        group.append(expr)
+
+    results = [None] * len(exprs)
+    for backend, positions, group in groups.values():
+        for i, result in zip(
+            positions,
+            backend.execute_many(
+                group,
+                params=params,
+                limit=limit,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+                fuse=fuse,
+            ),
+        ):
+            results[i] = result
+    return results
+
+
 def window(
     preceding=None,
     following=None,
@@ -12,6 +12,7 @@ from ibis.expr.operations.maps import *  # noqa: F403
 from ibis.expr.operations.numeric import *  # noqa: F403
 from ibis.expr.operations.reductions import *  # noqa: F403
 from ibis.expr.operations.relations import *  # noqa: F403
+from ibis.expr.operations.sketches import *  # noqa: F403
 from ibis.expr.operations.sortkeys import *  # noqa: F403
 from ibis.expr.operations.strings import *  # noqa: F403
 from ibis.expr.operations.structs import *  # noqa: F403
@@ -110,6 +110,23 @@ class CountStar(Filterable, Reduction):
         return frozenset({self.arg})
 
 
+@public
+class ApproxCountStar(Reduction):
+    """Estimate the number of rows of a relation.
+
+    The estimate is read from the backend's catalog statistics when the query
+    is executed, rows are counted if no estimate is available.
+    """
+
+    arg: Relation
+
+    dtype = dt.int64
+
+    @attribute
+    def relations(self):
+        return frozenset({self.arg})
+
+
 @public
 class CountDistinctStar(Filterable, Reduction):
     """Count the number of distinct rows of a relation."""
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import collections
 import itertools
+import math
+import threading
 import typing
 from abc import abstractmethod
 from typing import Annotated, Any, Literal, Optional, TypeVar
@@ -75,12 +78,161 @@ class Relation(Node, Coercible):
         """
         return FrozenOrderedDict({k: Field(self, k) for k in self.schema})
 
+    @attribute
+    def _lineage(self):
+        # populated lazily by `lineage`, see `_Lineage` for the details
+        return _Lineage()
+
+    def lineage(self, value: Value) -> dict[str, int]:
+        """Find the fields of the relation that `value` is equivalent to.
+
+        A field is equivalent to `value` if following the `.values` mapping of
+        the relation hierarchy from the field leads to `value` through fields
+        only. The result is computed from the lineage of the parent relations
+        and cached on every relation visited, so building a long chain of
+        relations only costs time linear in the length of the chain.
+
+        Parameters
+        ----------
+        value
+            The value to look up.
+
+        Returns
+        -------
+        dict[str, int]
+            A mapping of the equivalent field names to their distance from
+            `value` in the relation hierarchy.
+        """
+        # the caches are shared by every expression built on the relation, so
+        # fill them one thread at a time
+        with _LINEAGE_LOCK:
+            # walk the hierarchy iteratively since it can be deeper than the
+            # recursion limit for long method chains
+            stack = [self]
+            while stack:
+                rel = stack[-1]
+                lineage = rel._lineage
+                if value in lineage.targets:
+                    lineage.targets.move_to_end(value)
+                    stack.pop()
+                    continue
+
+                if rel in value.relations:
+                    # the value refers to the fields of the relation, which neither
+                    # the relation nor its parents can be built from
+                    result = {value.name: 0} if isinstance(value, Field) else {}
+                    lineage.remember(value, result)
+                    stack.pop()
+                    continue
+                elif not isinstance(value, Field) and value not in lineage.expressions(
+                    rel
+                ):
+                    # no field in the hierarchy is built from the expression
+                    lineage.remember(value, {})
+                    stack.pop()
+                    continue
+
+                direct, parents = lineage.sources(rel)
+                if missing := [p for p in parents if value not in p._lineage.targets]:
+                    stack.extend(missing)
+                    continue
+
+                result = dict(direct.get(value, {}))
+                for parent, names in parents.items():
+                    for name, distance in parent._lineage.targets[value].items():
+                        for target in names.get(name, ()):
+                            result[target] = min(
+                                result.get(target, math.inf), distance + 1
+                            )
+                if len(result) > 1:
+                    # keep the fields in the order of the schema
+                    locs = rel.schema._name_locs
+                    result = dict(
+                        sorted(result.items(), key=lambda item: locs[item[0]])
+                    )
+                lineage.remember(value, result)
+                stack.pop()
+
+            return self._lineage.targets[value]
+
     def to_expr(self):
         from ibis.expr.types import Table
 
         return Table(self)
 
 
+_LINEAGE_LOCK = threading.Lock()
+_LINEAGE_CACHE_SIZE = 1024
+
+
+class _Lineage:
+    """The lazily computed lineage of the fields of a relation.
+
+    `targets` maps values to the names of the equivalent fields of the relation
+    and their distances, see `Relation.lineage`. It only keeps the most
+    recently used values, so looking up arbitrary values doesn't keep them
+    alive for as long as the relation. `sources` splits the values of the
+    relation into the expressions its fields are directly built from, and a
+    mapping from the fields of each parent relation to the names of the fields
+    they are carried over to. `expressions` is the set of expressions any field
+    in the hierarchy is directly built from, which is shared with the parent
+    whenever the relation doesn't add any.
+    """
+
+    __slots__ = ("_expressions", "_sources", "targets")
+
+    def __init__(self):
+        self._expressions = None
+        self._sources = None
+        self.targets = collections.OrderedDict()
+
+    def remember(self, value: Value, result: dict[str, int]) -> None:
+        self.targets[value] = result
+        while len(self.targets) > _LINEAGE_CACHE_SIZE:
+            self.targets.popitem(last=False)
+
+    def expressions(self, rel: Relation) -> frozenset[Value]:
+        stack = [rel]
+        while self._expressions is None:
+            lineage = stack[-1]._lineage
+            if lineage._expressions is not None:
+                stack.pop()
+                continue
+
+            direct, parents = lineage.sources(stack[-1])
+            if missing := [p for p in parents if p._lineage._expressions is None]:
+                stack.extend(missing)
+                continue
+
+            sets = [p._lineage._expressions for p in parents]
+            if direct:
+                sets.append(frozenset(direct))
+            if len(sets) == 1:
+                lineage._expressions = sets[0]
+            else:
+                lineage._expressions = frozenset().union(*sets)
+            stack.pop()
+
+        return self._expressions
+
+    def sources(self, rel: Relation):
+        if self._sources is not None:
+            return self._sources
+
+        from ibis.expr.operations.generic import Impure
+
+        direct, parents = {}, {}
+        for name, value in rel.values.items():
+            if isinstance(value, Field):
+                names = parents.setdefault(value.rel, {})
+                names.setdefault(value.name, []).append(name)
+            elif value.relations and not value.find(Impure, filter=Value):
+                direct.setdefault(value, {})[name] = 1
+
+        self._sources = direct, parents
+        return self._sources
+
+
 @public
 class Field(Value):
     """A field of a relation."""
@@ -0,0 +1,76 @@
+"""Operations for building, merging and querying mergeable sketches.
+
+Sketches are opaque binary values summarizing a column. Unlike the
+approximate reductions in `reductions.py`, which return a final number,
+sketches can be stored and merged later on, which allows rollups to be
+maintained incrementally without rescanning the raw data.
+
+The binary representation of a sketch is backend specific: sketches built
+by one backend can only be merged and queried by the same backend.
+"""
+
+from __future__ import annotations
+
+from public import public
+
+import ibis.expr.datatypes as dt
+import ibis.expr.rules as rlz
+from ibis.expr.operations.core import Column, Value
+from ibis.expr.operations.reductions import Filterable, Reduction
+
+
+@public
+class HLLSketch(Filterable, Reduction):
+    """Build a HyperLogLog sketch of the distinct values of a column."""
+
+    arg: Column
+
+    dtype = dt.binary
+
+
+@public
+class HLLMerge(Filterable, Reduction):
+    """Merge a column of HyperLogLog sketches into a single sketch."""
+
+    arg: Column[dt.Binary]
+
+    dtype = dt.binary
+
+
+@public
+class HLLEstimate(Value):
+    """Estimate the number of distinct values summarized by a HyperLogLog sketch."""
+
+    arg: Value[dt.Binary]
+
+    dtype = dt.int64
+    shape = rlz.shape_like("arg")
+
+
+@public
+class TDigestSketch(Filterable, Reduction):
+    """Build a t-digest sketch of the distribution of a numeric column."""
+
+    arg: Column[dt.Numeric]
+
+    dtype = dt.binary
+
+
+@public
+class TDigestMerge(Filterable, Reduction):
+    """Merge a column of t-digest sketches into a single sketch."""
+
+    arg: Column[dt.Binary]
+
+    dtype = dt.binary
+
+
+@public
+class TDigestQuantile(Value):
+    """Estimate a quantile of the distribution summarized by a t-digest sketch."""
+
+    arg: Value[dt.Binary]
+    quantile: Value[dt.Numeric]
+
+    dtype = dt.float64
+    shape = rlz.shape_like("args")
@@ -10,7 +10,7 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.rules as rlz
 import ibis.expr.types as ir
-from ibis.common.annotations import ValidationError
+from ibis.common.annotations import SignatureValidationError, ValidationError
 from ibis.common.patterns import EqualTo
 
 t = ibis.table([("a", "int64")], name="t")
@@ -205,6 +205,24 @@ def test_too_many_or_too_few_args_not_allowed():
         DummyOp()
 
 
+@pytest.mark.parametrize(
+    ("op", "arg"),
+    [
+        (ops.StringLength, "a"),
+        (ops.Lowercase, "a"),
+        (ops.Not, "b"),
+    ],
+)
+def test_recreate_validates_arguments(op, arg):
+    t = ibis.table({"a": "int64", "b": "string", "c": "string", "d": "boolean"})
+    valid = {"a": t.c, "b": t.d}[arg].op()
+    assert op.__recreate__({"arg": valid}) == op(valid)
+
+    # the arguments of existing nodes must still have the right dtype
+    with pytest.raises(SignatureValidationError):
+        op.__recreate__({"arg": t[arg].op()})
+
+
 def test_getitem_on_column_is_error():
     t = ibis.table(dict(a="int"))
 
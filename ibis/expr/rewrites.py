@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import functools
 from typing import TYPE_CHECKING, Optional
 
 import toolz
@@ -16,7 +16,6 @@ from ibis.common.graph import Node as Traversable
 from ibis.common.graph import traverse
 from ibis.common.grounds import Annotable
 from ibis.common.patterns import Check, pattern, replace
-from ibis.common.typing import VarTuple  # noqa: TC001
 from ibis.util import Namespace, promote_list
 
 if TYPE_CHECKING:
@@ -65,12 +64,6 @@ class DerefMap(Annotable, Traversable):
     instance to facilitate lazy dereferencing."""
     extra: Optional[FrozenDict[ops.Node, ops.Node]]
 
-    """Substitution mapping from values of earlier relations to the fields of `rels`."""
-    subs: Optional[FrozenDict[ops.Value, ops.Field]] = None
-
-    """Ambiguous field references."""
-    ambigs: Optional[FrozenDict[ops.Value, VarTuple[ops.Value]]] = None
-
     @classmethod
     def from_targets(
         cls, rels, extra: Mapping[ops.Node, ops.Node] | None = None
@@ -93,64 +86,24 @@ class DerefMap(Annotable, Traversable):
         """
         return cls(rels=frozenset(promote_list(rels)), extra=extra)
 
-    @classmethod
-    def backtrack(cls, value) -> Iterator[tuple[ops.Field, int]]:
-        """Backtrack the field in the relation hierarchy.
-
-        The field is traced back until no modification is made, so only follow
-        ops.Field nodes not arbitrary values.
-
-        Parameters
-        ----------
-        value : ops.Value
-            The value to backtrack.
+    def _lookup(self, value: ops.Value) -> list[ops.Field]:
+        """Find the closest fields of the target relations equivalent to `value`.
 
-        Yields
-        ------
-        tuple[ops.Field, int]
-            The value node and the distance from the original value.
+        The lineage of the relations is cached on the relations themselves, so
+        only the values actually being dereferenced are traced back.
         """
-        distance = 0
-        # track down the field in the hierarchy until no modification
-        # is made so only follow ops.Field nodes not arbitrary values;
-        while isinstance(value, ops.Field):
-            yield value, distance
-            value = value.rel.values.get(value.name)
-            distance += 1
-        if (
-            value is not None
-            and value.relations
-            and not value.find(ops.Impure, filter=ops.Value)
-        ):
-            yield value, distance
-
-    def _fill_substitution_mappings(self) -> None:
-        if self.subs is not None and self.ambigs is not None:
-            return
-
-        mapping = defaultdict(dict)
+        if not value.relations:
+            return []
 
+        distances = {}
         for rel in self.rels:
-            for field in rel.fields.values():
-                for val, distance in self.__class__.backtrack(field):
-                    mapping[val][field] = distance
-
-        subs, ambigs = {}, {}
-        for from_, to in mapping.items():
-            mindist = min(to.values())
-            minkeys = [k for k, v in to.items() if v == mindist]
-            # if all the closest fields are from the same relation, then we
-            # can safely substitute them and we pick the first one arbitrarily
-            if all(minkeys[0].relations == k.relations for k in minkeys):
-                subs[from_] = minkeys[0]
-            else:
-                ambigs[from_] = minkeys
-
-        if extra := self.extra:
-            subs.update(extra)
+            for name, distance in rel.lineage(value).items():
+                distances[ops.Field(rel, name)] = distance
+        if not distances:
+            return []
 
-        self.subs = subs
-        self.ambigs = ambigs
+        mindist = min(distances.values())
+        return [k for k, v in distances.items() if v == mindist]
 
     def dereference(self, *values: ir.Value) -> Iterator[ops.Value]:
         """Dereference values to target relations.
@@ -168,17 +121,27 @@ class DerefMap(Annotable, Traversable):
         tuple[ops.Value]
             The dereferenced values.
         """
+        extra = self.extra or {}
         for v in values:
             if (rels := v.relations) and rels != self.rels:
-                # called on every iteration but only does work once per
-                # instance
-                self._fill_substitution_mappings()
-
-                if ambigs := v.find(self.ambigs.__contains__, filter=ops.Value):
+                subs, ambigs = {}, []
+                for node in v.find(ops.Value, filter=ops.Value):
+                    if not (minkeys := self._lookup(node)):
+                        continue
+                    # if all the closest fields are from the same relation,
+                    # then we can safely substitute them and we pick the
+                    # first one arbitrarily
+                    if all(minkeys[0].relations == k.relations for k in minkeys):
+                        subs[node] = minkeys[0]
+                    else:
+                        ambigs.append(node)
+
+                if ambigs:
                     raise IbisInputError(
                         f"Ambiguous field reference {ambigs!r} in expression {v!r}"
                     )
-                yield v.replace(self.subs, filter=ops.Value)
+                subs.update(extra)
+                yield v.replace(subs, filter=ops.Value)
             else:
                 yield v
 
@@ -406,3 +369,127 @@ def simplify(node):
     node = node.replace(subsequent_projects | subsequent_filters)
     node = node.replace(complete_reprojection)
     return node
+
+
+def _unwrap_filters(value, rel):
+    """Rewrite reductions over a chain of filters to reductions with `where`.
+
+    Return the relation below the filters of `rel` and the rewritten `value`,
+    or `None` if the predicates can't be moved into a reduction.
+    """
+    layers = []
+    while isinstance(rel, ops.Filter):
+        # window functions would be computed over the rows of the aggregation
+        if any(pred.find(ops.WindowFunction) for pred in rel.predicates):
+            return None
+        layers.append(rel)
+        rel = rel.parent
+    if not layers:
+        return rel, value
+
+    base, layers = rel, frozenset(layers)
+
+    def rebase(node, kwargs):
+        if isinstance(node, ops.Field) and node.rel in layers:
+            return ops.Field(base, node.name)
+        elif kwargs:
+            return node.__recreate__(kwargs)
+        else:
+            return node
+
+    predicate = functools.reduce(
+        ops.And,
+        (
+            pred.replace(rebase, filter=ops.Value)
+            for layer in layers
+            for pred in layer.predicates
+        ),
+    )
+
+    def push_down(node, kwargs):
+        if not isinstance(node, ops.Reduction):
+            return rebase(node, kwargs)
+        # reductions of the relation itself such as `CountStar` aren't
+        # traversed, replace them here
+        kwargs = {
+            name: base if arg in layers else arg
+            for name, arg in (
+                kwargs or dict(zip(node.__argnames__, node.__args__))
+            ).items()
+        }
+        where = kwargs["where"]
+        kwargs["where"] = predicate if where is None else ops.And(predicate, where)
+        return node.__recreate__(kwargs)
+
+    return base, value.replace(push_down, filter=ops.Value)
+
+
+def _fusable_relation(value):
+    """Return the relation a scalar reduction `value` is computed from.
+
+    Return `None` if `value` can't be computed along with other reductions.
+    """
+    if (
+        not isinstance(value, ops.Value)
+        or not value.shape.is_scalar()
+        or len(value.relations) != 1
+    ):
+        return None
+    # every reference to the relation must be inside of a reduction that can
+    # be filtered
+    if value.find(ops.Field, filter=p.Value & ~p.Reduction):
+        return None
+    if not all(
+        "where" in red.__argnames__
+        for red in value.find(ops.Reduction, filter=ops.Value)
+    ):
+        return None
+    (rel,) = value.relations
+    return rel
+
+
+def fuse_reductions(values):
+    """Compute scalar reductions over the same relation in single aggregations.
+
+    Reductions over filtered versions of a relation are rewritten to reduce
+    the relation itself with the filters moved into their `where` argument,
+    so that all of them can be computed by scanning the relation once.
+
+    Parameters
+    ----------
+    values
+        Value operations to fuse.
+
+    Returns
+    -------
+    list
+        A tuple for every relation read by more than one of `values`, of an
+        `Aggregate` computing all of them and the positions of those values in
+        `values` along with the name of their column. Values that can't be
+        fused aren't part of any aggregate.
+    """
+    groups = {}
+    for i, value in enumerate(values):
+        if (rel := _fusable_relation(value)) is None or (
+            unwrapped := _unwrap_filters(value, rel)
+        ) is None:
+            continue
+
+        base, value = unwrapped
+        groups.setdefault(base, []).append((i, value))
+
+    fused = []
+    for base, members in groups.items():
+        if len(members) < 2:
+            continue
+        metrics = {}
+        positions = []
+        for i, value in members:
+            name = next(
+                (name for name, metric in metrics.items() if metric == value),
+                f"_{len(metrics)}",
+            )
+            metrics[name] = value
+            positions.append((i, name))
+        fused.append((ops.Aggregate(base, groups={}, metrics=metrics), positions))
+    return fused
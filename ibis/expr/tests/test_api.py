@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import gc
 import operator
+import os
+import pickle
 from datetime import datetime
 
 import pytest
@@ -160,6 +163,62 @@ def test_memtable_column_names_match_schema():
     assert t.op().data.to_frame().columns.tolist() == ["a", "b"]
 
 
+def test_memtable_spills_to_arrow_ipc(monkeypatch, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    from ibis.formats.pyarrow import PyArrowIPCFileProxy
+
+    monkeypatch.setattr(ibis.options.memtable, "spill_threshold", 0)
+    monkeypatch.setattr(ibis.options.memtable, "spill_directory", str(tmp_path))
+
+    data = pa.table({"a": [1, 2, 3], "b": ["x", "y", None]})
+    t = ibis.memtable(data)
+
+    proxy = t.op().data
+    assert isinstance(proxy, PyArrowIPCFileProxy)
+    assert list(tmp_path.iterdir()) == [tmp_path / os.path.basename(proxy.obj)]
+    assert proxy.to_pyarrow(t.schema()).equals(data)
+    assert proxy.to_pyarrow_dataset(t.schema()).to_table().equals(data)
+
+    del t, proxy
+    assert not list(tmp_path.iterdir())
+
+
+def test_memtable_spilled_pickle_roundtrip(monkeypatch, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    monkeypatch.setattr(ibis.options.memtable, "spill_threshold", 0)
+    monkeypatch.setattr(ibis.options.memtable, "spill_directory", str(tmp_path))
+
+    data = pa.table({"a": [1, 2, 3], "b": ["x", "y", None]})
+    t = ibis.memtable(data)
+    expr = t.filter(t.a > 1)
+    pickled = pickle.dumps(expr)
+
+    # the data is pickled along with the expression, not only the file's path
+    del t, expr
+    gc.collect()
+    assert not list(tmp_path.iterdir())
+
+    result = pickle.loads(pickled)
+    proxy = result.op().parent.data
+    assert os.path.exists(proxy.obj)
+    assert proxy.to_pyarrow(result.schema()).equals(data)
+
+
+def test_memtable_spill_threshold(monkeypatch):
+    pd = pytest.importorskip("pandas")
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    nbytes = int(df.memory_usage(index=False, deep=True).sum())
+
+    monkeypatch.setattr(ibis.options.memtable, "spill_threshold", nbytes)
+    assert ibis.memtable(df).op().data.obj is df
+
+    monkeypatch.setattr(ibis.options.memtable, "spill_threshold", nbytes - 1)
+    assert ibis.memtable(df).op().data.to_frame().equals(df)
+    assert ibis.memtable(df).op().data.obj is not df
+
+
 @pytest.mark.parametrize(
     "op",
     [
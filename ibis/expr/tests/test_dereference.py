@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import gc
+import weakref
+
 import pytest
 
 import ibis
+import ibis.expr.operations as ops
 from ibis.expr.types.relations import DerefMap
 
 t = ibis.table(
@@ -42,3 +46,41 @@ def test_dereference_mapping_self_reference(column):
 
     mapping = DerefMap.from_targets([v.op()])
     assert tuple(mapping.dereference(v[column].op())) == (v[column].op(),)
+
+
+def test_lineage_is_derived_from_parents():
+    p = t.select(a=t.int_col, b=t.int_col, c=t.double_col + 1)
+    f = p.filter(p.a > 0)
+
+    assert f.op().lineage(t.int_col.op()) == {"a": 2, "b": 2}
+    assert f.op().lineage((t.double_col + 1).op()) == {"c": 2}
+    assert f.op().lineage(t.string_col.op()) == {}
+    # the lineage of the parent has been computed and cached along the way
+    assert p.op()._lineage.targets[t.int_col.op()] == {"a": 1, "b": 1}
+
+
+def test_dereference_long_chain():
+    expr = t
+    # deeper than the recursion limit
+    for i in range(1500):
+        expr = expr.filter(t.int_col > i)
+
+    mapping = DerefMap.from_targets([expr.op()])
+    assert tuple(mapping.dereference(t.int_col.op())) == (expr.int_col.op(),)
+
+
+def test_lineage_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(ops.relations, "_LINEAGE_CACHE_SIZE", 2)
+
+    f = t.filter(t.int_col > 0)
+    values = [(t.double_col + i).op() for i in range(5)]
+    refs = [weakref.ref(value) for value in values]
+    for value in values:
+        assert f.op().lineage(value) == {}
+
+    # only the most recently used values are kept
+    assert list(f.op()._lineage.targets) == values[-2:]
+
+    del value, values
+    gc.collect()
+    assert [ref() is None for ref in refs] == [True, True, True, False, False]
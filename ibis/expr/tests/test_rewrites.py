@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ibis
 import ibis.expr.operations as ops
-from ibis.expr.rewrites import simplify
+from ibis.expr.rewrites import fuse_reductions, simplify
 
 t = ibis.table(
     name="t",
@@ -102,3 +102,29 @@ def test_simplify_project_filter_project():
 
     t4_opt = simplify(t4.op())
     assert t4_opt == proj.op()
+
+
+def test_fuse_reductions():
+    f = t.filter(t.bool_col)
+    s = ibis.table(name="s", schema={"x": "int64"})
+    exprs = [
+        t.int_col.sum(),
+        f.int_col.max(where=f.float_col > 0),
+        f.count(),
+        s.x.sum(),
+        t.group_by("string_col").agg(n=t.count()),
+        t.int_col.sum(),
+    ]
+
+    [(agg, positions)] = fuse_reductions([expr.op() for expr in exprs])
+
+    assert agg == ops.Aggregate(
+        t,
+        groups={},
+        metrics={
+            "_0": t.int_col.sum(),
+            "_1": t.int_col.max(where=t.bool_col & (t.float_col > 0)),
+            "_2": t.count(where=t.bool_col),
+        },
+    )
+    assert positions == [(0, "_0"), (1, "_1"), (2, "_2"), (5, "_0")]
@@ -18,9 +18,13 @@ from rich.pretty import Pretty
 from rich.text import Text
 
 import ibis
+import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from ibis.expr.types import Column, Scalar, Table
 
 
@@ -283,6 +287,39 @@ def to_rich_scalar(
     return Panel(formatted_value, expand=False, box=box.SQUARE)
 
 
+def _execute_preview(table: Table, max_rows: int) -> pa.Table:
+    """Execute the preview of `table`, reusing the cached result if possible."""
+    expr = table.limit(max_rows + 1)
+    op = table.op()
+    if not (cache_size := ibis.options.repr.interactive.cache_size) or op.find(
+        ops.Impure
+    ):
+        return expr.to_pyarrow()
+
+    try:
+        backend = expr._find_backend(use_default=True)
+    except com.IbisError:
+        # let execution raise the appropriate error
+        return expr.to_pyarrow()
+
+    # the selected columns are part of the table's operation
+    key = op, max_rows
+    cache = backend._preview_cache
+    # the cache is shared between threads, the preview itself runs without
+    # holding the lock
+    with backend._result_caches_lock:
+        if (result := cache.get(key)) is not None:
+            cache.move_to_end(key)
+            return result
+
+    result = expr.to_pyarrow()
+    with backend._result_caches_lock:
+        cache[key] = result
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+    return result
+
+
 def to_rich_table(
     tablish: Table | Column,
     *,
@@ -328,7 +365,7 @@ def to_rich_table(
         if orig_ncols > len(computed_cols):
             table = table.select(*computed_cols)
 
-    result = table.limit(max_rows + 1).to_pyarrow()
+    result = _execute_preview(table, max_rows)
     # Now format the columns in order, stopping if the console width would
     # be exceeded.
     col_info = []
@@ -30,6 +30,57 @@ class BinaryValue(Value):
         """
         return ops.HashBytes(self, how).to_expr()
 
+    def hll_estimate(self) -> ir.IntegerValue:
+        """Estimate the number of distinct elements summarized by a HyperLogLog sketch.
+
+        `self` must be a sketch built by
+        [`hll_sketch`](./expression-generic.qmd#ibis.expr.types.generic.Column.hll_sketch)
+        or [`hll_merge`](#ibis.expr.types.binary.BinaryColumn.hll_merge).
+
+        Returns
+        -------
+        IntegerValue
+            The approximate number of distinct elements
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"x": ["a", "b", "a", "c"]})
+        >>> con.execute(t.x.hll_sketch().hll_estimate())
+        3
+        """
+        return ops.HLLEstimate(self).to_expr()
+
+    def tdigest_quantile(
+        self, quantile: float | ir.NumericValue, /
+    ) -> ir.FloatingValue:
+        """Estimate a quantile of the distribution summarized by a t-digest sketch.
+
+        `self` must be a sketch built by
+        [`tdigest_sketch`](./expression-numeric.qmd#ibis.expr.types.numeric.NumericColumn.tdigest_sketch)
+        or [`tdigest_merge`](#ibis.expr.types.binary.BinaryColumn.tdigest_merge).
+
+        Parameters
+        ----------
+        quantile
+            `0 <= quantile <= 1`, the quantile to estimate
+
+        Returns
+        -------
+        FloatingValue
+            The approximate quantile
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"x": [1.0, 2.0, 3.0, 4.0, 5.0]})
+        >>> con.execute(t.x.tdigest_sketch().tdigest_quantile(0.5))
+        3.0
+        """
+        return ops.TDigestQuantile(self, quantile).to_expr()
+
 
 @public
 class BinaryScalar(Scalar, BinaryValue):
@@ -38,4 +89,58 @@ class BinaryScalar(Scalar, BinaryValue):
 
 @public
 class BinaryColumn(Column, BinaryValue):
-    pass
+    def hll_merge(self, *, where: ir.BooleanValue | None = None) -> BinaryScalar:
+        """Merge a column of HyperLogLog sketches into a single sketch.
+
+        `self` must be a column of sketches built by
+        [`hll_sketch`](./expression-generic.qmd#ibis.expr.types.generic.Column.hll_sketch)
+        on the same backend.
+
+        Parameters
+        ----------
+        where
+            Filter in values when `where` is `True`
+
+        Returns
+        -------
+        BinaryScalar
+            A HyperLogLog sketch summarizing all the sketches in `self`
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"day": [1, 1, 2, 2], "user": ["a", "b", "a", "c"]})
+        >>> daily = t.group_by("day").agg(users=t.user.hll_sketch())
+        >>> con.execute(daily.users.hll_merge().hll_estimate())
+        3
+        """
+        return ops.HLLMerge(self, where=self._bind_to_parent_table(where)).to_expr()
+
+    def tdigest_merge(self, *, where: ir.BooleanValue | None = None) -> BinaryScalar:
+        """Merge a column of t-digest sketches into a single sketch.
+
+        `self` must be a column of sketches built by
+        [`tdigest_sketch`](./expression-numeric.qmd#ibis.expr.types.numeric.NumericColumn.tdigest_sketch)
+        on the same backend.
+
+        Parameters
+        ----------
+        where
+            Filter in values when `where` is `True`
+
+        Returns
+        -------
+        BinaryScalar
+            A t-digest sketch summarizing all the sketches in `self`
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"day": [1, 1, 2], "x": [1.0, 2.0, 3.0]})
+        >>> daily = t.group_by("day").agg(x=t.x.tdigest_sketch())
+        >>> con.execute(daily.x.tdigest_merge().tdigest_quantile(1))
+        3.0
+        """
+        return ops.TDigestMerge(self, where=self._bind_to_parent_table(where)).to_expr()
@@ -12,6 +12,7 @@ import ibis.expr.operations as ops
 from ibis.common.exceptions import IbisError, TranslationError
 from ibis.common.grounds import Immutable
 from ibis.common.patterns import Coercible, CoercionError
+from ibis.common.serialize import from_node_table, to_node_table
 from ibis.common.typing import get_defining_scope
 from ibis.config import _default_backend
 from ibis.config import options as opts
@@ -101,7 +102,9 @@ class Expr(Immutable, Coercible):
             raise CoercionError("Unable to coerce value to an expression")
 
     def __reduce__(self):
-        return (self.__class__, (self._arg,))
+        # pickle the operation graph as a node table to store shared subgraphs
+        # once and to skip validating them again when unpickling
+        return (_from_node_table, (self.__class__, to_node_table(self._arg)))
 
     def __hash__(self):
         return hash((self.__class__, self._arg))
@@ -987,3 +990,7 @@ class Expr(Immutable, Coercible):
         raise NotImplementedError(
             f"{type(self)} expressions cannot be converted into scalars"
         )
+
+
+def _from_node_table(cls: type[Expr], table: tuple) -> Expr:
+    return cls(from_node_table(table))
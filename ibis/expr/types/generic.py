@@ -1862,6 +1862,47 @@ class Column(Value, FixedTextJupyterMixin):
             self, where=self._bind_to_parent_table(where)
         ).to_expr()
 
+    def hll_sketch(self, *, where: ir.BooleanValue | None = None) -> ir.BinaryScalar:
+        """Build a HyperLogLog sketch of the distinct elements of `self`.
+
+        Unlike [`approx_nunique`](#ibis.expr.types.generic.Column.approx_nunique),
+        the result is a mergeable sketch rather than a number. Sketches can be
+        stored, combined with
+        [`hll_merge`](./expression-binary.qmd#ibis.expr.types.binary.BinaryColumn.hll_merge)
+        and queried with
+        [`hll_estimate`](./expression-binary.qmd#ibis.expr.types.binary.BinaryValue.hll_estimate).
+
+        ::: {.callout-note}
+        ## Sketches are backend specific
+
+        The binary representation of a sketch depends on the backend, so a
+        sketch can only be merged and queried by the backend that built it.
+        HyperLogLog sketches are only supported by the BigQuery, ClickHouse,
+        Databricks, Polars, PySpark, Snowflake and Trino backends.
+        :::
+
+        Parameters
+        ----------
+        where
+            Filter in values when `where` is `True`
+
+        Returns
+        -------
+        BinaryScalar
+            A HyperLogLog sketch of `self`
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"day": [1, 1, 2, 2, 2], "user": ["a", "b", "a", "c", "d"]})
+        >>> daily = t.group_by("day").agg(users=t.user.hll_sketch())
+        >>> con.execute(daily.aggregate(users=daily.users.hll_merge().hll_estimate()))
+           users
+        0      4
+        """
+        return ops.HLLSketch(self, where=self._bind_to_parent_table(where)).to_expr()
+
     def approx_median(self, *, where: ir.BooleanValue | None = None) -> Scalar:
         """Return an approximate of the median of `self`.
 
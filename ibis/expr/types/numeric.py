@@ -1491,6 +1491,50 @@ class NumericColumn(Column, NumericValue):
             op = ops.ApproxQuantile
         return op(self, quantile, where=self._bind_to_parent_table(where)).to_expr()
 
+    def tdigest_sketch(
+        self, *, where: ir.BooleanValue | None = None
+    ) -> ir.BinaryScalar:
+        """Build a t-digest sketch of the distribution of `self`.
+
+        Unlike [`approx_quantile`](#ibis.expr.types.numeric.NumericColumn.approx_quantile),
+        the result is a mergeable sketch rather than a number. Sketches can be
+        stored, combined with
+        [`tdigest_merge`](./expression-binary.qmd#ibis.expr.types.binary.BinaryColumn.tdigest_merge)
+        and queried with
+        [`tdigest_quantile`](./expression-binary.qmd#ibis.expr.types.binary.BinaryValue.tdigest_quantile).
+
+        ::: {.callout-note}
+        ## Sketches are backend specific
+
+        The binary representation of a sketch depends on the backend, so a
+        sketch can only be merged and queried by the backend that built it.
+        t-digest sketches are only supported by the ClickHouse, Polars,
+        Snowflake and Trino backends.
+        :::
+
+        Parameters
+        ----------
+        where
+            Boolean filter for input values
+
+        Returns
+        -------
+        BinaryScalar
+            A t-digest sketch of `self`
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.polars.connect()
+        >>> t = ibis.memtable({"day": [1, 1, 2, 2, 2], "x": [1.0, 2.0, 3.0, 4.0, 5.0]})
+        >>> daily = t.group_by("day").agg(x=t.x.tdigest_sketch())
+        >>> con.execute(daily.x.tdigest_merge().tdigest_quantile(0.5))
+        3.0
+        """
+        return ops.TDigestSketch(
+            self, where=self._bind_to_parent_table(where)
+        ).to_expr()
+
 
 @public
 class IntegerValue(NumericValue):
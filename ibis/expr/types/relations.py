@@ -10,6 +10,7 @@ from keyword import iskeyword
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, overload
 
 import toolz
+from packaging.version import parse as vparse
 from public import public
 
 import ibis
@@ -46,6 +47,10 @@ if TYPE_CHECKING:
     from ibis.selectors import IfAnyAll
 
 
+# the number of tables whose discovered `pivot_wider` names are cached per
+# backend
+_PIVOT_NAMES_CACHE_SIZE = 32
+
 # Join method docstring templates following the ibis/examples pattern
 _JOIN_DOCSTRING_TEMPLATES = {
     "inner": """\
@@ -579,7 +584,13 @@ class Table(Expr, FixedTextJupyterMixin):
         return IbisDataFrame(self, nan_as_null=nan_as_null, allow_copy=allow_copy)
 
     def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
-        return self.to_pyarrow().__arrow_c_stream__(requested_schema)
+        import pyarrow as pa
+
+        if requested_schema is not None and vparse(pa.__version__) < vparse("16"):
+            # record batch readers can only be cast since pyarrow 16
+            return self.to_pyarrow().__arrow_c_stream__(requested_schema)
+        # stream the result so consumers don't need the whole table in memory
+        return self.to_pyarrow_batches().__arrow_c_stream__(requested_schema)
 
     def __pyarrow_result__(
         self,
@@ -3036,7 +3047,7 @@ class Table(Expr, FixedTextJupyterMixin):
         return ops.CountDistinctStar(self, where=where).to_expr()
 
     def count(
-        self, *, where: ir.BooleanValue | Deferred | None = None
+        self, *, where: ir.BooleanValue | Deferred | None = None, approx: bool = False
     ) -> ir.IntegerScalar:
         """Compute the number of rows in the table.
 
@@ -3044,6 +3055,13 @@ class Table(Expr, FixedTextJupyterMixin):
         ----------
         where
             Optional boolean expression to filter rows when counting.
+        approx
+            Use the row count estimate from the backend's catalog statistics
+            instead of counting rows. The estimate is read when the expression
+            is executed, see the backend's `estimate_rows` method. Rows are
+            counted if the table isn't a physical table in the backend, if no
+            estimate is available, or if the count is part of a grouped or
+            larger aggregation. Ignored if `where` is given.
 
         Returns
         -------
@@ -3078,6 +3096,8 @@ class Table(Expr, FixedTextJupyterMixin):
         """
         if where is not None:
             (where,) = bind(self, where)
+        elif approx:
+            return ops.ApproxCountStar(self).to_expr()
         return ops.CountStar(self, where=where).to_expr()
 
     def drop_null(
@@ -4575,7 +4595,10 @@ class Table(Expr, FixedTextJupyterMixin):
             * When this value is `None`, the values will be computed by executing
               a query against the backend to discover unique values
               from `names_from`. This breaks lazy evaluation and may be slow
-              on large or remote datasets.
+              on large or remote datasets. The discovered values are cached
+              by the backend until a table is modified through it or
+              [`clear_pivot_names_cache`](./expression-tables.qmd#ibis.backends.BaseBackend.clear_pivot_names_cache)
+              is called.
             * When this value is not `None`, each element's length must match
               the length of `names_from`.
 
@@ -4952,9 +4975,7 @@ class Table(Expr, FixedTextJupyterMixin):
 
         if names is None:
             # no names provided, compute them from the data
-            names = self.select(names_from).distinct().execute()
-            columns = names.columns.tolist()
-            names = list(names.itertuples(index=False))
+            columns, names = self._discover_pivot_names(names_from)
         else:
             if not (columns := [col.get_name() for col in names_from.expand(self)]):
                 raise com.IbisInputError(
@@ -5007,6 +5028,52 @@ class Table(Expr, FixedTextJupyterMixin):
 
         return self.group_by(*grouping_keys).aggregate(**aggs)
 
+    def _discover_pivot_names(
+        self, names_from: s.Selector
+    ) -> tuple[list[str], list[tuple]]:
+        """Query the distinct values of `names_from`, reusing cached results.
+
+        Discovered names are cached per backend, keyed on the table and the
+        `names_from` columns, so that rebuilding an expression that pivots the
+        same data doesn't query the backend again. Only the names of the most
+        recently pivoted tables are kept.
+        """
+        expr = self.select(names_from)
+        op = self.op()
+
+        try:
+            backend = expr._find_backend(use_default=True)
+        except com.IbisError:
+            backend = None
+
+        cacheable = backend is not None and not op.find(ops.Impure)
+        key = op, tuple(expr.columns)
+        cached = None
+        if cacheable:
+            cache = backend._pivot_names_cache
+            # the cache is shared between threads, the query itself runs
+            # without holding the lock
+            with backend._result_caches_lock:
+                if (cached := cache.get(key)) is not None:
+                    cache.move_to_end(key)
+
+        if cached is None:
+            result = expr.distinct().execute()
+            cached = result.columns.tolist(), list(result.itertuples(index=False))
+            if cacheable:
+                with backend._result_caches_lock:
+                    cache[key] = cached
+                    # the keys hold on to the pivoted tables, including
+                    # in-memory data, so only the most recently used ones are
+                    # kept
+                    while len(cache) > _PIVOT_NAMES_CACHE_SIZE:
+                        cache.popitem(last=False)
+
+        columns, names = cached
+
+        # callers may sort the names in place
+        return columns, names.copy()
+
     def relocate(
         self,
         *columns: str | s.Selector,
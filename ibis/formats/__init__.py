@@ -251,6 +251,12 @@ class TableProxy(PseudoHashable[T]):
     def to_polars(self, schema: Schema) -> pl.DataFrame:  # pragma: no cover
         """Convert this input to a Polars DataFrame."""
 
+    def nbytes(self) -> int:
+        """Return the approximate size of this input in memory, in bytes."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support computing its size"
+        )
+
     def to_pyarrow_bytes(self, schema: Schema) -> bytes:
         import pyarrow as pa
         import pyarrow_hotfix  # noqa: F401
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import functools
 from functools import partial
 from importlib.util import find_spec as _find_spec
-from typing import TYPE_CHECKING
+from itertools import islice, pairwise
+from typing import TYPE_CHECKING, NamedTuple
 
 import numpy as np
 import pandas as pd
@@ -29,9 +31,83 @@ if TYPE_CHECKING:
 
 _DEFAULT_DATETIME_RESOLUTION = "ns" if vparse(pd.__version__) < vparse("3") else "us"
 
+# element converters that converting through Arrow reproduces
+_ARROW_ELEMENT_CONVERTERS = frozenset({"Array", "Map", "Struct", "Timestamp"})
+
 geospatial_supported = _find_spec("geopandas") is not None
 
 
+def _with_nanosecond_timestamps(dtype: dt.DataType) -> dt.DataType:
+    """Use nanosecond timestamps in `dtype`.
+
+    Nested nanosecond timestamps are integers after `pa.Table.to_pandas`, which
+    element conversion interprets as nanoseconds since the epoch.
+    """
+    if dtype.is_timestamp():
+        return dtype.copy(scale=9)
+    elif dtype.is_array():
+        return dtype.copy(value_type=_with_nanosecond_timestamps(dtype.value_type))
+    elif dtype.is_map():
+        return dtype.copy(
+            key_type=_with_nanosecond_timestamps(dtype.key_type),
+            value_type=_with_nanosecond_timestamps(dtype.value_type),
+        )
+    elif dtype.is_struct():
+        return dtype.copy(
+            fields={
+                name: _with_nanosecond_timestamps(typ) for name, typ in dtype.items()
+            }
+        )
+    return dtype
+
+
+def _arrow_to_pylist(arr: pa.Array, dtype: dt.DataType) -> list:
+    """Convert `arr` to Python objects, one child array at a time.
+
+    Nested numbers are Python scalars, naive timestamps with at most
+    microsecond precision are `datetime.datetime` objects and all other
+    timestamps are `pd.Timestamp` objects.
+    """
+    if dtype.is_array():
+        values = _arrow_to_pylist(arr.values, dtype.value_type)
+        offsets = arr.offsets.to_numpy().tolist()
+        result = [values[i:j] for i, j in pairwise(offsets)]
+    elif dtype.is_map():
+        keys = _arrow_to_pylist(arr.keys, dtype.key_type)
+        values = _arrow_to_pylist(arr.items, dtype.value_type)
+        offsets = arr.offsets.to_numpy()
+        items = islice(zip(keys, values), offsets[0], None)
+        result = [dict(islice(items, n)) for n in np.diff(offsets).tolist()]
+    elif dtype.is_struct():
+        names = dtype.names
+        fields = (
+            _arrow_to_pylist(arr.field(i), typ) for i, typ in enumerate(dtype.types)
+        )
+        result = [dict(zip(names, row)) for row in zip(*fields)]
+    elif dtype.is_timestamp() and dtype.timezone is None and (dtype.scale or 0) <= 6:
+        import pyarrow as pa
+
+        result = arr.cast(pa.timestamp("us"), safe=False).to_pylist()
+    else:
+        values = arr.to_pandas(integer_object_nulls=True, date_as_object=True)
+        if dtype.is_timestamp() and (tz := dtype.timezone) is not None:
+            values = values.dt.tz_convert(normalize_timezone(tz))
+        result = values.tolist()
+
+    if arr.null_count:
+        for i in np.flatnonzero(arr.is_null().to_numpy(zero_copy_only=False)):
+            result[i] = None
+    return result
+
+
+class _ConversionPlan(NamedTuple):
+    # (name, dtype, pandas type, converter, whether conforming columns are
+    # passed through untouched) for every column
+    columns: tuple
+    # names of the geospatial columns
+    geometries: tuple[str, ...]
+
+
 class PandasType(NumpyType):
     @classmethod
     def to_ibis(cls, typ, nullable=True):
@@ -129,12 +205,26 @@ class PandasData(DataMapper):
         if schema.names != tuple(df.columns):
             raise ValueError("schema names don't match input data columns")
 
-        columns = {
-            name: cls.convert_column(df[name], dtype) for name, dtype in schema.items()
-        }
-        df = pd.DataFrame(columns)
+        plan = cls._conversion_plan(schema, pd.options.future.infer_string)
 
-        if geospatial_supported:
+        columns = {}
+        converted = False
+        for name, dtype, pandas_type, convert, passthrough in plan.columns:
+            column = df[name]
+            if not (passthrough and column.dtype == pandas_type):
+                result = convert(column, dtype, pandas_type)
+                assert not isinstance(result, np.ndarray), (
+                    f"{convert} -> {type(result)}"
+                )
+                converted |= result is not column
+                column = result
+            columns[name] = column
+
+        # batches that already have the desired types are returned as is
+        if converted:
+            df = pd.DataFrame(columns)
+
+        if geospatial_supported and plan.geometries:
             from geopandas import GeoDataFrame
             from geopandas.array import GeometryDtype
 
@@ -143,8 +233,8 @@ class PandasData(DataMapper):
                 geom := next(
                     (
                         name
-                        for name, c in df.items()
-                        if isinstance(c.dtype, GeometryDtype)
+                        for name in plan.geometries
+                        if isinstance(columns[name].dtype, GeometryDtype)
                     ),
                     None,
                 )
@@ -153,11 +243,43 @@ class PandasData(DataMapper):
         return df
 
     @classmethod
-    def convert_column(cls, obj, dtype):
-        pandas_type = PandasType.from_ibis(dtype)
+    @functools.lru_cache(maxsize=256)
+    def _conversion_plan(
+        cls, schema: sch.Schema, infer_string: bool
+    ) -> _ConversionPlan:
+        """Compile the per-column conversion of `schema`.
+
+        Cached, so that converting many batches with the same schema only
+        looks up the pandas type and the converter of every column once.
+        `infer_string` is part of the cache key because the pandas string type
+        depends on it.
+        """
+        columns = []
+        for name, dtype in schema.items():
+            pandas_type, convert = cls._column_converter(dtype, infer_string)
+            passthrough = (
+                getattr(convert, "__func__", None)
+                is PandasData.convert_default.__func__
+                and dtype.is_primitive()
+            )
+            columns.append((name, dtype, pandas_type, convert, passthrough))
+        geometries = tuple(
+            name for name, dtype in schema.items() if dtype.is_geospatial()
+        )
+        return _ConversionPlan(tuple(columns), geometries)
 
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _column_converter(cls, dtype: dt.DataType, infer_string: bool):
+        pandas_type = PandasType.from_ibis(dtype)
         method_name = f"convert_{dtype.__class__.__name__}"
-        convert_method = getattr(cls, method_name, cls.convert_default)
+        return pandas_type, getattr(cls, method_name, cls.convert_default)
+
+    @classmethod
+    def convert_column(cls, obj, dtype):
+        pandas_type, convert_method = cls._column_converter(
+            dtype, pd.options.future.infer_string
+        )
 
         result = convert_method(obj, dtype, pandas_type)
         assert not isinstance(result, np.ndarray), f"{convert_method} -> {type(result)}"
@@ -289,15 +411,15 @@ class PandasData(DataMapper):
 
     @classmethod
     def convert_Struct(cls, s, dtype, pandas_type):
-        return s.map(cls.get_element_converter(dtype), na_action="ignore")
+        return cls.convert_nested(s, dtype)
 
     @classmethod
     def convert_Array(cls, s, dtype, pandas_type):
-        return s.map(cls.get_element_converter(dtype), na_action="ignore")
+        return cls.convert_nested(s, dtype)
 
     @classmethod
     def convert_Map(cls, s, dtype, pandas_type):
-        return s.map(cls.get_element_converter(dtype), na_action="ignore")
+        return cls.convert_nested(s, dtype)
 
     @classmethod
     def convert_JSON(cls, s, dtype, pandas_type):
@@ -305,6 +427,85 @@ class PandasData(DataMapper):
             "object"
         )
 
+    @classmethod
+    def convert_nested(cls, s, dtype):
+        """Convert a column of arrays, maps or structs.
+
+        When Arrow can reproduce the element conversion of `dtype` the column
+        is loaded into an Arrow array of the target type once, every leaf is
+        converted in a single vectorized pass and the nested values are then
+        reassembled from the Arrow offsets, instead of calling a Python
+        function for every (nested) element. Any column that Arrow cannot
+        represent falls back to element conversion.
+
+        Converted nested values are built from Python scalars, so numbers
+        inside of arrays are `int` and `float` rather than the numpy scalars
+        of the arrays produced by `pa.Table.to_pandas`.
+        """
+        if cls._converts_with_arrow(dtype):
+            import pyarrow as pa
+
+            try:
+                return cls._convert_nested_with_arrow(s, dtype)
+            except (
+                pa.ArrowException,
+                TypeError,
+                ValueError,
+                NotImplementedError,
+                OverflowError,
+            ):
+                pass
+        return s.map(cls.get_element_converter(dtype), na_action="ignore")
+
+    @classmethod
+    def _converts_with_arrow(cls, dtype) -> bool:
+        name = type(dtype).__name__
+        converter = getattr(cls, f"convert_{name}_element", None)
+        if converter is not None and (
+            name not in _ARROW_ELEMENT_CONVERTERS
+            # subclasses customize element conversion for their backend
+            or converter.__func__
+            is not getattr(PandasData, f"convert_{name}_element").__func__
+        ):
+            return False
+        elif dtype.is_interval():
+            # nested intervals are integers in an unknown unit
+            return False
+        elif dtype.is_array():
+            # Arrow reinterprets numpy datetime64 arrays in the unit of the
+            # target type instead of converting them
+            return not dtype.value_type.is_timestamp() and cls._converts_with_arrow(
+                dtype.value_type
+            )
+        elif dtype.is_map():
+            return cls._converts_with_arrow(
+                dtype.key_type
+            ) and cls._converts_with_arrow(dtype.value_type)
+        elif dtype.is_struct():
+            return all(map(cls._converts_with_arrow, dtype.types))
+        return True
+
+    @classmethod
+    def _convert_nested_with_arrow(cls, s, dtype):
+        import pyarrow as pa
+
+        mask = s.isna().to_numpy()
+        # NaN is a value inside of nested types, so only the top level nulls
+        # are masked
+        arr = pa.array(
+            s.to_numpy(dtype=object),
+            type=PyArrowType.from_ibis(_with_nanosecond_timestamps(dtype)),
+            mask=mask,
+            from_pandas=False,
+        )
+        result = pd.Series(
+            _arrow_to_pylist(arr, dtype), index=s.index, name=s.name, dtype=object
+        )
+        if mask.any():
+            # preserve the original null values
+            result[mask] = s[mask]
+        return result
+
     @classmethod
     def get_element_converter(cls, dtype):
         name = f"convert_{type(dtype).__name__}_element"
@@ -429,6 +630,9 @@ class PandasDataFrameProxy(TableProxy[pd.DataFrame]):
     def to_frame(self) -> pd.DataFrame:
         return self.obj
 
+    def nbytes(self) -> int:
+        return int(self.obj.memory_usage(index=False, deep=True).sum())
+
     def to_pyarrow(self, schema: sch.Schema) -> pa.Table:
         from decimal import Decimal
 
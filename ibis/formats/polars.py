@@ -175,6 +175,9 @@ class PolarsDataFrameProxy(TableProxy[pl.DataFrame]):
     def to_frame(self) -> pd.DataFrame:
         return self.obj.to_pandas()
 
+    def nbytes(self) -> int:
+        return int(self.obj.estimated_size())
+
     def to_pyarrow(self, schema: Schema) -> pa.Table:
         from ibis.formats.pyarrow import PyArrowData
 
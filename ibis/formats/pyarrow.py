@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import os
+import tempfile
+import weakref
 from typing import TYPE_CHECKING, Any
 
 import pyarrow as pa
@@ -10,7 +14,7 @@ import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 from ibis.expr.schema import Schema
 from ibis.formats import DataMapper, SchemaMapper, TableProxy, TypeMapper
-from ibis.util import V
+from ibis.util import V, gen_name
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -328,19 +332,32 @@ class PyArrowData(DataMapper):
 
     @classmethod
     def convert_table(cls, table: pa.Table, schema: Schema) -> pa.Table:
-        desired_schema = PyArrowSchema.from_ibis(schema)
+        desired_schema = _pyarrow_schema(schema)
         if table.schema == desired_schema:
             return table
-        arrays = [
-            cls.convert_column(table[name], dtype) for name, dtype in schema.items()
-        ]
+        arrays = []
+        for (name, dtype), field in zip(schema.items(), desired_schema):
+            column = table[name]
+            # only cast the columns that don't already have the desired type
+            if column.type != field.type:
+                column = cls.convert_column(column, dtype)
+            arrays.append(column)
         return pa.Table.from_arrays(arrays, schema=desired_schema)
 
 
+@functools.lru_cache(maxsize=256)
+def _pyarrow_schema(schema: Schema) -> pa.Schema:
+    # cached, converting a stream of batches converts the same schema each time
+    return PyArrowSchema.from_ibis(schema)
+
+
 class PyArrowTableProxy(TableProxy[V]):
     def to_frame(self):
         return self.obj.to_pandas()
 
+    def nbytes(self) -> int:
+        return self.obj.nbytes
+
     def to_pyarrow(self, schema: Schema) -> pa.Table:
         return self.obj
 
@@ -386,3 +403,92 @@ directly by running `ibis.memtable(my_dataset.to_table())`."""
 
     def to_polars(self, schema: Schema) -> pa.Table:
         raise com.UnsupportedOperationError(self.ERROR_MESSAGE)
+
+
+class PyArrowIPCFileProxy(TableProxy[str]):
+    """A table spilled to an Arrow IPC file and memory-mapped on access.
+
+    The file is written once and removed when the proxy is garbage collected.
+    Reading the file back is zero-copy, so backends registering the table
+    don't hold additional copies of the data in memory.
+    """
+
+    __slots__ = ("obj",)
+    obj: str
+
+    def __init__(self, obj: str) -> None:
+        self.obj = obj
+
+    # paths are hashable, so we override the hash from TableProxy
+    def __hash__(self):
+        return hash(self.obj)
+
+    def __reduce__(self):
+        # the file only exists on this host for as long as the proxy is alive,
+        # so the data is pickled instead and spilled again when unpickled
+        return (_spill_ipc_bytes, (self.to_pyarrow_bytes(schema=None),))
+
+    @classmethod
+    def from_pyarrow(
+        cls, table: pa.Table, directory: str | None = None
+    ) -> PyArrowIPCFileProxy:
+        """Write `table` to an Arrow IPC file in `directory` and proxy it."""
+        path = os.path.join(
+            directory if directory is not None else tempfile.gettempdir(),
+            f"{gen_name('memtable')}.arrow",
+        )
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        proxy = cls(path)
+        weakref.finalize(proxy, _remove_file, path)
+        return proxy
+
+    def to_frame(self) -> pd.DataFrame:
+        return self.to_pyarrow(schema=None).to_pandas()
+
+    def nbytes(self) -> int:
+        return os.path.getsize(self.obj)
+
+    def to_pyarrow(self, schema: Schema) -> pa.Table:
+        with pa.ipc.open_file(pa.memory_map(self.obj)) as reader:
+            return reader.read_all()
+
+    def to_pyarrow_dataset(self, schema: Schema) -> ds.Dataset:
+        """Return a dataset over the spilled file.
+
+        Use with backends that can perform pushdowns into dataset objects.
+        """
+        import pyarrow.dataset as ds
+
+        return ds.dataset(self.obj, format="arrow")
+
+    def to_polars(self, schema: Schema) -> pl.DataFrame:
+        import polars as pl
+
+        from ibis.formats.polars import PolarsData
+
+        df = pl.read_ipc(self.obj, memory_map=True)
+        return PolarsData.convert_table(df, schema)
+
+    def to_pyarrow_bytes(self, schema: Schema) -> bytes:
+        # the spilled file is already in the arrow IPC file format
+        with open(self.obj, "rb") as f:
+            return f.read()
+
+
+def _spill_ipc_bytes(data: bytes) -> PyArrowIPCFileProxy:
+    import ibis
+
+    with pa.ipc.open_file(pa.py_buffer(data)) as reader:
+        table = reader.read_all()
+    return PyArrowIPCFileProxy.from_pyarrow(
+        table, directory=ibis.options.memtable.spill_directory
+    )
+
+
+def _remove_file(path: str) -> None:
+    # the file may still be mapped on platforms that don't allow removing it
+    with contextlib.suppress(OSError):
+        os.remove(path)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import time
+from datetime import datetime, time
 from decimal import Decimal
 
 import pytest
@@ -457,3 +457,100 @@ def test_schema_doesnt_match_input_columns():
     schema = sch.Schema({"a": "int64", "b": "int64"})
     with pytest.raises(ValueError, match="schema names don't match"):
         PandasData.convert_table(df, schema)
+
+
+@pytest.mark.parametrize(
+    ("dtype", "data"),
+    [
+        param("array<int64>", [[1, None], [], None], id="array"),
+        param(
+            "array<struct<a: int64, b: string>>",
+            [[{"a": 1, "b": "x"}, None], [{"a": None, "b": "y"}], None],
+            id="array_of_structs",
+        ),
+        param(
+            "map<string, array<float64>>",
+            [[("a", [1.5, None])], {"b": []}, None],
+            id="map",
+        ),
+        param(
+            "struct<t: timestamp('America/New_York')>",
+            [{"t": pd.Timestamp("2020-01-01", tz="UTC")}, {"t": None}, None],
+            id="struct_with_tz_timestamp",
+        ),
+        param("array<json>", [['{"a": 1}', "null"], None], id="array_of_json"),
+    ],
+)
+def test_convert_nested_matches_element_conversion(dtype, data):
+    dtype = dt.dtype(dtype)
+    s = pd.Series(data + [np.nan], dtype=object)
+
+    result = PandasData.convert_column(s, dtype)
+    expected = s.map(PandasData.get_element_converter(dtype), na_action="ignore")
+    tm.assert_series_equal(result, expected)
+
+
+def test_convert_nested_from_arrow():
+    dtype = dt.dtype("array<struct<a: int64, t: timestamp('UTC')>>")
+    arr = pa.array(
+        [[{"a": 1, "t": 1}, {"a": None, "t": None}], None],
+        type=pa.list_(
+            pa.struct([("a", pa.int64()), ("t", pa.timestamp("ns", tz="UTC"))])
+        ),
+    )
+    # nested nanosecond timestamps are integers after converting to pandas
+    result = PandasData.convert_column(arr.to_pandas(), dtype)
+    assert result.tolist() == [
+        [
+            {"a": 1, "t": pd.Timestamp(1, tz="UTC")},
+            {"a": None, "t": None},
+        ],
+        None,
+    ]
+
+
+def test_convert_nested_element_types():
+    dtype = dt.dtype("struct<t: timestamp(6), xs: array<float64>, n: int64>")
+    arr = pa.array(
+        [{"t": datetime(2020, 1, 1, 0, 0, 0, 1), "xs": [1.5], "n": 1}],
+        type=dtype.to_pyarrow(),
+    )
+    [value] = PandasData.convert_column(arr.to_pandas(), dtype).tolist()
+    # naive timestamps stay datetimes and numbers are Python scalars, even in
+    # arrays that pandas represents as numpy arrays
+    assert type(value["t"]) is datetime
+    assert value["t"] == datetime(2020, 1, 1, 0, 0, 0, 1)
+    assert type(value["xs"][0]) is float
+    assert type(value["n"]) is int
+
+
+def test_convert_table_returns_conforming_frame():
+    df = pd.DataFrame({"a": np.array([1, 2], dtype="int64"), "b": [1.0, 2.0]})
+    schema = ibis.schema({"a": "int64", "b": "float64"})
+    assert PandasData.convert_table(df, schema) is df
+
+    schema = ibis.schema({"a": "int32", "b": "float64"})
+    result = PandasData.convert_table(df, schema)
+    assert result is not df
+    assert result.dtypes.tolist() == [np.dtype("int32"), np.dtype("float64")]
+
+
+def test_convert_table_plan_is_cached():
+    schema = ibis.schema({"a": "int64", "b": "array<string>"})
+    infer_string = pd.options.future.infer_string
+    plan = PandasData._conversion_plan(schema, infer_string)
+    assert PandasData._conversion_plan(ibis.schema(dict(schema)), infer_string) is plan
+    assert [name for name, *_ in plan.columns] == ["a", "b"]
+
+
+def test_convert_table_with_static_converter():
+    class StaticPandasData(PandasData):
+        @staticmethod
+        def convert_Array(s, dtype, pandas_type):  # noqa: ARG004
+            return s.map(lambda value: [*value, "!"])
+
+    df = pd.DataFrame({"a": np.array([1, 2], dtype="int64"), "b": [["x"], ["y"]]})
+    schema = ibis.schema({"a": "int64", "b": "array<string>"})
+    result = StaticPandasData.convert_table(df, schema)
+    assert result["a"].tolist() == [1, 2]
+    assert result["b"].tolist() == [["x", "!"], ["y", "!"]]
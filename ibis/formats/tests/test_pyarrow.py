@@ -282,3 +282,16 @@ def test_schema___arrow_c_schema__():
     schema = ibis.schema({"a": dt.int64, "b": dt.string, "c": dt.boolean})
     pa_schema = pa.schema(schema)
     assert pa_schema == schema.to_pyarrow()
+
+
+def test_convert_table_only_casts_mismatched_columns():
+    schema = ibis.schema({"a": dt.int64, "b": dt.int32})
+    table = pa.table(
+        {"a": pa.array([1, 2], pa.int64()), "b": pa.array([3, 4], pa.int64())}
+    )
+
+    result = ipa.PyArrowData.convert_table(table, schema)
+    assert result.schema == schema.to_pyarrow()
+    assert result["a"].equals(table["a"])
+
+    assert ipa.PyArrowData.convert_table(result, schema) is result
@@ -9,6 +9,7 @@ import itertools
 import math
 import operator
 import os
+import pickle
 import random
 import string
 
@@ -489,6 +490,28 @@ def test_large_expr_equals(benchmark, tpc_h02):
     benchmark(ir.Expr.equals, tpc_h02, copy.deepcopy(tpc_h02))
 
 
+@pytest.mark.benchmark(group="pickle")
+@pytest.mark.parametrize(
+    "obj_fn",
+    [
+        # pickling the operation pickles the graph recursively, pickling the
+        # expression pickles a node table
+        param(lambda expr: expr.op(), id="node"),
+        param(lambda expr: expr, id="node_table"),
+    ],
+)
+@pytest.mark.parametrize("expr_name", ["tpc_h02", "large_expr"])
+@pytest.mark.parametrize("method", ["dumps", "loads"])
+def test_pickle(benchmark, method, expr_name, obj_fn, request):
+    obj = obj_fn(request.getfixturevalue(expr_name))
+    data = pickle.dumps(obj)
+    benchmark.extra_info["size"] = len(data)
+    if method == "dumps":
+        benchmark(pickle.dumps, obj)
+    else:
+        benchmark(pickle.loads, data)
+
+
 @pytest.mark.benchmark(group="datatype")
 @pytest.mark.parametrize(
     "dtypes",
@@ -672,13 +695,57 @@ def test_snowflake_medium_sized_to_pandas(benchmark):
     benchmark.pedantic(lineitem.to_pandas, rounds=5, iterations=1, warmup_rounds=1)
 
 
-def test_parse_many_duckdb_types(benchmark):
-    from ibis.backends.sql.datatypes import DuckDBType
+def _type_mappers():
+    import ibis.backends.sql.dialects  # noqa: F401
+    from ibis.backends.sql.datatypes import SqlglotType
+    from ibis.util import get_subclasses
+
+    mappers = (m for m in get_subclasses(SqlglotType) if m.dialect is not None)
+    return sorted(mappers, key=lambda mapper: mapper.__name__)
+
+
+def _type_string(mapper, dtype):
+    try:
+        text = mapper.to_string(dtype)
+        mapper.from_string(text)
+    except Exception:  # noqa: BLE001
+        # not supported by, or not round-trippable through, this mapper
+        return None
+    return text
+
+
+def _type_strings(mapper):
+    """Return the type strings a backend would report for common types."""
+    dtypes = (
+        dt.string,
+        dt.int32,
+        dt.float64,
+        dt.int64,
+        dt.Decimal(18, 3),
+        dt.Array(dt.int64),
+    )
+    return [
+        text for dtype in dtypes if (text := _type_string(mapper, dtype)) is not None
+    ]
+
+
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+@pytest.mark.parametrize("mapper", _type_mappers(), ids=lambda m: m.__name__)
+def test_parse_many_types(benchmark, mapper, cached):
+    from ibis.backends.sql.datatypes import _from_string
+
+    types = _type_strings(mapper) * 1000
+    if cached:
+        parse = mapper.from_string
+    else:
+        # call the parser behind the cache, so that every string is parsed
+        parse = functools.partial(
+            _from_string.__wrapped__, mapper, nullable=mapper.default_nullable
+        )
 
     def parse_many(types):
-        list(map(DuckDBType.from_string, types))
+        list(map(parse, types))
 
-    types = ["VARCHAR", "INTEGER", "DOUBLE", "BIGINT"] * 1000
     benchmark(parse_many, types)
 
 
@@ -885,6 +952,14 @@ def test_large_add(benchmark, cols, op):
         benchmark(compile, construct())
 
 
+@pytest.mark.parametrize("n", [1_000, 10_000])
+@pytest.mark.parametrize("dialect", ["duckdb", "postgres", "sqlite"])
+def test_large_isin_compile(benchmark, n, dialect):
+    t = ibis.table(name="t", schema={"x": "int64"})
+    expr = t.filter(t.x.isin(list(range(n))))
+    assert benchmark(ibis.to_sql, expr, dialect=dialect) is not None
+
+
 @pytest.fixture(scope="session")
 def lots_of_tables(tmp_path_factory):
     duckdb = pytest.importorskip("duckdb")
@@ -944,6 +1019,22 @@ def test_bind_on_wide_table(benchmark, wide_table):
     benchmark(select_chain, wide_table)
 
 
+@pytest.mark.parametrize("cols", [10, 100, 1_000])
+def test_long_chain_on_wide_table(benchmark, cols):
+    # every step dereferences columns of the original table, which requires
+    # tracing them through all of the previous steps
+    def chain(t):
+        expr = t
+        for i in range(20):
+            expr = expr.mutate(**{f"b{i}": t.a0 + i})
+            expr = expr.filter(t.a1 > i)
+            expr = expr.select(~s.cols(f"b{i}"))
+        return expr
+
+    t = ibis.table(name="t", schema={f"a{i}": "int" for i in range(cols)})
+    benchmark(chain, t)
+
+
 @pytest.mark.parametrize(
     "method",
     [
@@ -1057,3 +1148,63 @@ def pgtable(data_dir):
 
 def test_postgres_record_batches(pgtable, benchmark):
     benchmark(pgtable.to_pyarrow)
+
+
+NESTED_COLUMNS = {
+    "array_of_structs": "[{'a': i, 'b': i / 7}, {'a': i + 1, 'b': NULL}]",
+    "struct_with_tz_timestamp": (
+        "{'a': i, 't': TIMESTAMPTZ '2000-01-01 00:00:00+00' + to_seconds(i)}"
+    ),
+    "map": "MAP {'a': i, 'b': i + 1}",
+    "tz_timestamp": "TIMESTAMPTZ '2000-01-01 00:00:00+00' + to_seconds(i)",
+}
+
+
+@pytest.mark.parametrize("column", NESTED_COLUMNS.keys())
+def test_pandas_convert_nested(benchmark, column, request):
+    pytest.importorskip("duckdb")
+
+    from ibis.formats.pandas import PandasData
+
+    # only materialize the full sized frame when actually benchmarking
+    N = 10_000 if request.config.getoption("benchmark_disable") else 10_000_000
+
+    con = ibis.duckdb.connect()
+    expr = con.sql(f"SELECT {NESTED_COLUMNS[column]} AS x FROM RANGE({N}) _ (i)")
+    df = expr.to_pyarrow().to_pandas()
+    schema = expr.schema()
+
+    benchmark.pedantic(
+        PandasData.convert_table, args=(df, schema), rounds=3, iterations=1
+    )
+
+
+@pytest.mark.parametrize(
+    "backend", ["sqlite", "mysql", "mssql", "oracle", "singlestoredb"]
+)
+def test_memtable_bulk_register(benchmark, backend, tmp_path, request):
+    pa = pytest.importorskip("pyarrow")
+    np = pytest.importorskip("numpy")
+    TestConf = pytest.importorskip(f"ibis.backends.{backend}.tests.conftest").TestConf
+
+    try:
+        con = TestConf.connect(tmpdir=tmp_path, worker_id="master")
+    except Exception as e:  # noqa: BLE001
+        pytest.skip(f"unable to connect to {backend}: {e}")
+
+    N = 1_000 if request.config.getoption("benchmark_disable") else 1_000_000
+    data = pa.table(
+        {
+            "i": np.arange(N),
+            "f": np.random.default_rng(42).random(N),
+            "s": pa.array(map(str, range(N)), type=pa.string()),
+            "t": np.arange(N).astype("datetime64[s]").astype("datetime64[us]"),
+        }
+    )
+
+    def setup():
+        return (ibis.memtable(data).op(),), {}
+
+    benchmark.pedantic(
+        con._register_in_memory_table, setup=setup, rounds=3, iterations=1
+    )
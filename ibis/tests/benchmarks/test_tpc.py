@@ -0,0 +1,242 @@
+"""Benchmarks for the TPC-H and TPC-DS queries.
+
+Every query defined in `ibis/backends/tests/tpc` is benchmarked in three
+separate phases:
+
+1. expression construction against unbound tables,
+2. compilation to every SQL dialect, and
+3. execution on the local engines.
+
+The TPC-H queries are also built and compiled from a pool of threads, to
+measure how compilation throughput scales with the number of threads.
+
+Data is generated with DuckDB's `tpch` and `tpcds` extensions and cached as
+parquet under the pytest cache directory, or under `IBIS_TPC_DATA_DIR` if set,
+using the same `tpc{suite}/sf={scale_factor}/parquet` layout as the testing
+data. Scale factors are configured with the comma separated
+`IBIS_TPC_SCALE_FACTORS` environment variable.
+
+Run with `just bench-tpc` to save the results as JSON.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import importlib
+import inspect
+import os
+import re
+import shutil
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ibis
+import ibis.common.exceptions as com
+from ibis.backends import _get_backend_names
+from ibis.formats.pyarrow import PyArrowSchema
+
+SCALE_FACTORS = os.environ.get("IBIS_TPC_SCALE_FACTORS", "0.01").split(",")
+ENGINES = ("duckdb", "datafusion", "polars", "sqlite")
+DIALECTS = tuple(name for name in _get_backend_names() if name != "polars")
+THREADS = (1, 2, 4, 8, 16, 32)
+
+
+def tpc_queries():
+    for suite in ("h", "ds"):
+        module = importlib.import_module(
+            f"ibis.backends.tests.tpc.{suite}.test_queries"
+        )
+        for name, test in sorted(vars(module).items()):
+            if (match := re.match(r"^test_(\d\d)$", name)) is not None:
+                number = match.group(1)
+                yield pytest.param(
+                    suite,
+                    # the undecorated query, which returns an expression
+                    test.__wrapped__,
+                    id=f"tpc{suite}-{number}",
+                    marks=getattr(pytest.mark, f"tpc{suite}"),
+                )
+
+
+QUERIES = list(tpc_queries())
+
+
+def generate(suite: str, scale_factor: str, path: Path) -> None:
+    pytest.importorskip("duckdb")
+
+    con = ibis.duckdb.connect()
+    try:
+        con.load_extension(f"tpc{suite}")
+        con.raw_sql(f"CALL {'dbgen' if suite == 'h' else 'dsdgen'}(sf={scale_factor})")
+    except Exception as e:  # noqa: BLE001
+        pytest.skip(f"unable to generate TPC-{suite.upper()} data: {e}")
+
+    # write to a temporary location first so that an interrupted run doesn't
+    # leave behind a partial data set
+    partial = path.with_name(f"{path.name}.partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+    for name in con.list_tables():
+        con.to_parquet(con.table(name), partial / f"{name}.parquet")
+    partial.rename(path)
+
+
+@pytest.fixture(scope="session")
+def tpc_data(request):
+    """Return a function that produces the parquet files for a suite and scale factor."""
+    root = os.environ.get("IBIS_TPC_DATA_DIR")
+    root = Path(root) if root is not None else request.config.cache.mkdir("tpc")
+    # `--benchmark-enable` overrides the `--benchmark-disable` in addopts
+    disabled = request.config.getoption(
+        "benchmark_disable"
+    ) and not request.config.getoption("benchmark_enable")
+
+    @functools.cache
+    def paths(suite: str, scale_factor: str) -> dict[str, Path]:
+        path = root / f"tpc{suite}" / f"sf={scale_factor}" / "parquet"
+        if not path.exists():
+            if disabled:
+                pytest.skip("TPC data is only generated when benchmarks are enabled")
+            generate(suite, scale_factor, path)
+        return {path.stem: path for path in sorted(path.glob("*.parquet"))}
+
+    return paths
+
+
+@pytest.fixture(scope="session")
+def unbound_tables(tpc_data):
+    """Return a function that produces the unbound tables of a suite."""
+
+    @functools.cache
+    def tables(suite: str) -> dict[str, ibis.Table]:
+        return {
+            name: ibis.table(PyArrowSchema.to_ibis(pq.read_schema(path)), name=name)
+            for name, path in tpc_data(suite, min(SCALE_FACTORS, key=float)).items()
+        }
+
+    return tables
+
+
+@pytest.fixture(scope="session")
+def connections(tpc_data):
+    """Return a function that produces an engine connection with a suite loaded."""
+
+    @functools.cache
+    def connect(engine: str, suite: str, scale_factor: str):
+        try:
+            con = getattr(ibis, engine).connect()
+        except ImportError as e:
+            pytest.skip(str(e))
+
+        # load everything into memory so that execution isn't dominated by
+        # engine-specific file scanning
+        for name, path in tpc_data(suite, scale_factor).items():
+            table = pq.read_table(path, partitioning=None)
+            if engine == "sqlite":
+                # sqlite has no decimal type
+                table = table.cast(
+                    pa.schema(
+                        field.with_type(pa.float64())
+                        if pa.types.is_decimal(field.type)
+                        else field
+                        for field in table.schema
+                    )
+                )
+            con.create_table(name, table)
+        return con
+
+    return connect
+
+
+def build(query, tables):
+    return query(**{name: tables[name] for name in inspect.signature(query).parameters})
+
+
+def construct(query, tables):
+    try:
+        return build(query, tables)
+    except (com.IbisError, NotImplementedError) as e:
+        pytest.skip(f"query cannot be expressed: {e}")
+
+
+@pytest.mark.benchmark(group="tpc-construction")
+@pytest.mark.parametrize(("suite", "query"), QUERIES)
+def test_construct(benchmark, suite, query, unbound_tables):
+    tables = unbound_tables(suite)
+    construct(query, tables)
+    benchmark(build, query, tables)
+
+
+@pytest.mark.benchmark(group="tpc-compilation")
+@pytest.mark.parametrize("dialect", DIALECTS)
+@pytest.mark.parametrize(("suite", "query"), QUERIES)
+def test_compile(benchmark, suite, query, dialect, unbound_tables):
+    try:
+        backend = getattr(ibis, dialect)
+    except (AttributeError, ImportError) as e:
+        pytest.skip(str(e))
+
+    expr = construct(query, unbound_tables(suite))
+    try:
+        backend.compile(expr)
+    except ImportError as e:  # delayed imports
+        pytest.skip(str(e))
+    except (com.IbisError, NotImplementedError) as e:
+        pytest.skip(f"{dialect} cannot compile the query: {e}")
+
+    benchmark(backend.compile, expr)
+
+
+@pytest.mark.benchmark(group="tpc-compilation-threads")
+@pytest.mark.parametrize("threads", THREADS)
+def test_compile_threads(benchmark, threads, unbound_tables):
+    """Build and compile the TPC-H queries from `threads` threads at once.
+
+    Every round does the same amount of work regardless of the number of
+    threads, so the time of a round only goes down with more threads if
+    compilation runs in parallel, which requires a free-threaded build of
+    Python.
+    """
+    tables = unbound_tables("h")
+
+    def build_and_compile(query):
+        return ibis.to_sql(build(query, tables), dialect="duckdb")
+
+    queries = []
+    for param in QUERIES:
+        suite, query = param.values
+        if suite == "h":
+            try:
+                build_and_compile(query)
+            except (com.IbisError, NotImplementedError):
+                continue
+            queries.append(query)
+
+    # enough work for every thread to compile at least one query
+    work = queries * -(-max(THREADS) // len(queries))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        benchmark(lambda: list(executor.map(build_and_compile, work)))
+
+
+@pytest.mark.benchmark(group="tpc-execution")
+@pytest.mark.parametrize("scale_factor", SCALE_FACTORS)
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(("suite", "query"), QUERIES)
+def test_execute(benchmark, suite, query, engine, scale_factor, connections):
+    con = connections(engine, suite, scale_factor)
+    tables = {name: con.table(name) for name in con.list_tables()}
+    expr = construct(query, tables)
+
+    # correctness is covered by the TPC test suite, here we only care about
+    # the queries an engine is able to run
+    try:
+        con.execute(expr)
+    except Exception as e:  # noqa: BLE001
+        pytest.skip(f"{engine} cannot execute the query: {e}")
+
+    benchmark(con.execute, expr)
@@ -25,6 +25,10 @@ def table():
         pytest.param(
             lambda t, **kws: t.strings.approx_median(**kws), id="approx_median"
         ),
+        pytest.param(lambda t, **kws: t.strings.hll_sketch(**kws), id="hll_sketch"),
+        pytest.param(
+            lambda t, **kws: t.floats.tdigest_sketch(**kws), id="tdigest_sketch"
+        ),
         pytest.param(lambda t, **kws: t.strings.mode(**kws), id="mode"),
         pytest.param(lambda t, **kws: t.strings.max(**kws), id="max"),
         pytest.param(lambda t, **kws: t.strings.min(**kws), id="min"),
@@ -905,6 +905,17 @@ def test_group_by_count_size(table):
     assert_equal(result2, expected)
 
 
+def test_count_approx(table):
+    expr = table.count(approx=True)
+    assert isinstance(expr, ir.IntegerScalar)
+    assert expr.op() == ops.ApproxCountStar(table)
+
+    # filtered counts are always exact
+    assert table.count(where=table.a > 0, approx=True).op() == ops.CountStar(
+        table, where=table.a > 0
+    )
+
+
 def test_group_by_column_select_api(table):
     grouped = table.group_by("g")
 